@@ -7,6 +7,7 @@
 # except according to those terms.
 """Define base classes for application definitions"""
 
+import copy
 import io
 import os
 import stat
@@ -19,6 +20,7 @@ import time
 from typing import List
 
 import llnl.util.filesystem as fs
+import llnl.util.tty as tty
 import llnl.util.tty.color as color
 from llnl.util.tty.colify import colified
 
@@ -46,7 +48,7 @@ import ramble.util.env
 import ramble.util.directives
 import ramble.util.stats
 import ramble.util.graph
-import ramble.util.class_attributes
+import ramble.util.line_matcher
 from ramble.util.logger import logger
 from ramble.util.shell_utils import source_str
 from ramble.util.naming import NS_SEPARATOR
@@ -96,6 +98,7 @@ class ApplicationBase(metaclass=ApplicationMeta):
     _builtin_required_key = "required"
     _inventory_file_name = "ramble_inventory.json"
     _status_file_name = "ramble_status.json"
+    _analysis_cache_file_name = "ramble_analysis_cache.json"
     _pipelines = [
         "analyze",
         "archive",
@@ -117,8 +120,6 @@ class ApplicationBase(metaclass=ApplicationMeta):
     def __init__(self, file_path):
         super().__init__()
 
-        ramble.util.class_attributes.convert_class_attributes(self)
-
         self.keywords = ramble.keywords.keywords.copy()
 
         self._vars_are_expanded = False
@@ -143,21 +144,14 @@ class ApplicationBase(metaclass=ApplicationMeta):
         self.experiment_tags = []
         self._modifier_instances = []
         self._input_fetchers = None
-        self.results = {}
-        self._phase_times = {}
+        self._results = None
+        self._phase_times_dict = None
         self._pipeline_graphs = None
+        self._phase_functions = None
         self.package_manager = None
         self.custom_executables = {}
 
-        self.hash_inventory = {
-            "application_definition": None,
-            "modifier_definitions": [],
-            "attributes": [],
-            "inputs": [],
-            "software": [],
-            "templates": [],
-            "package_manager": [],
-        }
+        self._hash_inventory = None
         self.experiment_hash = None
 
         self._file_path = file_path
@@ -171,10 +165,55 @@ class ApplicationBase(metaclass=ApplicationMeta):
 
         ramble.util.directives.define_directive_methods(self)
 
-    def copy(self):
-        """Deep copy an application instance"""
+    # Most experiment instances never analyze, time phases, or hash their
+    # contents, so these containers are only allocated on first use.
+    @property
+    def results(self):
+        """Results of analyzing this experiment"""
+        if self._results is None:
+            self._results = {}
+        return self._results
+
+    @results.setter
+    def results(self, results):
+        self._results = results
+
+    @property
+    def _phase_times(self):
+        if self._phase_times_dict is None:
+            self._phase_times_dict = {}
+        return self._phase_times_dict
+
+    @property
+    def hash_inventory(self):
+        """Inventory of the contents hashed into the experiment hash"""
+        if self._hash_inventory is None:
+            self._hash_inventory = {
+                "application_definition": None,
+                "modifier_definitions": [],
+                "attributes": [],
+                "inputs": [],
+                "software": [],
+                "templates": [],
+                "package_manager": [],
+            }
+        return self._hash_inventory
+
+    @hash_inventory.setter
+    def hash_inventory(self, hash_inventory):
+        self._hash_inventory = hash_inventory
+
+    def copy(self, register=True):
+        """Deep copy an application instance
+
+        Args:
+            register (bool): Whether to record the copy in generated_experiments.
+                             Copies of shared prototypes should not be recorded,
+                             so the prototype does not hold every experiment.
+        """
         new_copy = type(self)(self._file_path)
-        self.generated_experiments.append(new_copy)
+        if register:
+            self.generated_experiments.append(new_copy)
 
         if self._env_variable_sets:
             new_copy.set_env_variable_sets(self._env_variable_sets.copy())
@@ -259,12 +298,10 @@ class ApplicationBase(metaclass=ApplicationMeta):
             return
 
         self._pipeline_graphs = {}
+        self._phase_functions = {}
         for pipeline in self._pipelines:
-            if pipeline not in self.phase_definitions:
-                self.phase_definitions[pipeline] = {}
-
             self._pipeline_graphs[pipeline] = ramble.graphs.PhaseGraph(
-                self.phase_definitions[pipeline], self
+                self.phase_definitions.get(pipeline, {}), self
             )
 
             for mod_inst in self._modifier_instances:
@@ -287,6 +324,15 @@ class ApplicationBase(metaclass=ApplicationMeta):
                 for phase, phase_node in self.package_manager.all_pipeline_phases(pipeline):
                     self._pipeline_graphs[pipeline].define_edges(phase_node, internal_order=True)
 
+            # Phase nodes are shared by all instances of a class, and are bound
+            # to the instance which most recently built its graph. Keep this
+            # instance's phase functions, so phases can run in any order
+            # across instances.
+            self._phase_functions[pipeline] = {
+                key: node.attribute
+                for key, node in self._pipeline_graphs[pipeline].node_definitions.items()
+            }
+
     def _long_print(self):
         out_str = ""
         if hasattr(self, "maintainers"):
@@ -614,7 +660,7 @@ class ApplicationBase(metaclass=ApplicationMeta):
         start_time = time.time()
         for mod_inst in self._modifier_instances:
             mod_inst.run_phase_hook(workspace, pipeline, phase)
-        phase_func = phase_node.attribute
+        phase_func = self._phase_functions[pipeline][phase]
         phase_func(workspace, app_inst=self)
         self._phase_times[phase] = time.time() - start_time
 
@@ -632,6 +678,22 @@ class ApplicationBase(metaclass=ApplicationMeta):
                 self._phase_times[phase] = 0.0
             logger.msg(f"  {phase} time: {round(self._phase_times[phase], 5)} (s)")
 
+    def record_phase_times(self, workspace, pipeline):
+        """Store the phase execution times of a pipeline in the state database
+
+        Args:
+            workspace (Workspace): Workspace to store phase times in
+            pipeline (str): Name of pipeline the phases were executed in
+        """
+        state_db = workspace.state_database
+        if state_db is None:
+            return
+
+        namespace = self.expander.experiment_namespace
+        phase_times = dict(state_db.get(namespace, "phase_times") or {})
+        phase_times[pipeline] = dict(self._phase_times)
+        state_db.set(namespace, "phase_times", phase_times)
+
     def create_experiment_chain(self, workspace):
         """Create the necessary chained experiments for this instance
 
@@ -755,7 +817,7 @@ class ApplicationBase(metaclass=ApplicationMeta):
                         self.expander.expand_var_name(self.keywords.experiment_index)
                     )
                     new_inst.repeats = self.repeats
-                    new_inst.read_status()
+                    new_inst.read_status(workspace)
 
                     # Extract inherited variables
                     if namespace.inherit_variables in cur_exp_def:
@@ -1224,6 +1286,47 @@ class ApplicationBase(metaclass=ApplicationMeta):
                 }
         self._input_fetchers = inputs
 
+    def cachable_inputs(self):
+        """Inputs of this experiment which can be stored in the input cache
+
+        Inputs which are already staged in the workspace, as an archive or
+        expanded, are skipped, as get_inputs does not fetch them again.
+
+        Returns:
+            (list): (name, fetcher, mirror_paths) of each input with a checksum
+        """
+        workload_namespace = self.expander.workload_namespace
+
+        self._inputs_and_fetchers(self.expander.workload_name)
+
+        cachable = []
+        for input_file, input_conf in self._input_fetchers.items():
+            fetcher = input_conf["fetcher"]
+            if not fetcher.cachable:
+                continue
+
+            mirror_paths = ramble.mirror.mirror_archive_paths(
+                fetcher, os.path.join(self.name, input_file)
+            )
+
+            input_vars = {self.keywords.input_name: input_conf["input_name"]}
+            input_path = self.expander.expand_var(input_conf["target_dir"], extra_vars=input_vars)
+
+            # Stages set themselves on their fetcher, so use a copy of it
+            stage = ramble.stage.InputStage(
+                copy.copy(fetcher),
+                name=workload_namespace + "." + input_file,
+                path=os.path.dirname(input_path),
+                mirror_paths=mirror_paths,
+                lock=False,
+            )
+            stage.set_subdir(os.path.basename(input_path))
+            if stage.archive_file or stage.expanded:
+                continue
+
+            cachable.append((input_conf["namespace"], fetcher, mirror_paths))
+        return cachable
+
     register_phase("mirror_inputs", pipeline="mirror")
 
     def _mirror_inputs(self, workspace, app_inst=None):
@@ -1397,13 +1500,21 @@ class ApplicationBase(metaclass=ApplicationMeta):
         experiment_run_dir = self.expander.experiment_run_dir
         inventory_file = os.path.join(experiment_run_dir, self._inventory_file_name)
 
-        if os.path.exists(inventory_file) and not force_compute:
+        stored_inventory = None
+        state_db = workspace.state_database
+        if state_db is not None and not force_compute:
+            stored_inventory = state_db.get(self.expander.experiment_namespace, "inventory")
+
+        if stored_inventory is not None:
+            self.hash_inventory = stored_inventory
+
+        elif os.path.exists(inventory_file) and not force_compute:
             with open(inventory_file) as f:
                 self.hash_inventory = spack.util.spack_json.load(f)
 
         else:
             # Clean up variables before hashing
-            vars_to_hash = self.variables.copy()
+            vars_to_hash = dict(self.variables)
             self._clean_hash_variables(workspace, vars_to_hash)
 
             # Build inventory of attributes
@@ -1415,8 +1526,10 @@ class ApplicationBase(metaclass=ApplicationMeta):
                 ("env_vars", self._env_variable_sets),
             ]
 
+            # Definition files are shared by many experiments, so their
+            # digests are reused within this process
             self.hash_inventory["application_definition"] = ramble.util.hashing.hash_file(
-                self._file_path
+                self._file_path, cached=True
             )
 
             added_mods = set()
@@ -1425,7 +1538,9 @@ class ApplicationBase(metaclass=ApplicationMeta):
                     self.hash_inventory["modifier_definitions"].append(
                         {
                             "name": mod_inst.name,
-                            "digest": ramble.util.hashing.hash_file(mod_inst._file_path),
+                            "digest": ramble.util.hashing.hash_file(
+                                mod_inst._file_path, cached=True
+                            ),
                         }
                     )
                     added_mods.add(mod_inst.name)
@@ -1483,6 +1598,10 @@ class ApplicationBase(metaclass=ApplicationMeta):
         with open(inventory_file, "w+") as f:
             spack.util.spack_json.dump(self.hash_inventory, f)
 
+        state_db = workspace.state_database
+        if state_db is not None:
+            state_db.set(self.expander.experiment_namespace, "inventory", self.hash_inventory)
+
     register_phase("archive_experiments", pipeline="archive")
 
     def _archive_experiments(self, workspace, app_inst=None):
@@ -1594,6 +1713,29 @@ class ApplicationBase(metaclass=ApplicationMeta):
 
         files, contexts, foms = self._analysis_dicts(criteria_list)
 
+        # Reuse the previous analysis if neither its inputs nor the logs changed
+        cache_key = None
+        if (
+            workspace.analysis_cache
+            and not workspace.dry_run
+            and self.experiment_hash
+            and self._analysis_cacheable(criteria_list)
+        ):
+            cache_key = self._analysis_cache_key(workspace, criteria_list, files, contexts, foms)
+            cached = self._read_analysis_cache(workspace, cache_key)
+            log_states = self._analysis_log_states(criteria_list, files)
+
+            if cached is not None and cached["logs"] == log_states:
+                logger.debug("Reusing cached analysis results")
+                self.set_status(status=experiment_status[cached["status"]])
+                self.results = cached["results"]
+                workspace.append_result(self.results)
+                return
+
+        # Expanded FOM names, keyed on the FOM and the groups it matched
+        fom_names = {}
+        debug = tty.is_debug()
+
         # Iterate over files. We already know they exist
         for file, file_conf in files.items():
 
@@ -1605,65 +1747,58 @@ class ApplicationBase(metaclass=ApplicationMeta):
                 logger.debug(f"Skipping analysis of non-existent file: {file}")
                 continue
 
-            with open(file) as f:
-                for line in f.readlines():
-                    logger.debug(f"Line: {line}")
+            matcher = self._analysis_matcher(file_conf, criteria_list, contexts, foms)
 
-                    for criteria in file_conf["success_criteria"]:
-                        logger.debug("Looking for criteria %s" % criteria)
-                        criteria_obj = criteria_list.find_criteria(criteria)
-                        if criteria_obj.passed(line, self):
-                            criteria_obj.mark_found()
+            with open(file) as f:
+                for line in f:
+                    if debug:
+                        logger.debug(f"Line: {line}")
 
-                    for context in file_conf["contexts"]:
-                        context_conf = contexts[context]
-                        context_match = context_conf["regex"].match(line)
+                    for match, (kind, name, conf) in matcher.matches(line):
+                        if kind == "criteria":
+                            conf.mark_found()
 
-                        if context_match:
-                            context_name = format_context(context_match, context_conf["format"])
+                        elif kind == "context":
+                            context_name = format_context(match, conf["format"])
                             logger.debug("Line was: %s" % line)
-                            logger.debug(f" Context match {context} -- {context_name}")
+                            logger.debug(f" Context match {name} -- {context_name}")
 
-                            active_contexts[context] = context_name
+                            active_contexts[name] = context_name
 
                             if context_name not in fom_values:
                                 fom_values[context_name] = {}
 
-                    for fom in file_conf["foms"]:
-                        logger.debug(f"  Testing for fom {fom}")
-                        fom_conf = foms[fom]
-                        fom_match = fom_conf["regex"].match(line)
-
-                        if fom_match:
-                            fom_vars = {}
-                            for k, v in fom_match.groupdict().items():
-                                fom_vars[k] = v
-                            fom_name = self.expander.expand_var(fom, extra_vars=fom_vars)
-
-                            if fom_conf["group"] in fom_conf["regex"].groupindex:
-                                logger.debug(" --- Matched fom %s" % fom_name)
-                                fom_contexts = []
-                                if fom_conf["contexts"]:
-                                    for context in fom_conf["contexts"]:
-                                        context_name = (
-                                            active_contexts[context]
-                                            if context in active_contexts
-                                            else _NULL_CONTEXT
-                                        )
-                                        fom_contexts.append(context_name)
-                                else:
-                                    fom_contexts.append(_NULL_CONTEXT)
-
-                                for context in fom_contexts:
-                                    if context not in fom_values:
-                                        fom_values[context] = {}
-                                    fom_val = fom_match.group(fom_conf["group"])
-                                    fom_values[context][fom_name] = {
-                                        "value": fom_val,
-                                        "units": fom_conf["units"],
-                                        "origin": fom_conf["origin"],
-                                        "origin_type": fom_conf["origin_type"],
-                                    }
+                        elif conf["group"] in conf["regex"].groupindex:
+                            fom_vars = match.groupdict()
+                            fom_key = (name, tuple(fom_vars.items()))
+                            fom_name = fom_names.get(fom_key)
+                            if fom_name is None:
+                                fom_name = self.expander.expand_var(name, extra_vars=fom_vars)
+                                fom_names[fom_key] = fom_name
+
+                            logger.debug(" --- Matched fom %s" % fom_name)
+                            fom_contexts = []
+                            if conf["contexts"]:
+                                for context in conf["contexts"]:
+                                    context_name = (
+                                        active_contexts[context]
+                                        if context in active_contexts
+                                        else _NULL_CONTEXT
+                                    )
+                                    fom_contexts.append(context_name)
+                            else:
+                                fom_contexts.append(_NULL_CONTEXT)
+
+                            for context in fom_contexts:
+                                if context not in fom_values:
+                                    fom_values[context] = {}
+                                fom_val = match.group(conf["group"])
+                                fom_values[context][fom_name] = {
+                                    "value": fom_val,
+                                    "units": conf["units"],
+                                    "origin": conf["origin"],
+                                    "origin_type": conf["origin_type"],
+                                }
 
         # Test all non-file based success criteria
         for criteria_obj in criteria_list.all_criteria():
@@ -1706,6 +1841,9 @@ class ApplicationBase(metaclass=ApplicationMeta):
                 else:
                     self.results["CONTEXTS"].append(context_map)
 
+        if cache_key is not None:
+            self._write_analysis_cache(workspace, cache_key, log_states)
+
         workspace.append_result(self.results)
 
     def calculate_statistics(self, workspace):
@@ -1746,8 +1884,8 @@ class ApplicationBase(metaclass=ApplicationMeta):
         # Create a list of all repeats by inserting repeat index
         for n in range(1, self.repeats.n_repeats + 1):
             if (
-                base_exp_name in self.experiment_set.chained_experiments.keys()
-                and base_exp_name not in self.experiment_set.experiments.keys()
+                base_exp_name in self.experiment_set.chained_experiments
+                and base_exp_name not in self.experiment_set.experiments
             ):
                 insert_idx = base_exp_name.find(".chain")
                 repeat_exp_namespace = (
@@ -1766,16 +1904,15 @@ class ApplicationBase(metaclass=ApplicationMeta):
         # If repeat_success_strict is false, statistics will be calculated for all successful
         # experiments
         repeat_success = False
-        exp_success = []
+        repeat_instances = []
         for exp in repeat_experiments.keys():
-            if exp in self.experiment_set.experiments.keys():
-                exp_inst = self.experiment_set.experiments[exp]
-            elif exp in self.experiment_set.chained_experiments.keys():
-                exp_inst = self.experiment_set.chained_experiments[exp]
-            else:
-                continue
+            exp_inst = self.experiment_set.experiments.get(exp)
+            if exp_inst is None:
+                exp_inst = self.experiment_set.chained_experiments.get(exp)
+            if exp_inst is not None:
+                repeat_instances.append(exp_inst)
 
-            exp_success.append(exp_inst.get_status())
+        exp_success = [exp_inst.get_status() for exp_inst in repeat_instances]
 
         if workspace.repeat_success_strict:
             if experiment_status.FAILED.name in exp_success:
@@ -1804,14 +1941,7 @@ class ApplicationBase(metaclass=ApplicationMeta):
             results = []
 
             # Iterate through repeat experiment instances, extract foms, and aggregate them
-            for exp in repeat_experiments.keys():
-                if exp in self.experiment_set.experiments.keys():
-                    exp_inst = self.experiment_set.experiments[exp]
-                elif exp in self.experiment_set.chained_experiments.keys():
-                    exp_inst = self.experiment_set.chained_experiments[exp]
-                else:
-                    continue
-
+            for exp_inst in repeat_instances:
                 # When strict success is off for repeats (loose success), skip failed exps
                 if (
                     not workspace.repeat_success_strict
@@ -1840,7 +1970,19 @@ class ApplicationBase(metaclass=ApplicationMeta):
                                     repeat_foms[context_name][fom_key] = []
                                 repeat_foms[context_name][fom_key].append(float(foms["value"]))
 
-            # Iterate through the aggregated foms, calculate stats, and insert into results
+            # Calculate stats for all aggregated foms at once
+            fom_keys = [
+                (context, fom_key)
+                for context, fom_dict in repeat_foms.items()
+                for fom_key in fom_dict.keys()
+            ]
+            reports = ramble.util.stats.report_all(
+                [repeat_foms[context][fom_key] for context, fom_key in fom_keys],
+                [fom_key[1] for _, fom_key in fom_keys],
+            )
+            fom_reports = dict(zip(fom_keys, reports))
+
+            # Insert the calculated stats into results
             for context, fom_dict in repeat_foms.items():
                 context_map = {
                     "name": context,
@@ -1848,18 +1990,12 @@ class ApplicationBase(metaclass=ApplicationMeta):
                     "display_name": _get_context_display_name(context),
                 }
 
-                for fom_key, fom_values in fom_dict.items():
+                for fom_key in fom_dict.keys():
                     fom_name = fom_key[0]
-                    fom_units = fom_key[1]
                     fom_origin = fom_key[2]
 
-                    calcs = []
-
-                    for statistic in ramble.util.stats.all_stats:
-                        calcs.append(statistic.report(fom_values, fom_units))
-
-                    for calc in calcs:
-                        fom_dict = {
+                    for calc in fom_reports[(context, fom_key)]:
+                        fom_result = {
                             "value": calc[0],
                             "units": calc[1],
                             "origin": fom_origin,
@@ -1867,7 +2003,7 @@ class ApplicationBase(metaclass=ApplicationMeta):
                             "name": fom_name,
                         }
 
-                        context_map["foms"].append(fom_dict)
+                        context_map["foms"].append(fom_result)
 
                 results.append(context_map)
 
@@ -1897,6 +2033,200 @@ class ApplicationBase(metaclass=ApplicationMeta):
 
             self.results["CONTEXTS"] = []
 
+    def _analysis_cache_key(self, workspace, criteria_list, files, contexts, foms):
+        """Compute the key of this experiment's analysis cache
+
+        The key covers everything, except the contents of the log files, which
+        the results of analyzing this experiment depend on.
+
+        Args:
+            workspace (Workspace): Workspace the experiment is analyzed in
+            criteria_list (ScopedCriteriaList): Success criteria to check
+            files (dict): Files to analyze, as returned by _analysis_dicts
+            contexts (dict): Context definitions, as returned by _analysis_dicts
+            foms (dict): Figure of merit definitions, as returned by _analysis_dicts
+
+        Returns:
+            (str): Digest of the analysis inputs
+        """
+        criteria_defs = []
+        for criteria in criteria_list.all_criteria():
+            criteria_defs.append(
+                {
+                    "name": criteria.name,
+                    "mode": criteria.mode,
+                    "match": criteria.match.pattern if criteria.match else None,
+                    "file": self._analysis_criteria_path(criteria),
+                    "fom_name": criteria.fom_name,
+                    "fom_context": criteria.fom_context,
+                    "formula": getattr(criteria, "formula", None),
+                }
+            )
+
+        fom_defs = {}
+        for fom, conf in foms.items():
+            fom_defs[fom] = conf.copy()
+            fom_defs[fom]["regex"] = conf["regex"].pattern
+
+        context_defs = {}
+        for context, conf in contexts.items():
+            context_defs[context] = {"regex": conf["regex"].pattern, "format": conf["format"]}
+
+        return ramble.util.hashing.hash_json(
+            {
+                "ramble_version": ramble.ramble_version,
+                "experiment_hash": self.experiment_hash,
+                "workspace_root": workspace.root,
+                "always_print_foms": workspace.always_print_foms,
+                "tags": self.experiment_tags,
+                "criteria": criteria_defs,
+                "files": files,
+                "foms": fom_defs,
+                "contexts": context_defs,
+            }
+        )
+
+    def _analysis_criteria_path(self, criteria):
+        """Expanded path of the file a success criteria is checked against"""
+        if criteria.file is None:
+            return None
+        return self.expander.expand_var(criteria.file)
+
+    def _analysis_cacheable(self, criteria_list):
+        """Check if the results of analysis can be reused from the analysis cache
+
+        Success functions of applications can depend on anything, rather than
+        only on the inputs covered by the analysis cache key, so experiments
+        checking one are always re-analyzed.
+        """
+        for criteria in criteria_list.all_criteria():
+            if criteria.mode == "application_function":
+                func = getattr(type(self), criteria._success_function, None)
+                if func is not None and func is not ApplicationBase.evaluate_success:
+                    return False
+        return True
+
+    def _analysis_log_states(self, criteria_list, files):
+        """Describe the state of every file analysis depends on
+
+        Files are identified by their size and modification time only, so
+        checking the analysis cache does not read any file.
+
+        Args:
+            criteria_list (ScopedCriteriaList): Success criteria to check
+            files (dict): Files to analyze, as returned by _analysis_dicts
+
+        Returns:
+            (dict): Mapping of file paths to their size and modification time.
+                    Missing files map to None.
+        """
+        paths = list(files.keys())
+        for criteria in criteria_list.all_criteria():
+            path = self._analysis_criteria_path(criteria)
+            if path is not None and path not in files:
+                paths.append(path)
+
+        log_states = {}
+        for path in paths:
+            try:
+                stat_result = os.stat(path)
+            except OSError:
+                log_states[path] = None
+                continue
+
+            log_states[path] = {"size": stat_result.st_size, "mtime": stat_result.st_mtime_ns}
+
+        return log_states
+
+    def _read_analysis_cache(self, workspace, cache_key):
+        """Read this experiment's analysis cache, if it matches cache_key
+
+        The cache is read from the workspace state database when it is
+        enabled, and from the experiment run directory otherwise.
+
+        Returns:
+            (dict): The analysis cache, or None if it is missing or stale
+        """
+        state_db = workspace.state_database
+        if state_db is not None:
+            cached = state_db.get(self.expander.experiment_namespace, "analysis")
+        else:
+            cache_path = os.path.join(
+                self.expander.experiment_run_dir, self._analysis_cache_file_name
+            )
+
+            if not os.path.isfile(cache_path):
+                return None
+
+            try:
+                with open(cache_path) as f:
+                    cached = spack.util.spack_json.load(f)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Ignoring unreadable analysis cache {cache_path}: {e}")
+                return None
+
+        if not isinstance(cached, dict) or cached.get("key") != cache_key:
+            return None
+        return cached
+
+    def _write_analysis_cache(self, workspace, cache_key, log_states):
+        """Write this experiment's analysis cache
+
+        Args:
+            workspace (Workspace): Workspace the experiment is analyzed in
+            cache_key (str): Key of the analysis, from _analysis_cache_key
+            log_states (dict): State of the analyzed files, from _analysis_log_states
+        """
+        exp_dir = self.expander.experiment_run_dir
+        if not os.path.isdir(exp_dir):
+            return
+
+        cache_data = {
+            "key": cache_key,
+            "logs": log_states,
+            "status": self.get_status(),
+            "results": self.results,
+        }
+
+        state_db = workspace.state_database
+        if state_db is not None:
+            state_db.set(self.expander.experiment_namespace, "analysis", cache_data)
+            return
+
+        with open(os.path.join(exp_dir, self._analysis_cache_file_name), "w+") as f:
+            spack.util.spack_json.dump(cache_data, f)
+
+    def _analysis_matcher(self, file_conf, criteria_list, contexts, foms):
+        """Build a LineMatcher for all patterns to extract from a single file
+
+        Success criteria are matched first, then contexts, then figures of
+        merit, so contexts defined on a line apply to figures of merit on the
+        same line. Each entry's payload is a tuple of (kind, name, conf).
+
+        Args:
+            file_conf (dict): File dictionary, as created by _new_file_dict
+            criteria_list (ScopedCriteriaList): Success criteria of this experiment
+            contexts (dict): Context definitions, as returned by _analysis_dicts
+            foms (dict): Figure of merit definitions, as returned by _analysis_dicts
+
+        Returns:
+            (LineMatcher): Matcher for all patterns of the file
+        """
+        entries = []
+        for criteria in file_conf["success_criteria"]:
+            criteria_obj = criteria_list.find_criteria(criteria)
+            entries.append((criteria_obj.match, ("criteria", criteria, criteria_obj)))
+
+        for context in dict.fromkeys(file_conf["contexts"]):
+            context_conf = contexts[context]
+            entries.append((context_conf["regex"], ("context", context, context_conf)))
+
+        for fom in file_conf["foms"]:
+            fom_conf = foms[fom]
+            entries.append((fom_conf["regex"], ("fom", fom, fom_conf)))
+
+        return ramble.util.line_matcher.LineMatcher(entries)
+
     def _new_file_dict(self):
         """Create a dictionary to represent a new log file"""
         return {"success_criteria": [], "contexts": [], "foms": []}
@@ -2022,13 +2352,23 @@ class ApplicationBase(metaclass=ApplicationMeta):
 
         return files, contexts, foms
 
-    def read_status(self):
+    def read_status(self, workspace=None):
         """Read status from an experiment's status file, if possible.
 
-        Set this experiment's status based on the status file in the experiment
-        run directory, if it exists. If it doesn't exist, set its status to
-        experiment_status.UNKNOWN
+        Set this experiment's status based on the workspace state database
+        (when enabled), or the status file in the experiment run directory, if
+        it exists. If neither exist, set its status to experiment_status.UNKNOWN
+
+        Args:
+            workspace (Workspace): Workspace to read the state database of
         """
+        state_db = workspace.state_database if workspace is not None else None
+        if state_db is not None:
+            status = state_db.get(self.expander.experiment_namespace, "status")
+            if status is not None:
+                self.variables[self.keywords.experiment_status] = status
+                return
+
         status_path = os.path.join(
             self.expander.expand_var_name(self.keywords.experiment_run_dir), self._status_file_name
         )
@@ -2050,6 +2390,11 @@ class ApplicationBase(metaclass=ApplicationMeta):
         """Get the status of this experiment"""
         return self.variables[self.keywords.experiment_status]
 
+    def update_status(self, workspace, status):
+        """Set the status of this experiment, and write it to its status file"""
+        self.set_status(status=status)
+        self._write_status(workspace)
+
     register_phase("write_status", pipeline="analyze", run_after=["analyze_experiments"])
     register_phase("write_status", pipeline="setup", run_after=["make_experiments"])
 
@@ -2069,6 +2414,14 @@ class ApplicationBase(metaclass=ApplicationMeta):
             with open(status_path, "w+") as f:
                 spack.util.spack_json.dump(status_data, f)
 
+            state_db = workspace.state_database
+            if state_db is not None:
+                state_db.set(
+                    self.expander.experiment_namespace,
+                    "status",
+                    status_data[self.keywords.experiment_status],
+                )
+
     register_phase("deploy_artifacts", pipeline="pushdeployment")
 
     def _deploy_artifacts(self, workspace, app_inst=None):
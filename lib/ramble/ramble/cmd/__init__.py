@@ -7,10 +7,10 @@
 # except according to those terms.
 
 
+import ast
 import os
 import re
 import argparse
-import ruamel.yaml as yaml
 
 from llnl.util.lang import attr_setdefault
 from llnl.util.filesystem import join_path
@@ -18,14 +18,10 @@ from llnl.util.filesystem import join_path
 import ramble.config
 import ramble.error
 import ramble.paths
-import ramble.workspace
 from ramble.util.logger import logger
 
-import spack.extensions
 import spack.util.string
 
-from ruamel.yaml.error import MarkedYAMLError
-
 # cmd has a submodule called "list" so preserve the python list module
 python_list = list
 
@@ -89,6 +85,58 @@ def all_commands():
     return _all_commands
 
 
+#: global, cached properties of commands -- access through command_properties()
+_command_properties = {}
+
+
+def command_properties(cmd_name, properties):
+    """Get properties of a command, like its description, without importing it.
+
+    Properties assigned a literal value at the top level of a built-in
+    command's module are read from its source. Other properties, and the
+    properties of commands from extensions, are read from the imported module.
+
+    Args:
+        cmd_name (str): name of the command (contains ``-``, not ``_``).
+        properties (list): names of the properties to get
+
+    Returns:
+        (dict): mapping of property name to value, for each property the
+            command defines
+    """
+    require_cmd_name(cmd_name)
+
+    if cmd_name not in _command_properties:
+        literals = {}
+        path = os.path.join(ramble.paths.command_path, f"{python_name(cmd_name)}.py")
+        if os.path.isfile(path):
+            with open(path) as f:
+                tree = ast.parse(f.read(), filename=path)
+            for node in tree.body:
+                if isinstance(node, ast.Assign):
+                    try:
+                        value = ast.literal_eval(node.value)
+                    except ValueError:
+                        continue
+                    for target in node.targets:
+                        if isinstance(target, ast.Name):
+                            literals[target.id] = value
+        _command_properties[cmd_name] = literals
+
+    literals = _command_properties[cmd_name]
+    result = {}
+    module = None
+    for prop in properties:
+        if prop in literals:
+            result[prop] = literals[prop]
+            continue
+        if module is None:
+            module = get_module(cmd_name)
+        if hasattr(module, prop):
+            result[prop] = getattr(module, prop)
+    return result
+
+
 def remove_options(parser, *options):
     """Remove some options from a parser."""
     for option in options:
@@ -169,6 +217,9 @@ def ramble_is_git_repo():
 
 
 def is_git_repo(path):
+    import ruamel.yaml as yaml
+    from ruamel.yaml.error import MarkedYAMLError
+
     dotgit_path = join_path(path, ".git")
     if os.path.isdir(dotgit_path):
         # we are in a regular git repo
@@ -224,6 +275,8 @@ def require_active_workspace(cmd_name):
     Returns:
         (ramble.workspace.Workspace): the active workspace
     """
+    import ramble.workspace
+
     ws = ramble.workspace.active_workspace()
 
     if ws:
@@ -253,6 +306,7 @@ def find_workspace(args):
     Returns:
         (ramble.workspace.Workspace): a found workspace, or ``None``
     """
+    import ramble.workspace
 
     # treat workspace as a name
     ws = args.workspace
@@ -301,6 +355,7 @@ def find_workspace_path(args):
     Returns:
         (string): Path to workspace root, or None
     """
+    import ramble.workspace
 
     # treat workspace as a name
     ws = args.workspace
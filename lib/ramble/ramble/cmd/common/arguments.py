@@ -160,6 +160,20 @@ def filter_tags():
     )
 
 
+@arg
+def jobs():
+    return Args(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        help="number of experiments to process concurrently. Phases which use resources "
+        "shared between experiments (such as software environments) are still serialized",
+        required=False,
+    )
+
+
 @arg
 def no_checksum():
     return Args(
@@ -300,7 +300,13 @@ def print_info(args):
 
     object_type = ramble.repository.ObjectTypes[args.type]
     obj_name = args.object
-    obj = ramble.repository.get(obj_name, object_type=object_type)
+
+    # Only verbose output needs the full attribute values, everything else can
+    # be printed from the metadata index without importing the object
+    if args.verbose:
+        obj = ramble.repository.get(obj_name, object_type=object_type)
+    else:
+        obj = ramble.repository.object_metadata(obj_name, object_type=object_type)
 
     print_object_header(object_type, obj)
 
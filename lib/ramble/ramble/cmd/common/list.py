@@ -60,7 +60,7 @@ def filter_by_name(objs, args, object_type):
                 if f.match(p):
                     return True
 
-                obj = ramble.repository.get(p, object_type=object_type)
+                obj = ramble.repository.object_metadata(p, object_type=object_type)
                 if obj.__doc__:
                     return f.match(obj.__doc__)
                 return False
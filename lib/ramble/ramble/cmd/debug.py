@@ -7,9 +7,12 @@
 # except according to those terms.
 
 
+import argparse
 import os
 import platform
 import re
+import sys
+import time
 from datetime import datetime
 
 from llnl.util.filesystem import working_dir
@@ -19,7 +22,7 @@ import ramble.paths
 from ramble.main import get_version
 
 import spack.platforms
-from spack.util.executable import which
+from spack.util.executable import Executable, which
 
 description = "debugging commands for troubleshooting Ramble"
 section = "developer"
@@ -30,6 +33,23 @@ def setup_parser(subparser):
     sp = subparser.add_subparsers(metavar="SUBCOMMAND", dest="debug_command")
     sp.add_parser("report", help="print information useful for bug reports")
 
+    startup_profile = sp.add_parser(
+        "startup-profile", help="time the startup of a ramble command and the imports it makes"
+    )
+    startup_profile.add_argument(
+        "-n",
+        "--num-modules",
+        type=int,
+        default=20,
+        help="number of modules with the longest import times to print (default: 20)",
+    )
+    startup_profile.add_argument(
+        "ramble_args",
+        nargs=argparse.REMAINDER,
+        help="arguments of the ramble command to profile, after -- if they begin with an "
+        "option (default: --version)",
+    )
+
 
 def _debug_tarball_suffix():
     now = datetime.now()
@@ -66,8 +86,62 @@ def report(args):
     print("* **Platform:**", architecture)
 
 
+_import_time_regex = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+
+def parse_import_times(lines):
+    """Parse the output of ``python -X importtime``
+
+    Args:
+        lines (list(str)): lines written to stderr by the interpreter
+
+    Returns:
+        (list(tuple)): (module, self time, cumulative time) for each imported
+            module, with times in microseconds
+    """
+    import_times = []
+    for line in lines:
+        match = _import_time_regex.match(line)
+        if match:
+            import_times.append((match.group(4), int(match.group(1)), int(match.group(2))))
+    return import_times
+
+
+def startup_profile(args):
+    ramble_args = args.ramble_args
+    # Options of ramble itself, like --version, follow a "--" separator
+    if ramble_args and ramble_args[0] == "--":
+        ramble_args = ramble_args[1:]
+    if not ramble_args:
+        ramble_args = ["--version"]
+
+    python = Executable(sys.executable)
+    python.add_default_arg("-X")
+    python.add_default_arg("importtime")
+
+    start = time.time()
+    stderr = python(
+        ramble.paths.ramble_script, *ramble_args, output=os.devnull, error=str, fail_on_error=False
+    )
+    elapsed = time.time() - start
+
+    import_times = parse_import_times(stderr.splitlines())
+    import_times.sort(key=lambda entry: entry[2], reverse=True)
+    total_self = sum(entry[1] for entry in import_times)
+
+    print(f"Command: ramble {' '.join(ramble_args)}")
+    print(f"Exit code: {python.returncode}")
+    print(f"Wall time: {elapsed:.3f} s")
+    print(f"Import time: {total_self / 1e6:.3f} s ({len(import_times)} modules)")
+    print()
+    print(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+    for module, self_time, cumulative in import_times[: args.num_modules]:
+        print(f"{cumulative / 1e3:16.1f} {self_time / 1e3:10.1f}  {module}")
+
+
 def debug(parser, args):
     action = {
         "report": report,
+        "startup-profile": startup_profile,
     }
     action[args.debug_command](args)
@@ -10,6 +10,8 @@ import ramble.workspace
 import ramble.expander
 import ramble.pipeline
 import ramble.filters
+import ramble.util.submission
+from ramble.util.logger import logger
 
 import ramble.cmd.common.arguments as arguments
 
@@ -42,6 +44,57 @@ def setup_parser(subparser):
         help="Disable the logger header.",
     )
 
+    subparser.add_argument(
+        "--bulk",
+        choices=ramble.util.submission.bulk_modes,
+        dest="bulk",
+        default=None,
+        help="group experiments whose executors only differ by their execute_experiment "
+        "script into one submission. `manifest` submits one job running all of the "
+        "group's scripts, `array` submits an array job running one script per task",
+    )
+
+    subparser.add_argument(
+        "--submit-jobs",
+        type=int,
+        default=1,
+        dest="submit_jobs",
+        help="number of submissions to run concurrently",
+    )
+
+    subparser.add_argument(
+        "--submit-rate",
+        type=float,
+        default=0,
+        dest="submit_rate",
+        help="maximum number of submissions to start per second (0 for unlimited)",
+    )
+
+    subparser.add_argument(
+        "--job-id-regex",
+        default=None,
+        dest="job_id_regex",
+        help="regular expression extracting the job ID from the output of a submission. "
+        "Job IDs are only recorded when this or --bulk is given (default with --bulk: "
+        f"'{ramble.util.submission.default_job_id_regex}')",
+    )
+
+    subparser.add_argument(
+        "--local",
+        action="store_true",
+        dest="local",
+        help="run each experiment's execute_experiment script on this machine instead of "
+        "using the executor, packing experiments against the available cores",
+    )
+
+    subparser.add_argument(
+        "--local-cores",
+        type=int,
+        default=None,
+        dest="local_cores",
+        help="number of cores available to --local runs (default: all available cores)",
+    )
+
     arguments.add_common_arguments(subparser, ["where", "exclude_where", "filter_tags"])
 
 
@@ -58,6 +111,17 @@ def ramble_on(args):
         tags=args.filter_tags,
     )
 
+    if args.submit_jobs < 1:
+        logger.die(f"The number of submission jobs must be at least 1, got {args.submit_jobs}")
+
+    if args.local and (args.bulk or args.executor):
+        logger.die(
+            "--local runs experiments directly, and cannot be used with --bulk or --executor"
+        )
+
+    if args.local_cores is not None and args.local_cores < 1:
+        logger.die(f"The number of local cores must be at least 1, got {args.local_cores}")
+
     suppress_per_experiment_prints = not args.per_experiment_prints_on
     suppress_run_header = args.run_header_off
 
@@ -68,6 +132,12 @@ def ramble_on(args):
         executor=executor,
         suppress_per_experiment_prints=suppress_per_experiment_prints,
         suppress_run_header=suppress_run_header,
+        bulk=args.bulk,
+        submit_jobs=args.submit_jobs,
+        submit_rate=args.submit_rate,
+        job_id_regex=args.job_id_regex,
+        local=args.local,
+        local_cores=args.local_cores,
     )
 
     with ws.write_transaction():
@@ -32,6 +32,7 @@ import ramble.filters
 import ramble.experimental.uploader
 import ramble.software_environments
 import ramble.util.colors as rucolor
+import ramble.util.results_writers
 from ramble.util.logger import logger
 
 
@@ -430,6 +431,12 @@ def workspace_concretize(args):
 
 
 def workspace_run_pipeline(args, pipeline):
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None:
+        if jobs < 1:
+            logger.die(f"The number of jobs must be at least 1, got {jobs}")
+        pipeline.jobs = jobs
+
     include_phase_dependencies = getattr(args, "include_phase_dependencies", None)
     if include_phase_dependencies:
         with ramble.config.override("config:include_phase_dependencies", True):
@@ -451,7 +458,14 @@ def workspace_setup_setup_parser(subparser):
 
     arguments.add_common_arguments(
         subparser,
-        ["phases", "include_phase_dependencies", "where", "exclude_where", "filter_tags"],
+        [
+            "phases",
+            "include_phase_dependencies",
+            "where",
+            "exclude_where",
+            "filter_tags",
+            "jobs",
+        ],
     )
 
 
@@ -486,7 +500,8 @@ def workspace_analyze_setup_parser(subparser):
         dest="output_formats",
         nargs="+",
         default=["text"],
-        help="list of output formats to write." + "Supported formats are json, yaml, or text",
+        help="list of output formats to write. Supported formats are "
+        + ", ".join(ramble.util.results_writers.output_formats),
         required=False,
     )
 
@@ -507,6 +522,14 @@ def workspace_analyze_setup_parser(subparser):
         required=False,
     )
 
+    subparser.add_argument(
+        "--no-cache",
+        dest="analysis_cache",
+        action="store_false",
+        help="re-analyze all experiments, instead of reusing the results of unchanged ones",
+        required=False,
+    )
+
     subparser.add_argument(
         "--dry-run",
         dest="dry_run",
@@ -525,7 +548,14 @@ def workspace_analyze_setup_parser(subparser):
 
     arguments.add_common_arguments(
         subparser,
-        ["phases", "include_phase_dependencies", "where", "exclude_where", "filter_tags"],
+        [
+            "phases",
+            "include_phase_dependencies",
+            "where",
+            "exclude_where",
+            "filter_tags",
+            "jobs",
+        ],
     )
 
 
@@ -533,6 +563,7 @@ def workspace_analyze(args):
     current_pipeline = ramble.pipeline.pipelines.analyze
     ws = ramble.cmd.require_active_workspace(cmd_name="workspace analyze")
     ws.always_print_foms = args.always_print_foms
+    ws.analysis_cache = args.analysis_cache
     ws.repeat_success_strict = ramble.config.get("config:repeat_success_strict")
 
     if args.dry_run:
@@ -908,7 +939,7 @@ def workspace_archive_setup_parser(subparser):
     )
 
     arguments.add_common_arguments(
-        subparser, ["phases", "include_phase_dependencies", "where", "exclude_where"]
+        subparser, ["phases", "include_phase_dependencies", "where", "exclude_where", "jobs"]
     )
 
 
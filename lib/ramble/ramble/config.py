@@ -34,9 +34,12 @@ import collections
 import contextlib
 import copy
 import functools
+import hashlib
 import os
+import pickle
 import re
 import sys
+import tempfile
 from contextlib import contextmanager
 
 import ruamel.yaml as yaml
@@ -46,6 +49,7 @@ import llnl.util.lang
 from llnl.util.filesystem import mkdirp, rename
 
 import spack.compilers
+import ramble
 import ramble.paths
 import spack.platforms
 
@@ -72,6 +76,7 @@ import ramble.schema.package_manager_repos
 import ramble.schema.base_application_repos
 import ramble.schema.base_modifier_repos
 import ramble.schema.base_package_manager_repos
+import ramble.util.hashing
 
 from ramble.error import RambleError
 from ramble.util.logger import logger
@@ -173,10 +178,11 @@ class ConfigScope:
     Each file is a config "section" (e.g., mirrors, compilers, etc).
     """
 
-    def __init__(self, name, path):
+    def __init__(self, name, path, cache=None):
         self.name = name  # scope name.
         self.path = path  # path to directory containing configs.
         self.sections = syaml.syaml_dict()  # sections read from config files.
+        self.cache = cache  # optional ConfigCache to read config files through.
 
     @property
     def is_platform_dependent(self):
@@ -190,7 +196,7 @@ class ConfigScope:
         if section not in self.sections:
             path = self.get_section_filename(section)
             schema = section_schemas[section]
-            data = read_config_file(path, schema)
+            data = read_config_file(path, schema, cache=self.cache)
             self.sections[section] = data
         return self.sections[section]
 
@@ -220,7 +226,7 @@ class ConfigScope:
 class SingleFileScope(ConfigScope):
     """This class represents a configuration scope in a single YAML file."""
 
-    def __init__(self, name, path, schema, yaml_path=None):
+    def __init__(self, name, path, schema, yaml_path=None, cache=None):
         """Similar to ``ConfigScope`` but can be embedded in another schema.
 
         Arguments:
@@ -236,8 +242,10 @@ class SingleFileScope(ConfigScope):
                      inner:
                        config:
                          install_tree: $ramble/opt/ramble
+
+            cache (ConfigCache): optional cache to read the file through
         """
-        super().__init__(name, path)
+        super().__init__(name, path, cache=cache)
         self._raw_data = None
         self.schema = schema
         self.yaml_path = yaml_path or []
@@ -279,7 +287,7 @@ class SingleFileScope(ConfigScope):
         # This bit ensures we have read the file and have
         # the raw data in memory
         if self._raw_data is None:
-            self._raw_data = read_config_file(self.path, self.schema)
+            self._raw_data = read_config_file(self.path, self.schema, cache=self.cache)
             if self._raw_data is None:
                 return None
 
@@ -998,11 +1006,98 @@ def validate(data, schema, filename=None):
     return test_data
 
 
-def read_config_file(filename, schema=None):
+#: Version of the data stored in configuration caches. Entries written with
+#: any other version are ignored.
+config_cache_format = 1
+
+
+class ConfigCache:
+    """Cache of configuration files which have been parsed and validated.
+
+    The YAML data read from a file, and the validated copy of it, are pickled
+    into the cache's directory. The cached data are used in place of parsing
+    and validating the file again only if the file's contents, the schema it
+    is validated against, and the version of Ramble are all unchanged.
+    """
+
+    #: Hashes of schemas, by their id. Schemas are kept so their ids are not reused.
+    _schema_hashes = {}
+
+    def __init__(self, root):
+        self.root = root
+
+    def _entry_path(self, filename):
+        name = hashlib.sha256(os.path.abspath(filename).encode("utf-8")).hexdigest()
+        return os.path.join(self.root, f"{name}.pickle")
+
+    @classmethod
+    def _schema_hash(cls, schema):
+        if id(schema) not in cls._schema_hashes:
+            # Schemas may hold values which are not JSON serializable, like enums
+            cls._schema_hashes[id(schema)] = (
+                schema,
+                ramble.util.hashing.hash_string(repr(schema)),
+            )
+        return cls._schema_hashes[id(schema)][1]
+
+    def read(self, filename, schema):
+        """Read and validate a configuration file, using cached data if possible.
+
+        Arguments:
+            filename (str): path of the YAML file to read
+            schema (dict): jsonschema to validate the file's data against
+
+        Returns:
+            (tuple): the data read from the file, and the validated copy of
+                them. The validated copy is None if the file is empty.
+        """
+        key = (
+            config_cache_format,
+            ramble.ramble_version,
+            self._schema_hash(schema),
+            ramble.util.hashing.hash_file(filename),
+        )
+
+        entry_path = self._entry_path(filename)
+        try:
+            with open(entry_path, "rb") as f:
+                if pickle.load(f) == key:
+                    logger.debug(f"Read cached config for {filename}")
+                    return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable config cache {entry_path}: {str(e)}")
+
+        with open(filename) as f:
+            data = syaml.load_config(f)
+        validated = validate(data, schema, filename) if data else None
+
+        # Write to a temporary file first, so readers never see a partial entry
+        tmp_path = None
+        try:
+            mkdirp(self.root)
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump((data, validated), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except Exception as e:
+            logger.debug(f"Unable to cache config for {filename}: {str(e)}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return data, validated
+
+
+def read_config_file(filename, schema=None, cache=None):
     """Read a YAML configuration file.
 
     User can provide a schema for validation. If no schema is provided,
-    we will infer the schema from the top-level key."""
+    we will infer the schema from the top-level key.
+
+    If a ConfigCache is provided, along with a schema, the file is read
+    through it."""
     # Dev: Inferring schema and allowing it to be provided directly allows us
     # to preserve flexibility in calling convention (don't need to provide
     # schema when it's not necessary) while allowing us to validate against a
@@ -1020,6 +1115,10 @@ def read_config_file(filename, schema=None):
 
     try:
         logger.debug(f"Reading config file {filename}")
+        if cache is not None and schema:
+            data, _ = cache.read(filename, schema)
+            return data
+
         with open(filename) as f:
             data = syaml.load_config(f)
 
@@ -8,9 +8,14 @@
 
 import string
 import ast
+import collections
+import contextlib
+import functools
 import operator
 import math
 import random
+import sys
+import threading
 
 from typing import Dict
 
@@ -67,6 +72,9 @@ supported_list_function_pointers = {
     "range": range,
 }
 
+# Functions whose results can differ between evaluations of the same input
+nondeterministic_functions = {"randrange", "randint"}
+
 
 formatter = string.Formatter()
 
@@ -86,9 +94,22 @@ class VformatDelimiter:
     right = "}"
 
 
+def _split_keyword(contents):
+    """Split the contents of a keyword into its name and format spec
+
+    The variable name is interned, as it is kept as a key in the variable
+    caches of every experiment expanding it.
+    """
+    kw_parts = contents[1:-1].split(":")
+    kw_parts[0] = sys.intern(kw_parts[0])
+    return tuple(kw_parts)
+
+
 class ExpansionNode:
     """Class representing a node in a ramble expansion graph"""
 
+    __slots__ = ("left", "right", "children", "idx", "contents", "value", "root")
+
     def __init__(self, left_idx, right_idx):
         self.left = left_idx
         self.right = right_idx
@@ -130,114 +151,6 @@ class ExpansionNode:
         else:
             self.children.append(children)
 
-    def define_value(
-        self,
-        expansion_dict,
-        allow_passthrough=True,
-        expansion_func=str,
-        evaluation_func=eval,
-        no_expand_vars=set(),
-        used_vars=set(),
-    ):
-        """Define the value for this node.
-
-        Construct the value of self. This builds up a string representation of
-        self, and performs evaluation and formatting of the resulting string.
-        This includes extracting the values of the children nodes, and
-        replacing their values in the proper positions in self's string.
-
-        Stores the resulting value in self.value
-
-        Args:
-            expansion_dict (dict): variable definitions to use for expanding
-            detected matches
-            allow_passthrough (bool): if true, expansion is allowed to fail. if
-            false, failed expansion raises an error.
-            expansion_func (func): function to use for expansion of nested
-            variable definitions
-            evaluation_func (func): function to use for evaluating math of strings
-            no_expand_vars (set): set of variable names that should never be expanded
-        """
-        if self.contents is not None:
-            parts = []
-            last_idx = 0
-            for child in self.children:
-                child_indices = child.relative_indices(self)
-                parts.append(self.contents[last_idx : child_indices[0]])
-                parts.append(str(child.value))
-                last_idx = child_indices[1] + 1
-
-            if last_idx != len(self.contents):
-                parts.append(self.contents[last_idx:])
-
-            if self != self.root:
-                replaced_contents = "".join(parts)
-
-                # Special case '{}'
-                if len(replaced_contents) == 2:
-                    self.value = "{}"
-                    return
-
-                format_kw = replaced_contents[1:-1]
-                kw_parts = format_kw.split(":")
-                required_passthrough = False
-
-                if kw_parts[0] in expansion_dict:
-                    used_vars.add(kw_parts[0])
-                    # Exit expansion for variables defined as no_expand
-                    if kw_parts[0] in no_expand_vars:
-                        self.value = expansion_dict[kw_parts[0]]
-                        return
-                    else:
-                        self.value = expansion_func(
-                            expansion_dict,
-                            expansion_dict[kw_parts[0]],
-                            allow_passthrough=allow_passthrough,
-                        )
-                else:
-                    self.value = kw_parts[0]
-                    required_passthrough = True
-
-                # Evaluation should go here
-                try:
-                    old_value = self.value
-                    self.value = evaluation_func(self.value)
-                    if old_value != self.value:
-                        required_passthrough = False
-                except SyntaxError:
-                    pass
-
-                # If we had a format spec, add it
-                if len(kw_parts) > 1:
-                    kw_dict = {"value": self.value}
-                    format_str = f"value:{kw_parts[1]}"
-                    try:
-                        self.value = formatter.vformat(
-                            VformatDelimiter.left + format_str + VformatDelimiter.right,
-                            [],
-                            kw_dict,
-                        )
-                        required_passthrough = False
-                    except ValueError:
-                        self.value += f":{kw_parts[1]}"
-                    except KeyError:
-                        self.value += f":{kw_parts[1]}"
-
-                if required_passthrough:
-                    self.value = f"{{{self.value}}}"
-                    if not allow_passthrough:
-                        raise_passthrough_error(self.contents, self.value)
-            else:
-                replaced_contents = "".join(parts)
-                try:
-                    self.value = evaluation_func(replaced_contents)
-                except SyntaxError:
-                    self.value = replaced_contents
-
-                # Replace escaped curly braces with curly braces
-                if isinstance(self.value, str):
-                    self.value = self.value.replace("\\{", "{").replace("\\}", "}")
-
 
 class ExpansionGraph:
     """Class representing a graph of ExpansionNodes"""
@@ -305,6 +218,204 @@ class ExpansionGraph:
         return "\n".join(lines)
 
 
+class ExpansionTemplate:
+    """Class representing a compiled expansion string
+
+    Templates are built once from the nodes of an ExpansionGraph, and are not
+    modified afterwards. Each template holds its parts in order, where a part
+    is either a literal string or a nested ExpansionTemplate for a brace
+    delimited expansion. This allows the same template to be evaluated
+    against many different variable definitions without re-parsing the
+    input string.
+    """
+
+    __slots__ = ("contents", "parts", "is_root", "_kw_parts")
+
+    def __init__(self, node):
+        self.contents = node.contents
+        self.is_root = node is node.root
+
+        parts = []
+        last_idx = 0
+        for child in node.children:
+            child_indices = child.relative_indices(node)
+            if child_indices[0] > last_idx:
+                parts.append(node.contents[last_idx : child_indices[0]])
+            parts.append(ExpansionTemplate(child))
+            last_idx = child_indices[1] + 1
+
+        if last_idx != len(node.contents):
+            parts.append(node.contents[last_idx:])
+
+        self.parts = tuple(parts)
+
+        # Templates without nested expansions always look up the same keyword
+        self._kw_parts = None
+        if not self.is_root and not node.children and len(self.contents) > 2:
+            self._kw_parts = _split_keyword(self.contents)
+
+    def evaluate(
+        self,
+        expansion_dict,
+        allow_passthrough=True,
+        expansion_func=str,
+        evaluation_func=eval,
+        no_expand_vars=set(),
+        used_vars=set(),
+        dependency_func=None,
+    ):
+        """Evaluate this template against a set of variable definitions.
+
+        Construct the value of self. This builds up a string representation of
+        self, and performs evaluation and formatting of the resulting string.
+        This includes evaluating the nested templates, and replacing their
+        values in the proper positions in self's string.
+
+        Args:
+            expansion_dict (dict): variable definitions to use for expanding
+            detected matches
+            allow_passthrough (bool): if true, expansion is allowed to fail. if
+            false, failed expansion raises an error.
+            expansion_func (func): function to use for expansion of nested
+            variable definitions, called with expansion_dict and the variable name
+            evaluation_func (func): function to use for evaluating math of strings
+            no_expand_vars (set): set of variable names that should never be expanded
+            used_vars (set): set to add the names of all used variables to
+            dependency_func (func): function called with expansion_dict and the
+            name of every variable this template looks up, defined or not
+
+        Returns:
+            The value of this template
+        """
+        kw_parts = self._kw_parts
+        if kw_parts is None:
+            parts = []
+            for part in self.parts:
+                if isinstance(part, str):
+                    parts.append(part)
+                else:
+                    parts.append(
+                        str(
+                            part.evaluate(
+                                expansion_dict,
+                                allow_passthrough=allow_passthrough,
+                                expansion_func=expansion_func,
+                                evaluation_func=evaluation_func,
+                                no_expand_vars=no_expand_vars,
+                                used_vars=used_vars,
+                                dependency_func=dependency_func,
+                            )
+                        )
+                    )
+            replaced_contents = "".join(parts)
+
+            if self.is_root:
+                try:
+                    value = evaluation_func(replaced_contents)
+                except SyntaxError:
+                    value = replaced_contents
+
+                # Replace escaped curly braces with curly braces
+                if isinstance(value, str):
+                    value = value.replace("\\{", "{").replace("\\}", "}")
+                return value
+
+            # Special case '{}'
+            if len(replaced_contents) == 2:
+                return "{}"
+
+            kw_parts = _split_keyword(replaced_contents)
+
+        required_passthrough = False
+
+        if dependency_func is not None:
+            dependency_func(expansion_dict, kw_parts[0])
+
+        if kw_parts[0] in expansion_dict:
+            used_vars.add(kw_parts[0])
+            # Exit expansion for variables defined as no_expand
+            if kw_parts[0] in no_expand_vars:
+                return expansion_dict[kw_parts[0]]
+            else:
+                value = expansion_func(
+                    expansion_dict,
+                    kw_parts[0],
+                    allow_passthrough=allow_passthrough,
+                )
+        else:
+            value = kw_parts[0]
+            required_passthrough = True
+
+        # Evaluation should go here
+        try:
+            old_value = value
+            value = evaluation_func(value)
+            if old_value != value:
+                required_passthrough = False
+        except SyntaxError:
+            pass
+
+        # If we had a format spec, add it
+        if len(kw_parts) > 1:
+            kw_dict = {"value": value}
+            format_str = f"value:{kw_parts[1]}"
+            try:
+                value = formatter.vformat(
+                    VformatDelimiter.left + format_str + VformatDelimiter.right,
+                    [],
+                    kw_dict,
+                )
+                required_passthrough = False
+            except ValueError:
+                value += f":{kw_parts[1]}"
+            except KeyError:
+                value += f":{kw_parts[1]}"
+
+        if required_passthrough:
+            value = f"{{{value}}}"
+            if not allow_passthrough:
+                raise_passthrough_error(self.contents, value)
+
+        return value
+
+
+@functools.lru_cache(maxsize=8192)
+def compile_template(in_str):
+    """Compile an expansion string into an ExpansionTemplate
+
+    Compiled templates are cached, and shared across all expanders.
+
+    Args:
+        in_str (str): String to compile
+
+    Returns:
+        (ExpansionTemplate): Compiled representation of in_str
+    """
+    return ExpansionTemplate(ExpansionGraph(in_str).root)
+
+
+class VariableDependencies:
+    """Class representing the variables a single expansion depended on
+
+    Dependencies map variable names to the definition object they had when
+    they were looked up, or to _undefined if they were not defined.
+    """
+
+    __slots__ = ("variables", "cacheable")
+
+    def __init__(self):
+        self.variables = {}
+        self.cacheable = True
+
+    def merge(self, other):
+        """Merge the dependencies of a nested expansion into self"""
+        self.variables.update(other.variables)
+        self.cacheable = self.cacheable and other.cacheable
+
+
+_undefined = object()
+
+
 class ExpansionDict(dict):
     def __missing__(self, key):
         return "{" + key + "}"
@@ -330,8 +441,17 @@ class Expander:
         self._no_expand_vars = no_expand_vars
         self._used_variables = set()
 
+        # Cache of expanded variable values, keyed on (variable name, allow_passthrough).
+        # Each value is a tuple of (expanded value, VariableDependencies).
+        self._value_cache = {}
+        # Other experiments can expand variables through this expander from
+        # worker threads, so expansions in progress are tracked per thread.
+        self._thread_state = threading.local()
+
         self._experiment_set = experiment_set
 
+        self._disable_passthrough = ramble.config.get("config:disable_passthrough")
+
         self._application_name = None
         self._workload_name = None
         self._experiment_name = None
@@ -349,6 +469,14 @@ class Expander:
         self._workload_run_dir = None
         self._experiment_run_dir = None
 
+    @property
+    def _dependency_stack(self):
+        """Dependencies of the expansions in progress in the current thread"""
+        stack = getattr(self._thread_state, "dependency_stack", None)
+        if stack is None:
+            stack = self._thread_state.dependency_stack = []
+        return stack
+
     def add_no_expand_var(self, var: str):
         """Add a new variable to the no expand set
 
@@ -356,9 +484,11 @@ class Expander:
             var (str): Variable that should not expand
         """
         self._no_expand_vars.add(var)
+        self._value_cache.clear()
 
     def set_no_expand_vars(self, no_expand_vars):
         self._no_expand_vars = no_expand_vars.copy()
+        self._value_cache.clear()
 
     def copy(self):
         return Expander(self._variables.copy(), self._experiment_set)
@@ -473,8 +603,8 @@ class Expander:
         pulling a list from a different experiment.
         """
         try:
-            math_ast = ast.parse(str(var), mode="eval")
-            value = self.eval_math(math_ast.body)
+            math_expr = compile_math(str(var))
+            value = math_expr(self)
             if isinstance(value, list):
                 return value
             return var
@@ -537,14 +667,13 @@ class Expander:
         passthrough_setting = allow_passthrough
 
         # If disable_passthrough is set, override allow_passthrough from caller
-        if ramble.config.get("config:disable_passthrough"):
+        if self._disable_passthrough:
             passthrough_setting = False
 
         logger.debug(f"BEGINNING OF EXPAND_VAR STACK ON {var}")
         expansions = self._variables
         if extra_vars:
-            expansions = self._variables.copy()
-            expansions.update(extra_vars)
+            expansions = collections.ChainMap(extra_vars, self._variables)
 
         try:
             value = self._partial_expand(
@@ -612,21 +741,128 @@ class Expander:
         """
 
         if isinstance(in_str, str):
-            str_graph = ExpansionGraph(in_str)
-            for node in str_graph.walk():
-                node.define_value(
-                    expansion_vars,
-                    allow_passthrough=allow_passthrough,
-                    expansion_func=self._partial_expand,
-                    evaluation_func=self.perform_math_eval,
-                    no_expand_vars=self._no_expand_vars,
-                    used_vars=self._used_variables,
-                )
+            template = compile_template(in_str)
+            value = template.evaluate(
+                expansion_vars,
+                allow_passthrough=allow_passthrough,
+                expansion_func=self._expand_variable,
+                evaluation_func=self.perform_math_eval,
+                no_expand_vars=self._no_expand_vars,
+                used_vars=self._used_variables,
+                dependency_func=self._record_dependency,
+            )
 
-            return str(str_graph.root.value)
+            return str(value)
 
         return str(in_str)
 
+    def _expand_variable(self, expansion_vars, var_name, allow_passthrough=True):
+        """Expand the definition of a variable, reusing previous expansions
+
+        Expansions of this expander's own variables are cached along with the
+        variables they depended on. A cached value is reused as long as none
+        of its dependencies have been redefined (or newly defined) since it
+        was computed, so modifying variables never requires explicit
+        invalidation.
+
+        Args:
+            expansion_vars (dict): Variables to perform expansion with
+            var_name (str): Name of the variable to expand
+            allow_passthrough (bool): Define if variables are allowed to passthrough
+                                      without being expanded.
+
+        Returns:
+            (str): Expanded definition of var_name
+        """
+        if expansion_vars is not self._variables:
+            return self._partial_expand(
+                expansion_vars, expansion_vars[var_name], allow_passthrough=allow_passthrough
+            )
+
+        cache_key = (var_name, allow_passthrough)
+        if cache_key in self._value_cache:
+            value, dependencies = self._value_cache[cache_key]
+            if self._dependencies_unchanged(dependencies):
+                for name, definition in dependencies.variables.items():
+                    if definition is not _undefined:
+                        self._used_variables.add(name)
+                if self._dependency_stack:
+                    self._dependency_stack[-1].merge(dependencies)
+                return value
+            self._value_cache.pop(cache_key, None)
+
+        dependencies = VariableDependencies()
+        dependencies.variables[var_name] = expansion_vars[var_name]
+        self._dependency_stack.append(dependencies)
+        try:
+            value = self._partial_expand(
+                expansion_vars, expansion_vars[var_name], allow_passthrough=allow_passthrough
+            )
+        finally:
+            self._dependency_stack.pop()
+
+        if dependencies.cacheable:
+            self._value_cache[cache_key] = (value, dependencies)
+        if self._dependency_stack:
+            self._dependency_stack[-1].merge(dependencies)
+        return value
+
+    def _record_dependency(self, expansion_vars, var_name):
+        """Record a variable lookup in the expansion currently being cached"""
+        if self._dependency_stack and expansion_vars is self._variables:
+            self._dependency_stack[-1].variables[var_name] = expansion_vars.get(
+                var_name, _undefined
+            )
+
+    def _dependencies_unchanged(self, dependencies):
+        """Check if all dependencies still have the definitions they were recorded with"""
+        for name, definition in dependencies.variables.items():
+            if self._variables.get(name, _undefined) is not definition:
+                return False
+        return True
+
+    @contextlib.contextmanager
+    def track_dependencies(self):
+        """Record the variables looked up by expansions within this context
+
+        Yields:
+            (VariableDependencies): Variables looked up within the context
+        """
+        dependencies = VariableDependencies()
+        self._dependency_stack.append(dependencies)
+        try:
+            yield dependencies
+        finally:
+            self._dependency_stack.pop()
+        if self._dependency_stack:
+            self._dependency_stack[-1].merge(dependencies)
+
+    def dependency_key(self, var_names):
+        """Key identifying how variables are currently defined in this expander
+
+        Expansions depending only on var_names give the same results in all
+        expanders with equal keys for them.
+
+        Args:
+            var_names (tuple): Names of variables to build the key for
+
+        Returns:
+            (tuple): The definitions of var_names, and which of them are not expanded
+        """
+        definitions = tuple(self._variables.get(name, _undefined) for name in var_names)
+        return definitions, frozenset(self._no_expand_vars.intersection(var_names))
+
+    def mark_used(self, var_names):
+        """Mark the defined variables among var_names as used"""
+        for name in var_names:
+            if name in self._variables:
+                self._used_variables.add(name)
+
+    def _mark_uncacheable(self):
+        """Prevent the expansion currently being cached from being reused"""
+        if self._dependency_stack:
+            self._dependency_stack[-1].cacheable = False
+
     def perform_math_eval(self, in_str):
         """Attempt to evaluate in_str
 
@@ -639,8 +875,8 @@ class Expander:
 
         """
         try:
-            math_ast = ast.parse(in_str, mode="eval")
-            out_str = self.eval_math(math_ast.body)
+            math_expr = compile_math(in_str)
+            out_str = math_expr(self)
             return out_str
         except MathEvaluationError as e:
             logger.debug(f'   Math input is: "{in_str}"')
@@ -657,98 +893,274 @@ class Expander:
         Some operators will generate floating point, while
         others will generate integers (if the inputs are integers).
         """
-        if isinstance(node, ast.Num):
-            return self._ast_num(node)
-        elif isinstance(node, ast.Constant):
-            return self._ast_constant(node)
-        elif isinstance(node, ast.Name):
-            return self._ast_name(node)
-        # TODO: Remove when we drop support for 3.6
-        # DEPRECATED: Remove due to python 3.8
-        # See: https://docs.python.org/3/library/ast.html#node-classes
-        elif isinstance(node, ast.Str):
-            return node.s
-        elif isinstance(node, ast.Attribute):
-            return self._ast_attr(node)
-        elif isinstance(node, ast.Compare):
-            return self._eval_comparisons(node)
-        elif isinstance(node, ast.BoolOp):
-            return self._eval_bool_op(node)
-        elif isinstance(node, ast.BinOp):
-            return self._eval_binary_ops(node)
-        elif isinstance(node, ast.UnaryOp):
-            return self._eval_unary_ops(node)
-        elif isinstance(node, ast.Call):
-            return self._eval_function_call(node)
-        else:
+        return _compile_math_node(node)(self)
+
+
+class CompiledPredicate:
+    """Class representing a predicate evaluated against many expanders
+
+    The result of a predicate only depends on the definitions of the
+    variables its expansion looks up. The first evaluation with each set of
+    looked up variables records their names, and every result is stored
+    under the definitions these variables had. Later evaluations in any
+    expander giving the same definitions to the same variables reuse the
+    stored result, without expanding anything.
+
+    Predicates using random functions or variables of other experiments are
+    always evaluated.
+    """
+
+    __slots__ = ("expression", "strict", "_results")
+
+    def __init__(self, expression, strict=True):
+        """Constructor for a CompiledPredicate
+
+        Args:
+            expression (str): Predicate to evaluate
+            strict (bool): If true, evaluate with Expander.evaluate_predicate.
+                           Otherwise, the predicate holds if it expands to "True".
+        """
+        self.expression = expression
+        self.strict = strict
+        # Results, keyed by the names of the variables they depend on, and
+        # then by the definitions of these variables
+        self._results = {}
+
+    def __call__(self, expander):
+        """Evaluate this predicate
+
+        Args:
+            expander (Expander): Expander to evaluate the predicate with
+
+        Returns:
+            (bool): Result of the predicate
+        """
+        for var_names, results in self._results.items():
+            try:
+                result = results.get(expander.dependency_key(var_names))
+            except TypeError:
+                # Unhashable definitions are never stored
+                continue
+            if result is not None:
+                expander.mark_used(var_names)
+                return result
+
+        with expander.track_dependencies() as dependencies:
+            if self.strict:
+                result = expander.evaluate_predicate(self.expression)
+            else:
+                result = expander.expand_var(self.expression) == "True"
+
+        if dependencies.cacheable:
+            var_names = tuple(dependencies.variables.keys())
+            try:
+                key = expander.dependency_key(var_names)
+                self._results.setdefault(var_names, {})[key] = result
+            except TypeError:
+                pass
+        return result
+
+
+# Characters which can never begin a python expression
+_invalid_leading_chars = frozenset("*@=,<>|&^%/)]}:;!")
+
+# Characters which can never appear in a python expression outside of a string
+_invalid_unquoted_chars = frozenset("$?`;")
+
+
+def _may_be_math(in_str):
+    """Quickly determine if a string could possibly be a math expression
+
+    This is a conservative check, which only rejects strings that ast.parse
+    is guaranteed to reject. Strings passing this check might still fail to
+    parse.
+
+    Args:
+        in_str (str): String to classify
+
+    Returns:
+        (bool): False if in_str can never parse as an expression, True otherwise
+    """
+    if not in_str or in_str[0] in _invalid_leading_chars:
+        return False
+
+    if "'" in in_str or '"' in in_str or "#" in in_str:
+        return True
+
+    if not _invalid_unquoted_chars.isdisjoint(in_str):
+        return False
+
+    if "!" in in_str and in_str.count("!") != in_str.count("!="):
+        return False
+
+    return True
+
+
+def _raise_math_syntax_error(expander):
+    raise SyntaxError("Input is not a valid math expression")
+
+
+@functools.lru_cache(maxsize=8192)
+def _compile_math_str(in_str):
+    try:
+        math_ast = ast.parse(in_str, mode="eval")
+    except SyntaxError:
+        return _raise_math_syntax_error
+    return _compile_math_node(math_ast.body)
+
+
+def compile_math(in_str):
+    """Compile a string into a math expression
+
+    Compiled expressions are cached, and shared across all expanders. A
+    compiled expression is a function which takes the Expander to evaluate
+    it with, and returns the same result Expander.eval_math would return
+    for the parsed string. Strings which are not valid expressions compile
+    into a function which raises a SyntaxError.
+
+    Args:
+        in_str (str): String to compile
+
+    Returns:
+        (func): Compiled expression
+    """
+    if not _may_be_math(in_str):
+        return _raise_math_syntax_error
+    return _compile_math_str(in_str)
+
+
+def _compile_math_node(node):
+    """Compile an AST node into a function evaluating it
+
+    Nodes which cannot be evaluated compile into functions raising the
+    same errors as evaluating them would, so errors are only raised when
+    the node is actually evaluated.
+    """
+    if isinstance(node, ast.Num):
+        value = node.n
+    elif isinstance(node, ast.Constant):
+        value = node.value
+    elif isinstance(node, ast.Name):
+        value = node.id
+    # TODO: Remove when we drop support for 3.6
+    # DEPRECATED: Remove due to python 3.8
+    # See: https://docs.python.org/3/library/ast.html#node-classes
+    elif isinstance(node, ast.Str):
+        value = node.s
+    elif isinstance(node, ast.Attribute):
+        return _compile_attr(node)
+    elif isinstance(node, ast.Compare):
+        return _compile_comparisons(node)
+    elif isinstance(node, ast.BoolOp):
+        return _compile_bool_op(node)
+    elif isinstance(node, ast.BinOp):
+        return _compile_binary_ops(node)
+    elif isinstance(node, ast.UnaryOp):
+        return _compile_unary_ops(node)
+    elif isinstance(node, ast.Call):
+        return _compile_function_call(node)
+    else:
+
+        def _unsupported_node(expander):
             node_type = str(type(node))
             raise MathEvaluationError(
                 f"Unsupported math AST node {node_type}:\n" + f"\t{node.__dict__}"
             )
 
-    # Ast logic helper methods
-    def __raise_syntax_error(self, node):
+        return _unsupported_node
+
+    def _constant(expander):
+        return value
+
+    return _constant
+
+
+# Ast logic helper functions
+def _syntax_error_func(node):
+    def _raise_syntax_error(expander):
         node_type = str(type(node))
         raise RambleSyntaxError(
             f"Syntax error while processing {node_type} node:\n" + f"{node.__dict__}"
         )
 
-    def _ast_num(self, node):
-        """Handle a number node in the ast"""
-        return node.n
+    return _raise_syntax_error
 
-    def _ast_constant(self, node):
-        """Handle a constant node in the ast"""
-        return node.value
 
-    def _ast_name(self, node):
-        """Handle a name node in the ast"""
-        return node.id
+def _attr_str(node):
+    """Convert an attribute node into its dotted name, or None if not possible"""
+    if isinstance(node.value, ast.Attribute):
+        base = _attr_str(node.value)
+        if base is None:
+            return None
+    elif isinstance(node.value, ast.Name):
+        base = node.value.id
+    else:
+        return None
 
-    def _ast_attr(self, node):
-        """Handle an attribute node in the ast"""
-        if isinstance(node.value, ast.Attribute):
-            base = self._ast_attr(node.value)
-        elif isinstance(node.value, ast.Name):
-            base = self._ast_name(node.value)
-        else:
-            self.__raise_syntax_error(node)
+    return f"{base}.{node.attr}"
+
+
+def _compile_attr(node):
+    """Handle an attribute node in the ast"""
+    val = _attr_str(node)
+
+    if val is None:
+        # Raise the error for the innermost unsupported attribute
+        while isinstance(node.value, ast.Attribute) and _attr_str(node.value) is None:
+            node = node.value
+        return _syntax_error_func(node)
 
-        val = f"{base}.{node.attr}"
+    def _attr(expander):
         return val
 
-    def _eval_function_call(self, node):
-        """Handle a subset of function call nodes in the ast"""
+    return _attr
 
-        args = []
-        kwargs = {}
-        for arg in node.args:
-            args.append(self.eval_math(arg))
-        for kw in node.keywords:
-            kwargs[self.eval_math(kw.arg)] = self.eval_math(kw.value)
+
+def _compile_function_call(node):
+    """Handle a subset of function call nodes in the ast"""
+    args = [_compile_math_node(arg) for arg in node.args]
+    kwargs = [(_compile_math_node(kw.arg), _compile_math_node(kw.value)) for kw in node.keywords]
+
+    def _function_call(expander):
+        call_args = []
+        call_kwargs = {}
+        for arg in args:
+            call_args.append(arg(expander))
+        for kw_arg, kw_value in kwargs:
+            call_kwargs[kw_arg(expander)] = kw_value(expander)
+
+        if node.func.id in nondeterministic_functions:
+            expander._mark_uncacheable()
 
         if node.func.id in supported_scalar_function_pointers.keys():
             func = supported_scalar_function_pointers[node.func.id]
-            return func(*args, **kwargs)
+            return func(*call_args, **call_kwargs)
         elif node.func.id in supported_list_function_pointers.keys():
             func = supported_list_function_pointers[node.func.id]
-            return list(func(*args, **kwargs))
+            return list(func(*call_args, **call_kwargs))
         elif node.func.id == "replace":
-            return str(args[0]).replace(*args[1:], **kwargs)
+            return str(call_args[0]).replace(*call_args[1:], **call_kwargs)
         else:
             raise MathEvaluationError(
                 f"Undefined function {node.func.id} used.\n" "returning unexapanded string"
             )
 
-    def _eval_bool_op(self, node):
-        """Handle a boolean operator node in the ast"""
+    return _function_call
+
+
+def _compile_bool_op(node):
+    """Handle a boolean operator node in the ast"""
+    values = [_compile_math_node(value) for value in node.values]
+    op_type = type(node.op)
+
+    def _bool_op(expander):
         try:
-            op = supported_math_operators[type(node.op)]
+            op = supported_math_operators[op_type]
 
-            result = self.eval_math(node.values[0])
+            result = values[0](expander)
 
-            for value in node.values[1:]:
-                result = op(result, self.eval_math(value))
+            for value in values[1:]:
+                result = op(result, value(expander))
 
             return result
 
@@ -757,88 +1169,118 @@ class Expander:
         except KeyError:
             raise SyntaxError("Unsupported boolean operator")
 
-    def _eval_comparisons(self, node):
-        """Handle a comparison node in the ast"""
+    return _bool_op
+
+
+def _compile_comparisons(node):
+    """Handle a comparison node in the ast"""
 
-        # Extract In nodes, and call their helper
-        if len(node.ops) == 1 and isinstance(node.ops[0], ast.In):
-            return self._eval_comp_in(node)
+    # Extract In nodes, and call their helper
+    if len(node.ops) == 1 and isinstance(node.ops[0], ast.In):
+        return _compile_comp_in(node)
 
-        if len(node.ops) == 1 and isinstance(node.ops[0], ast.Is):
+    if len(node.ops) == 1 and isinstance(node.ops[0], ast.Is):
+
+        def _unsupported_is(expander):
             raise RambleSyntaxError("Encountered unsupported operator `is`")
 
-        # Try to evaluate the comparison logic, if not return the node as is.
-        try:
-            cur_left = self.eval_math(node.left)
+        return _unsupported_is
 
-            op = supported_math_operators[type(node.ops[0])]
-            cur_right = self.eval_math(node.comparators[0])
+    left = _compile_math_node(node.left)
+    right = _compile_math_node(node.comparators[0])
+    op_type = type(node.ops[0])
+    chained = len(node.ops) > 1
 
-            result = op(cur_left, cur_right)
+    # Try to evaluate the comparison logic, if not return the node as is.
+    def _comparison(expander):
+        try:
+            cur_left = left(expander)
 
-            if len(node.ops) > 1:
-                cur_left = cur_right
-                for comp, right in zip(node.ops, node.comparators)[1:]:
-                    op = supported_math_operators[type(comp)]
-                    cur_right = self.eval_math(right)
+            op = supported_math_operators[op_type]
+            cur_right = right(expander)
 
-                    result = result and op(cur_left, cur_right)
+            result = op(cur_left, cur_right)
 
-                    cur_left = cur_right
+            # Chained comparisons are not supported
+            if chained:
+                raise TypeError
             return result
         except TypeError:
             raise SyntaxError("Unsupported operand type in binary comparison operator")
         except KeyError:
             raise SyntaxError("Unsupported binary comparison operator")
 
-    def _eval_comp_in(self, node):
-        """Handle in nodes in the ast
+    return _comparison
 
-        Perform extraction of `<variable> in <experiment>` syntax.
-        Raises an exception if the experiment does not exist.
 
-        Also, evaluated `<value> in [list, of, values]` syntax.
-        """
-        if isinstance(node.left, ast.Name):
-            var_name = self._ast_name(node.left)
-            if isinstance(node.comparators[0], ast.Attribute):
-                namespace = self.eval_math(node.comparators[0])
-                val = self._experiment_set.get_var_from_experiment(
-                    namespace, self.expansion_str(var_name)
+def _compile_comp_in(node):
+    """Handle in nodes in the ast
+
+    Perform extraction of `<variable> in <experiment>` syntax.
+    Raises an exception if the experiment does not exist.
+
+    Also, evaluated `<value> in [list, of, values]` syntax.
+    """
+    if isinstance(node.left, ast.Name):
+        var_name = node.left.id
+        if isinstance(node.comparators[0], ast.Attribute):
+            get_namespace = _compile_math_node(node.comparators[0])
+
+            def _comp_in_experiment(expander):
+                namespace = get_namespace(expander)
+                # Other experiments' variables are not tracked as dependencies
+                expander._mark_uncacheable()
+                val = expander._experiment_set.get_var_from_experiment(
+                    namespace, expander.expansion_str(var_name)
                 )
                 if not val:
                     raise RambleSyntaxError(
                         f"{namespace} does not exist in: " + f'"{var_name} in {namespace}"'
                     )
-                    self.__raise_syntax_error(node)
                 return val
-        # ast.Str was deprecated. short-circuit the test for it to avoid issues with newer python.
-        # TODO: Remove `or` logic after 3.6 & 3.7 series python are unsupported
-        elif isinstance(node.left, ast.Constant) or (
-            hasattr(ast, "Str") and isinstance(node.left, ast.Str)
-        ):
-            lhs_value = self.eval_math(node.left)
+
+            return _comp_in_experiment
+    # ast.Str was deprecated. short-circuit the test for it to avoid issues with newer python.
+    # TODO: Remove `or` logic after 3.6 & 3.7 series python are unsupported
+    elif isinstance(node.left, ast.Constant) or (
+        hasattr(ast, "Str") and isinstance(node.left, ast.Str)
+    ):
+        lhs = _compile_math_node(node.left)
+        rhs_lists = []
+        for comp in node.comparators:
+            if isinstance(comp, ast.List):
+                rhs_lists.append([_compile_math_node(elt) for elt in comp.elts])
+
+        def _comp_in_list(expander):
+            lhs_value = lhs(expander)
 
             found = False
-            for comp in node.comparators:
-                if isinstance(comp, ast.List):
-                    for elt in comp.elts:
-                        rhs_value = self.eval_math(elt)
-                        if lhs_value == rhs_value:
-                            found = True
+            for rhs_list in rhs_lists:
+                for rhs in rhs_list:
+                    rhs_value = rhs(expander)
+                    if lhs_value == rhs_value:
+                        found = True
             return found
 
-        self.__raise_syntax_error(node)
+        return _comp_in_list
 
-    def _eval_binary_ops(self, node):
-        """Evaluate binary operators in the ast
+    return _syntax_error_func(node)
 
-        Extract the binary operator, and evaluate it.
-        """
+
+def _compile_binary_ops(node):
+    """Evaluate binary operators in the ast
+
+    Extract the binary operator, and evaluate it.
+    """
+    left = _compile_math_node(node.left)
+    right = _compile_math_node(node.right)
+    op_type = type(node.op)
+
+    def _binary_op(expander):
         try:
-            left_eval = self.eval_math(node.left)
-            right_eval = self.eval_math(node.right)
-            op = supported_math_operators[type(node.op)]
+            left_eval = left(expander)
+            right_eval = right(expander)
+            op = supported_math_operators[op_type]
             if isinstance(left_eval, str) or isinstance(right_eval, str):
                 raise SyntaxError("Unsupported operand type in binary operator")
             return op(left_eval, right_eval)
@@ -847,22 +1289,31 @@ class Expander:
         except KeyError:
             raise SyntaxError("Unsupported binary operator")
 
-    def _eval_unary_ops(self, node):
-        """Evaluate unary operators in the ast
+    return _binary_op
 
-        Extract the unary operator, and evaluate it.
-        """
+
+def _compile_unary_ops(node):
+    """Evaluate unary operators in the ast
+
+    Extract the unary operator, and evaluate it.
+    """
+    operand_func = _compile_math_node(node.operand)
+    op_type = type(node.op)
+
+    def _unary_op(expander):
         try:
-            operand = self.eval_math(node.operand)
+            operand = operand_func(expander)
             if isinstance(operand, str):
                 raise SyntaxError("Unsupported operand type in unary operator")
-            op = supported_math_operators[type(node.op)]
+            op = supported_math_operators[op_type]
             return op(operand)
         except TypeError:
             raise SyntaxError("Unsupported operand type in unary operator")
         except KeyError:
             raise SyntaxError("Unsupported unary operator")
 
+    return _unary_op
+
 
 def raise_passthrough_error(in_str, out_str):
     """Raise an error when passthrough is disabled but variables are not all expanded"""
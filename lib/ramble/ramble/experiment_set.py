@@ -52,6 +52,8 @@ class ExperimentSet:
         self.chained_order = []
         self._workspace = workspace
         self._context = {}
+        # Pristine application instances, which experiments are copied from
+        self._application_prototypes = {}
 
         for context in self._contexts:
             self._context[context] = ramble.context.Context()
@@ -249,6 +251,22 @@ class ExperimentSet:
         if not n_threads:
             variables[self.keywords.n_threads] = 1
 
+    def _application_prototype(self, app_name):
+        """Get the prototype instance experiments of an application are copied from
+
+        The application is only looked up in the repository, and constructed
+        from its definition, once per experiment set.
+
+        Args:
+            app_name (str): Name of the application
+
+        Returns:
+            (Application): Prototype instance of the application
+        """
+        if app_name not in self._application_prototypes:
+            self._application_prototypes[app_name] = ramble.repository.get(app_name)
+        return self._application_prototypes[app_name]
+
     def _prepare_experiment(self, exp_template_name, variables, context, repeats):
         """Prepare an experiment instance
 
@@ -280,7 +298,7 @@ class ExperimentSet:
             self.keywords.application_name, allow_passthrough=False
         )
 
-        app_inst = ramble.repository.get(final_app_name).copy()
+        app_inst = self._application_prototype(final_app_name).copy(register=False)
         app_inst.set_variables(variables, self)
         app_inst.set_variants(context.variants)
         app_inst.set_env_variable_sets(context.env_variables)
@@ -336,7 +354,7 @@ class ExperimentSet:
             ),
         )
 
-        app_inst.read_status()
+        app_inst.read_status(self._workspace)
 
         try:
             app_inst.validate_experiment()
@@ -445,9 +463,17 @@ class ExperimentSet:
         tracking_group.variables = final_context.variables
         tracking_group.zips = final_context.zips
         tracking_group.matrices = final_context.matrices
-        tracking_group.n_repeats = final_context.n_repeats
+        # Repeats render with the same variables as their base experiment, so
+        # they cannot contribute additional used variables.
+        tracking_group.n_repeats = 0
         tracking_group.used_variables = set()
 
+        # Used variables only change the rendered experiments through
+        # vectors and zips which are not consumed by a matrix. Track
+        # experiments only until each of these has been seen as used.
+        # At least one experiment is always tracked, to validate its definition.
+        candidates = renderer.used_variable_candidates(tracking_group)
+
         used_variables = set()
         for tracking_vars, repeats in renderer.render_objects(
             tracking_group, exclude_where=exclude_where, ignore_used=False, fatal=False
@@ -456,10 +482,11 @@ class ExperimentSet:
                 experiment_template_name, tracking_vars, final_context, repeats
             )
 
-            final_exp_name = app_inst.expander.expand_var_name(self.keywords.experiment_namespace)
-
             exp_used_variables = app_inst.build_used_variables(self._workspace)
-            used_variables = used_variables.union(exp_used_variables)
+            used_variables.update(exp_used_variables)
+
+            if candidates.issubset(used_variables):
+                break
         render_group.used_variables = used_variables.copy()
 
         rendered_experiments = set()
@@ -564,25 +591,38 @@ class ExperimentSet:
             inst: An application instance representing the experiment
         """
 
-        for exp, inst, idx in self.all_experiments():
-            active = True
-
-            if filters.include_where:
-                for expression in filters.include_where:
-                    if not inst.expander.evaluate_predicate(expression):
-                        active = False
-
-            if filters.exclude_where:
-                for expression in filters.exclude_where:
-                    if inst.expander.evaluate_predicate(expression):
-                        active = False
+        # Predicates are compiled once for all experiments. Experiments giving
+        # the same definitions to the variables a predicate depends on (such
+        # as application_name, workload_name, or experiment_status) reuse its
+        # result without expanding it again.
+        include_predicates = []
+        if filters.include_where:
+            include_predicates = [
+                ramble.expander.CompiledPredicate(expression)
+                for expression in filters.include_where
+            ]
+
+        exclude_predicates = []
+        if filters.exclude_where:
+            exclude_predicates = [
+                ramble.expander.CompiledPredicate(expression)
+                for expression in filters.exclude_where
+            ]
 
+        for exp, inst, idx in self.all_experiments():
+            # Cheaper checks are performed first, so experiments they reject
+            # are never expanded.
             if filters.tags:
                 if not inst.has_tags(filters.tags):
-                    active = False
+                    continue
+
+            if not all(predicate(inst.expander) for predicate in include_predicates):
+                continue
+
+            if any(predicate(inst.expander) for predicate in exclude_predicates):
+                continue
 
-            if active and inst.is_actionable():
-                yield exp, inst, idx
+            yield exp, inst, idx
 
     def add_chained_experiment(self, name, instance):
         if name in self.chained_experiments.keys():
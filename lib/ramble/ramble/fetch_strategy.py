@@ -54,6 +54,7 @@ from spack.util.string import comma_and, quote
 from spack.version import Version, ver
 
 import ramble.config
+import ramble.util.hashing
 from ramble.util.logger import logger
 
 #: List of all fetch strategies, created by FetchStrategy metaclass.
@@ -647,13 +648,19 @@ class CacheURLFetchStrategy(URLFetchStrategy):
         if not os.path.isfile(path):
             raise NoCacheError("No cache of %s" % path)
 
-        # remove old symlink if one is there.
         filename = self.stage.save_filename
-        if os.path.exists(filename):
-            os.remove(filename)
-
-        # Symlink to local cached archive.
-        os.symlink(path, filename)
+        if not (os.path.exists(filename) and os.path.samefile(path, filename)):
+            # remove old link if one is there.
+            if os.path.lexists(filename):
+                os.remove(filename)
+
+            # Hard link the local cached archive, so every stage using it
+            # shares one copy of its data. Fall back to copying it when the
+            # cache is on another file system.
+            try:
+                os.link(path, filename)
+            except OSError:
+                shutil.copy2(path, filename)
 
         # Remove link if checksum fails, or subsequent fetchers
         # will assume they don't need to download.
@@ -667,6 +674,23 @@ class CacheURLFetchStrategy(URLFetchStrategy):
         # Notify the user how we fetched.
         logger.msg(f"Using cached archive: {path}")
 
+    @_needs_stage
+    def check(self):
+        """Check the archive against a checksum digest.
+
+        sha256 digests of the archive, which is linked from the cache, are
+        reused within this process while the archive is unchanged.
+        """
+        if self.digest and len(self.digest) == 2 * crypto.hashes["sha256"]:
+            digest = ramble.util.hashing.hash_file(self.archive_file, cached=True)
+            if digest != self.digest:
+                raise ChecksumError(
+                    f"sha256 checksum failed for {self.archive_file}",
+                    f"Expected {self.digest} but got {digest}",
+                )
+            return
+        super().check()
+
 
 class VCSFetchStrategy(FetchStrategy):
     """Superclass for version control system fetch strategies.
@@ -79,19 +79,29 @@ class Keywords:
 
     def __init__(self, extra_keys={}):
         # Merge in additional Keys:
-        self.keys = default_keys.copy()
+        self.keys = default_keys
+        self._keys_shared = True
         self.update_keys(extra_keys)
 
     def copy(self):
-        new_inst = type(self)()
-        new_inst.keys = self.keys.copy()
-        new_inst.update_keys({})
+        # Copies share their key definitions until keys are added to either
+        # one, as most copies (one per experiment) never add any
+        new_inst = type(self).__new__(type(self))
+        new_inst.__dict__.update(self.__dict__)
+        self._keys_shared = True
+        new_inst._keys_shared = True
         return new_inst
 
     def update_keys(self, extra_keys):
+        if not extra_keys:
+            return
+
+        if self._keys_shared:
+            self.keys = self.keys.copy()
+            self._keys_shared = False
         self.keys.update(extra_keys)
-        # Define class attributes for all of the keys
-        for key in self.keys.keys():
+        # Define attributes for the added keys. Default keys are class attributes.
+        for key in extra_keys.keys():
             setattr(self, key, key)
 
     def is_valid(self, key):
@@ -181,6 +191,10 @@ class Keywords:
             )
 
 
+for _key in default_keys.keys():
+    setattr(Keywords, _key, _key)
+
+
 class RambleKeywordError(ramble.error.RambleError):
     """Superclass for all errors to do with Ramble Keywords"""
 
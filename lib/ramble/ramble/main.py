@@ -25,8 +25,6 @@ import signal
 import sys
 import traceback
 import warnings
-import jsonschema
-import ruamel
 
 import llnl.util.lang
 import llnl.util.tty as tty
@@ -37,17 +35,15 @@ from llnl.util.tty.log import log_output
 import ramble
 import ramble.cmd
 import ramble.config
-import ramble.workspace
-import ramble.workspace.shell
 import ramble.paths
 import ramble.repository
 from ramble.util.logger import logger
-import spack.util.debug
-import spack.util.environment
 from spack.util.executable import CommandNotFoundError
-import spack.util.path
 from ramble.error import RambleError
 
+# Modules needed only by some commands, like ramble.workspace, are imported
+# where they are used, to keep startup fast for commands which do not need them.
+
 #: names of profile statistics
 stat_names = pstats.Stats.sort_arg_dict_default
 
@@ -156,20 +152,20 @@ def index_commands():
     """create an index of commands by section for this help level"""
     index = {}
     for command in ramble.cmd.all_commands():
-        cmd_module = ramble.cmd.get_module(command)
+        properties = ramble.cmd.command_properties(command, required_command_properties)
 
         # make sure command modules have required properties
         for p in required_command_properties:
-            prop = getattr(cmd_module, p, None)
+            prop = properties.get(p, None)
             if not prop:
                 logger.die(f"Command doesn't define a property '{p}': {command}")
 
         # add commands to lists for their level and higher levels
         for level in reversed(levels):
             level_sections = index.setdefault(level, {})
-            commands = level_sections.setdefault(cmd_module.section, [])
+            commands = level_sections.setdefault(properties["section"], [])
             commands.append(command)
-            if level == cmd_module.level:
+            if level == properties["level"]:
                 break
 
     return index
@@ -206,8 +202,10 @@ class RambleArgumentParser(argparse.ArgumentParser):
         if level not in levels:
             raise ValueError("level must be one of: %s" % levels)
 
-        # lazily add all commands to the parser when needed.
-        add_all_commands(self)
+        # lazily add all commands to the parser when needed. Help only needs
+        # their descriptions, so their modules are not imported.
+        for cmd in ramble.cmd.all_commands():
+            self.add_command(cmd, setup=False)
 
         """Print help on subcommands in neatly formatted sections."""
         formatter = self._get_formatter()
@@ -328,19 +326,30 @@ class RambleArgumentParser(argparse.ArgumentParser):
         sp.add_parser = add_parser
         return sp
 
-    def add_command(self, cmd_name):
-        """Add one subcommand to this parser."""
+    def add_command(self, cmd_name, setup=True):
+        """Add one subcommand to this parser.
+
+        Args:
+            cmd_name (str): name of the command to add
+            setup (bool): if False, only add the command's description, without
+                importing its module. The command's arguments are set up by a
+                later call with setup=True.
+
+        Returns:
+            The callable function for the command, or None if it was not set up
+        """
         # lazily initialize any subparsers
         if not hasattr(self, "subparsers"):
             # remove the dummy "command" argument.
             if self._actions[-1].dest == "command":
                 self._remove_action(self._actions[-1])
             self.subparsers = self.add_subparsers(metavar="COMMAND", dest="command")
+            self.unset_commands = set()
 
         if cmd_name not in self.subparsers._name_parser_map:
-            # each command module implements a parser() function, to which we
-            # pass its subparser for setup.
-            module = ramble.cmd.get_module(cmd_name)
+            description = ramble.cmd.command_properties(cmd_name, [ramble.cmd.DESCRIPTION]).get(
+                ramble.cmd.DESCRIPTION, ""
+            )
 
             # build a list of aliases
             alias_list = []
@@ -348,13 +357,20 @@ class RambleArgumentParser(argparse.ArgumentParser):
             if aliases:
                 alias_list = [k for k, v in aliases.items() if shlex.split(v)[0] == cmd_name]
 
-            subparser = self.subparsers.add_parser(
-                cmd_name,
-                aliases=alias_list,
-                help=module.description,
-                description=module.description,
+            self.subparsers.add_parser(
+                cmd_name, aliases=alias_list, help=description, description=description
             )
-            module.setup_parser(subparser)
+            self.unset_commands.add(cmd_name)
+
+        if not setup:
+            return None
+
+        if cmd_name in self.unset_commands:
+            # each command module implements a parser() function, to which we
+            # pass its subparser for setup.
+            module = ramble.cmd.get_module(cmd_name)
+            module.setup_parser(self.subparsers._name_parser_map[cmd_name])
+            self.unset_commands.remove(cmd_name)
 
         # return the callable function for the command
         return ramble.cmd.get_command(cmd_name)
@@ -603,6 +619,9 @@ def setup_main_options(args):
     # errors raised by ramble.config.
 
     if args.debug:
+        import spack.util.debug
+        import spack.util.environment
+
         ramble.error.debug = args.debug
         spack.util.debug.register_interrupt_handler()
         ramble.config.set("config:debug", True, scope="command_line")
@@ -614,6 +633,8 @@ def setup_main_options(args):
     # override lock configuration if passed on command line
     if args.locks is not None:
         if args.locks is False:
+            import spack.util.lock
+
             spack.util.lock.check_lock_safety(ramble.paths.prefix)
         ramble.config.set("config:locks", args.locks, scope="command_line")
 
@@ -719,6 +740,8 @@ class RambleCommand:
         is set in ``returncode`` property, and the error is set in the
         ``error`` property.  Otherwise, raise an error.
         """
+        import ramble.workspace.shell
+
         # set these before every call to clear them out
         self.returncode = None
         self.error = None
@@ -900,22 +923,7 @@ def _main(argv=None):
     # activate a workspace if one was specified on the command line
     workspace_format_error = None
     if not args.no_workspace:
-        try:
-            ws = ramble.cmd.find_workspace(args)
-            if ws:
-                ramble.workspace.shell.activate(ws)
-        # print the context but delay this exception so that commands like
-        # `ramble config edit` can still work with a bad workspace.
-        except ramble.workspace.RambleActiveWorkspaceError as e:
-            workspace_format_error = e
-        except ramble.config.ConfigFormatError as e:
-            e.print_context()
-            workspace_format_error = e
-        except jsonschema.exceptions.ValidationError as e:
-            e.print_context()
-            workspace_format_error = e
-        except ruamel.yaml.parser.ParserError as e:
-            workspace_format_error = e
+        workspace_format_error = activate_workspace(args)
 
     # ------------------------------------------------------------------------
     # Things that require configuration should go below here
@@ -948,6 +956,39 @@ def _main(argv=None):
         return finish_parse_and_run(parser, cmd_name, workspace_format_error)
 
 
+def activate_workspace(args):
+    """Activate the workspace given on the command line, or in the environment
+
+    Returns:
+        The error raised while reading the workspace, if any. It is raised
+        once the command is known, so commands like `ramble config edit` can
+        still work with a bad workspace.
+    """
+    import jsonschema
+    import ruamel.yaml
+
+    import ramble.workspace
+    import ramble.workspace.shell
+
+    try:
+        ws = ramble.cmd.find_workspace(args)
+        if ws:
+            ramble.workspace.shell.activate(ws)
+    # print the context but delay this exception so that commands like
+    # `ramble config edit` can still work with a bad workspace.
+    except ramble.workspace.RambleActiveWorkspaceError as e:
+        return e
+    except ramble.config.ConfigFormatError as e:
+        e.print_context()
+        return e
+    except jsonschema.exceptions.ValidationError as e:
+        e.print_context()
+        return e
+    except ruamel.yaml.parser.ParserError as e:
+        return e
+    return None
+
+
 def finish_parse_and_run(parser, cmd_name, workspace_format_error):
     """Finish parsing after we know the command to run."""
     # add the found command to the parser and re-run then re-parse
@@ -20,7 +20,6 @@ from ramble.language.shared_language import SharedMeta
 from ramble.error import RambleError
 import ramble.util.colors as rucolor
 import ramble.util.directives
-import ramble.util.class_attributes
 from ramble.util.logger import logger
 from ramble.util.naming import NS_SEPARATOR
 
@@ -42,8 +41,6 @@ class ModifierBase(metaclass=ModifierMeta):
     def __init__(self, file_path):
         super().__init__()
 
-        ramble.util.class_attributes.convert_class_attributes(self)
-
         self._file_path = file_path
         self._on_executables = ["*"]
         self.expander = None
@@ -20,7 +20,6 @@ from ramble.language.shared_language import SharedMeta
 from ramble.error import RambleError
 import ramble.util.colors as rucolor
 import ramble.util.directives
-import ramble.util.class_attributes
 from ramble.util.naming import NS_SEPARATOR
 
 import spack.util.naming
@@ -47,6 +46,15 @@ class PackageManagerBase(metaclass=PackageManagerMeta):
 
     _spec_prefix = ""
 
+    #: Setup phases which set up the software environment of an experiment.
+    #: They only do work for the first experiment using each environment, so
+    #: the setup pipeline can run them ahead of time for distinct environments.
+    environment_phases = frozenset()
+
+    #: Environment phases which only touch their own environment, and can run
+    #: concurrently for distinct environments.
+    parallel_environment_phases = frozenset()
+
     package_manager_class = "PackageManagerBase"
 
     #: Lists of strings which contains GitHub usernames of attributes.
@@ -57,8 +65,6 @@ class PackageManagerBase(metaclass=PackageManagerMeta):
     def __init__(self, file_path):
         super().__init__()
 
-        ramble.util.class_attributes.convert_class_attributes(self)
-
         self._file_path = file_path
 
         self._verbosity = "short"
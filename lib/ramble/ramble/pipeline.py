@@ -6,14 +6,18 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+from contextlib import nullcontext
 from enum import Enum
+import multiprocessing.pool
 import stat
 import os
 import shutil
 import py.path
 import shlex
+import threading
 
 import llnl.util.filesystem as fs
+import llnl.util.lang
 import llnl.util.tty as tty
 from llnl.util.tty.color import cprint
 
@@ -23,6 +27,8 @@ import ramble.experiment_set
 import ramble.repository
 import ramble.software_environments
 import ramble.util.hashing
+import ramble.util.local_runner
+import ramble.util.submission
 import ramble.fetch_strategy
 import ramble.stage
 import ramble.workspace
@@ -32,6 +38,7 @@ import ramble.experimental.uploader
 from ramble.namespace import namespace
 from ramble.util.logger import logger
 
+import spack.util.cpus
 import spack.util.spack_json as sjson
 from spack.util.executable import which, Executable
 
@@ -42,14 +49,68 @@ if not ramble.config.get("config:disable_progress_bar", False):
         logger.die("Module `tqdm` is not found. Ensure requirements.txt are installed.")
 
 
+#: Per-thread name of the experiment being processed by a worker thread
+_experiment_context = threading.local()
+
+
+class _ExperimentExit(Exception):
+    """Raised by a worker thread when an experiment's phases exit"""
+
+    def __init__(self, exp, code):
+        super().__init__(exp, code)
+        self.exp = exp
+        self.code = code
+
+
+class _ExperimentOrderedWriter:
+    """Stream which keeps per-experiment writes in experiment order
+
+    Writes from worker threads are buffered per experiment, and written to the
+    underlying stream in experiment order by flush_in_order. Writes from other
+    threads go directly to the underlying stream.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._buffers = {}
+
+    def write(self, text):
+        exp = getattr(_experiment_context, "name", None)
+        if exp is None:
+            self.stream.write(text)
+        else:
+            self._buffers.setdefault(exp, []).append(text)
+
+    def flush_in_order(self, exp_order):
+        for exp in exp_order:
+            for text in self._buffers.pop(exp, []):
+                self.stream.write(text)
+
+
+def _order_results(results, start, exp_order):
+    """Sort results[start:] by the position of their experiment in exp_order
+
+    The sort is stable, so results for the same experiment keep their order.
+    """
+    position = {exp: i for i, exp in enumerate(exp_order)}
+    results[start:] = sorted(
+        results[start:], key=lambda result: position.get(result["name"], len(position))
+    )
+
+
 class Pipeline:
     """Base Class for all pipeline objects"""
 
     name = "base"
 
+    #: Phases which only touch their own experiment, and can run concurrently
+    #: across experiments. All other phases are serialized when using jobs.
+    parallel_phases = frozenset()
+
     def __init__(self, workspace, filters):
         """Create a new pipeline instance"""
         self.filters = filters
+        self.jobs = 1
         self.workspace = workspace
         self.force_inventory = False
         self.require_inventory = False
@@ -128,19 +189,13 @@ class Pipeline:
         if self.suppress_per_experiment_prints and not self.suppress_run_header:
             logger.all_msg(f"  Log files for experiments are stored in: {self.log_dir}")
 
+        if self.jobs > 1:
+            self._execute_parallel(num_exps)
+            return
+
         count = 1
         for exp, app_inst, idx in self._experiment_set.filtered_experiments(self.filters):
-            exp_log_path = app_inst.experiment_log_file(self.log_dir)
-
-            experiment_index_value = app_inst.expander.expand_var_name(
-                app_inst.keywords.experiment_index
-            )
-
-            if not self.suppress_per_experiment_prints:
-                logger.all_msg(f"Experiment #{idx} ({count}/{num_exps}):")
-                logger.all_msg(f"    name: {exp}")
-                logger.all_msg(f"    root experiment_index: {experiment_index_value}")
-                logger.all_msg(f"    log file: {exp_log_path}")
+            exp_log_path = self._print_experiment_header(exp, app_inst, idx, count, num_exps)
 
             logger.add_log(exp_log_path)
 
@@ -150,34 +205,142 @@ class Pipeline:
                 ramble.config.get("config:disable_progress_bar", False)
                 or self.suppress_per_experiment_prints
             )
-            if not disable_progress:
-                try:
-                    progress = tqdm.tqdm(
-                        total=len(phase_list),
-                        leave=True,
-                        ascii=" >=",
-                        bar_format="{l_bar}{bar}| Elapsed (s): {elapsed_s:.2f}",
-                    )
-                except AttributeError:
-                    logger.die("tdqm.tdqm is not found. Ensure requirements.txt are installed.")
-            for phase_idx, phase in enumerate(phase_list):
-                if not disable_progress:
-                    progress.set_description(
-                        f"Processing phase {phase} ({phase_idx}/{len(phase_list)})"
-                    )
-                app_inst.run_phase(self.name, phase, self.workspace)
-                if not disable_progress:
-                    progress.update()
-            app_inst.print_phase_times(self.name, self.filters.phases)
-            if not disable_progress:
-                progress.set_description("Experiment complete")
-                progress.close()
+            self._run_phases(app_inst, phase_list, disable_progress)
 
             logger.remove_log()
             if not self.suppress_per_experiment_prints:
                 logger.all_msg(f"  Returning to log file: {logger.active_log()}")
             count += 1
 
+    def _print_experiment_header(self, exp, app_inst, idx, count, num_exps):
+        """Print the header of an experiment, and return its log file path"""
+        exp_log_path = app_inst.experiment_log_file(self.log_dir)
+
+        experiment_index_value = app_inst.expander.expand_var_name(
+            app_inst.keywords.experiment_index
+        )
+
+        if not self.suppress_per_experiment_prints:
+            logger.all_msg(f"Experiment #{idx} ({count}/{num_exps}):")
+            logger.all_msg(f"    name: {exp}")
+            logger.all_msg(f"    root experiment_index: {experiment_index_value}")
+            logger.all_msg(f"    log file: {exp_log_path}")
+
+        return exp_log_path
+
+    def _run_phases(self, app_inst, phase_list, disable_progress):
+        """Run the phases of a single experiment, in order"""
+        if not disable_progress:
+            try:
+                progress = tqdm.tqdm(
+                    total=len(phase_list),
+                    leave=True,
+                    ascii=" >=",
+                    bar_format="{l_bar}{bar}| Elapsed (s): {elapsed_s:.2f}",
+                )
+            except AttributeError:
+                logger.die("tdqm.tdqm is not found. Ensure requirements.txt are installed.")
+        for phase_idx, phase in enumerate(phase_list):
+            if not disable_progress:
+                progress.set_description(
+                    f"Processing phase {phase} ({phase_idx}/{len(phase_list)})"
+                )
+            with self._phase_guard(phase):
+                app_inst.run_phase(self.name, phase, self.workspace)
+            if not disable_progress:
+                progress.update()
+        app_inst.print_phase_times(self.name, self.filters.phases)
+        app_inst.record_phase_times(self.workspace, self.name)
+        # Commit this experiment's state, so an interrupted pipeline keeps it
+        self.workspace.flush_state()
+        if not disable_progress:
+            progress.set_description("Experiment complete")
+            progress.close()
+
+    def _phase_guard(self, phase):
+        """Return a context manager to hold while running phase
+
+        Phases not listed in parallel_phases can touch resources which are
+        shared between experiments (software environments, inputs, licenses,
+        workspace caches, ...). These phases are serialized with the
+        workspace's shared resource lock.
+        """
+        if phase in self.parallel_phases:
+            return nullcontext()
+        return self.workspace.shared_resource_lock
+
+    def _execute_parallel(self, num_exps):
+        """Execute experiments concurrently, using self.jobs worker threads
+
+        Experiment headers, phase lists, and experiment variables are
+        computed up front (in order) on the calling thread. Each worker runs
+        all phases of one experiment, logging to that experiment's log file.
+        Outputs shared between experiments are merged in experiment order once
+        all experiments are complete.
+        """
+        work = []
+        exp_order = []
+        count = 1
+        for exp, app_inst, idx in self._experiment_set.filtered_experiments(self.filters):
+            exp_log_path = self._print_experiment_header(exp, app_inst, idx, count, num_exps)
+            phase_list = app_inst.get_pipeline_phases(self.name, self.filters.phases)
+            app_inst.add_expand_vars(self.workspace)
+            work.append((exp, app_inst, exp_log_path, phase_list))
+            exp_order.append(exp)
+            count += 1
+
+        logger.all_msg(f"  Processing {len(work)} experiments using {self.jobs} jobs")
+
+        parent_logs = list(logger.log_stack)
+
+        def _run_experiment(exp, app_inst, exp_log_path, phase_list):
+            _experiment_context.name = exp
+            try:
+                with logger.thread_logs(parent_logs), self.workspace.private_success_list():
+                    logger.add_log(exp_log_path)
+                    self._run_phases(app_inst, phase_list, disable_progress=True)
+            except SystemExit as e:
+                # logger.die exits, which would otherwise silently kill the
+                # pool's worker thread.
+                raise _ExperimentExit(exp, e.code)
+            finally:
+                _experiment_context.name = None
+
+        self._begin_parallel()
+        tp = multiprocessing.pool.ThreadPool(processes=min(self.jobs, max(len(work), 1)))
+        try:
+            for _ in tp.imap(llnl.util.lang.star(_run_experiment), work):
+                pass
+        except _ExperimentExit as e:
+            logger.error(f"Experiment {e.exp} failed. See its log file for details.")
+            raise SystemExit(e.code)
+        finally:
+            tp.terminate()
+            tp.join()
+            self._end_parallel(exp_order)
+
+    def _begin_parallel(self):
+        """Hook called before experiments are dispatched to worker threads"""
+        # Create the results before workers add to them, so they cannot each
+        # create their own
+        if not self.workspace.results:
+            self.workspace.results = self.workspace.default_results()
+        self._num_prior_results = len(self.workspace.results["experiments"])
+
+    def _end_parallel(self, exp_order):
+        """Hook called after all worker threads are complete
+
+        Results are appended as experiments finish, so restore the order a
+        serial execution would have produced.
+
+        Args:
+            exp_order (list(str)): Names of the processed experiments, in order
+        """
+        if self.workspace.results:
+            _order_results(
+                self.workspace.results["experiments"], self._num_prior_results, exp_order
+            )
+
     def _complete(self):
         """Hook for performing pipeline actions after execution is complete"""
         pass
@@ -204,6 +367,7 @@ class Pipeline:
         self._prepare()
         self._execute()
         self._complete()
+        self.workspace.flush_state()
         logger.remove_log()
 
     def create_simlink(self, base, link):
@@ -221,6 +385,8 @@ class AnalyzePipeline(Pipeline):
 
     name = "analyze"
 
+    parallel_phases = frozenset(["prepare_analysis", "analyze_experiments", "write_status"])
+
     def __init__(
         self, workspace, filters, output_formats=["text"], upload=False, print_results=False
     ):
@@ -279,6 +445,8 @@ class ArchivePipeline(Pipeline):
 
     name = "archive"
 
+    parallel_phases = frozenset(["archive_experiments"])
+
     def __init__(
         self,
         workspace,
@@ -444,20 +612,128 @@ class SetupPipeline(Pipeline):
 
     name = "setup"
 
+    parallel_phases = frozenset(["make_experiments", "write_inventory", "write_status"])
+
     def __init__(self, workspace, filters):
         super().__init__(workspace, filters)
         self.force_inventory = True
         self.require_inventory = False
         self.action_string = "Setting up"
 
+    def _begin_parallel(self):
+        super()._begin_parallel()
+        self.workspace.experiments_script = _ExperimentOrderedWriter(
+            self.workspace.experiments_script
+        )
+
+    def _end_parallel(self, exp_order):
+        super()._end_parallel(exp_order)
+        ordered_script = self.workspace.experiments_script
+        ordered_script.flush_in_order(exp_order)
+        self.workspace.experiments_script = ordered_script.stream
+
     def _prepare(self):
         super()._prepare()
+        if not self.workspace.dry_run:
+            self._prefetch_inputs()
+        self._set_up_environments()
         experiment_file = open(self.workspace.all_experiments_path, "w+")
         shell = ramble.config.get("config:shell")
         shell_path = os.path.join("/bin/", shell)
         experiment_file.write(f"#!{shell_path}\n")
         self.workspace.experiments_script = experiment_file
 
+    def _prefetch_inputs(self):
+        """Fetch the inputs of all experiments into the input cache
+
+        Inputs are collected across experiments, and each distinct input is
+        fetched once, concurrently. The get_inputs phase of each experiment
+        then links its inputs from the input cache.
+        """
+        inputs = {}
+        for _, app_inst, _ in self._experiment_set.filtered_experiments(self.filters):
+            phase_list = app_inst.get_pipeline_phases(self.name, self.filters.phases)
+            if "get_inputs" not in phase_list:
+                continue
+
+            app_inst.add_expand_vars(self.workspace)
+            for name, fetcher, mirror_paths in app_inst.cachable_inputs():
+                inputs.setdefault(mirror_paths.storage_path, (name, fetcher, mirror_paths))
+
+        if inputs:
+            jobs = ramble.config.get("config:input_fetch_jobs", 4)
+            logger.msg(f"  Fetching {len(inputs)} inputs using up to {jobs} jobs")
+            ramble.stage.fetch_to_input_cache(list(inputs.values()), jobs=jobs)
+
+    def _set_up_environments(self):
+        """Set up the software environments of all experiments concurrently
+
+        Experiments are grouped by the software environment they use, and the
+        environment phases of their package managers are run for the first
+        experiment of each group, using up to config:software_install_jobs
+        threads. Each environment logs to its own file. When experiments are
+        processed afterwards, their environments are already set up.
+        """
+        jobs = ramble.config.get("config:software_install_jobs", 1)
+        if jobs <= 1:
+            return
+
+        environments = {}
+        for _, app_inst, _ in self._experiment_set.filtered_experiments(self.filters):
+            package_manager = app_inst.package_manager
+            if package_manager is None or not package_manager.environment_phases:
+                continue
+
+            phase_list = [
+                phase
+                for phase in app_inst.get_pipeline_phases(self.name, self.filters.phases)
+                if phase in package_manager.environment_phases
+            ]
+            if not phase_list:
+                continue
+
+            app_inst.add_expand_vars(self.workspace)
+            env_path = app_inst.expander.env_path
+            if env_path and env_path not in environments:
+                environments[env_path] = (app_inst, phase_list)
+
+        if len(environments) < 2:
+            return
+
+        fs.mkdirp(self.log_dir)
+        logger.all_msg(f"  Setting up {len(environments)} software environments using {jobs} jobs")
+
+        parent_logs = list(logger.log_stack)
+
+        def _set_up_environment(env_path, app_inst, phase_list):
+            parallel_phases = app_inst.package_manager.parallel_environment_phases
+            env_log_path = os.path.join(self.log_dir, f"software.{os.path.basename(env_path)}.out")
+            try:
+                with logger.thread_logs(parent_logs):
+                    logger.add_log(env_log_path)
+                    for phase in phase_list:
+                        guard = (
+                            nullcontext()
+                            if phase in parallel_phases
+                            else self.workspace.shared_resource_lock
+                        )
+                        with guard:
+                            app_inst.run_phase(self.name, phase, self.workspace)
+            except SystemExit as e:
+                raise _ExperimentExit(env_log_path, e.code)
+
+        tp = multiprocessing.pool.ThreadPool(processes=min(jobs, len(environments)))
+        try:
+            work = [(env_path, *env) for env_path, env in environments.items()]
+            for _ in tp.imap_unordered(llnl.util.lang.star(_set_up_environment), work):
+                pass
+        except _ExperimentExit as e:
+            logger.error(f"Setting up a software environment failed. See {e.exp} for details.")
+            raise SystemExit(e.code)
+        finally:
+            tp.terminate()
+            tp.join()
+
     def _complete(self):
         # Check if the selected phases require the inventory is successful
         if "write_inventory" in self.filters.phases or "*" in self.filters.phases:
@@ -499,6 +775,9 @@ class ExecutePipeline(Pipeline):
 
     name = "execute"
 
+    #: Name of the file job IDs of submitted experiments are written to
+    job_ids_file_name = "job_ids.json"
+
     def __init__(
         self,
         workspace,
@@ -506,6 +785,12 @@ class ExecutePipeline(Pipeline):
         executor="{batch_submit}",
         suppress_per_experiment_prints=True,
         suppress_run_header=False,
+        bulk=None,
+        submit_jobs=1,
+        submit_rate=0,
+        job_id_regex=None,
+        local=False,
+        local_cores=None,
     ):
         super().__init__(workspace, filters)
         self.action_string = "Executing"
@@ -513,13 +798,33 @@ class ExecutePipeline(Pipeline):
         self.executor = executor
         self.suppress_per_experiment_prints = suppress_per_experiment_prints
         self.suppress_run_header = suppress_run_header
+        self.bulk = bulk
+        self.submit_jobs = submit_jobs
+        self.submit_rate = submit_rate
+        # Job IDs are only recorded when requested, as capturing the output
+        # of executors stops it from streaming to the terminal.
+        if job_id_regex is None and bulk:
+            job_id_regex = ramble.util.submission.default_job_id_regex
+        self.job_id_regex = job_id_regex
+        self.job_ids = {}
+        self.local = local
+        self.local_cores = local_cores
 
     def _execute(self):
         super()._execute()
 
+        if self.local:
+            self._execute_local()
+            return
+
         if not self.suppress_run_header:
             logger.all_msg("Running executors...")
 
+        # Submissions are kept in the order of their first experiment. Each
+        # is either a single experiment's command, or a group of experiments
+        # sharing the executor and the scheduler directives of their scripts.
+        submissions = []
+        groups = {}
         for exp, app_inst, idx in self._experiment_set.filtered_experiments(self.filters):
             if app_inst.is_template:
                 logger.debug(f"{app_inst.name} is a template. Skipping execution.")
@@ -530,12 +835,238 @@ class ExecutePipeline(Pipeline):
 
             app_inst.add_expand_vars(self.workspace)
             exec_str = app_inst.expander.expand_var(self.executor)
-            exec_parts = shlex.split(exec_str)
-            exec_name = exec_parts[0]
-            exec_args = exec_parts[1:]
 
-            executor = Executable(exec_name)
-            executor(*exec_args)
+            command_template = self._bulk_command_template(exp, app_inst)
+            if command_template is None:
+                submissions.append((exec_str, [exp]))
+                continue
+
+            script = app_inst.expander.expand_var_name("execute_experiment")
+            directives = ramble.util.submission.script_directives(script)
+            group_key = (command_template, directives)
+            if group_key not in groups:
+                groups[group_key] = ramble.util.submission.SubmissionGroup(
+                    command_template, directives
+                )
+                submissions.append((groups[group_key], None))
+            groups[group_key].add(exp, script, exec_str)
+
+        submissions = self._write_bulk_submissions(submissions)
+        self._submit(submissions)
+
+    def _bulk_command_template(self, exp, app_inst):
+        """Expand the executor of an experiment for grouping bulk submissions
+
+        Returns:
+            (str): The executor, with the experiment's execute_experiment script
+                   (and array size) replaced by placeholders, or None if the
+                   experiment cannot be submitted in bulk
+        """
+        if not self.bulk:
+            return None
+
+        extra_vars = {"execute_experiment": ramble.util.submission.script_placeholder}
+        if self.bulk == "array":
+            extra_vars["array_size"] = ramble.util.submission.array_size_placeholder
+            extra_vars["array_max_index"] = ramble.util.submission.array_max_index_placeholder
+
+        command_template = app_inst.expander.expand_var(self.executor, extra_vars=extra_vars)
+
+        if ramble.util.submission.script_placeholder not in command_template:
+            logger.debug(
+                f"Executor of {exp} does not use execute_experiment. Submitting it on its own."
+            )
+            return None
+
+        if self.bulk == "array" and not (
+            ramble.util.submission.array_size_placeholder in command_template
+            or ramble.util.submission.array_max_index_placeholder in command_template
+        ):
+            logger.die(
+                f"The executor of {exp} does not define an array job. Array submissions "
+                "require an executor using {array_size} or {array_max_index}, such as:\n"
+                "    ramble on --bulk array --executor "
+                "'sbatch --array=0-{array_max_index} {execute_experiment}'"
+            )
+
+        return command_template
+
+    def _write_bulk_submissions(self, submissions):
+        """Write the manifests and drivers of bulk submission groups
+
+        Manifests of a single experiment are submitted with its own command.
+
+        Returns:
+            (list): Tuples of (command, experiments) for all submissions
+        """
+        bulk_dir = os.path.join(self.log_dir, "bulk")
+        resolved = []
+        for group_idx, (submission, exps) in enumerate(submissions):
+            if exps is not None:
+                resolved.append((submission, exps))
+            elif self.bulk == "manifest" and len(submission.experiments) == 1:
+                resolved.append((submission.commands[0], submission.experiments))
+            else:
+                fs.mkdirp(bulk_dir)
+                path = os.path.join(bulk_dir, f"submission_{group_idx}")
+                command = submission.write(path, self.bulk)
+                logger.msg(f"Submitting {len(submission.experiments)} experiments with: {command}")
+                resolved.append((command, submission.experiments))
+        return resolved
+
+    def _submit(self, submissions):
+        """Run submission commands, and record the job IDs they return
+
+        Up to submit_jobs commands run at the same time, and at most
+        submit_rate commands are started per second. The output of commands
+        is only captured (to extract job IDs from) when job_id_regex is set.
+
+        Args:
+            submissions (list): Tuples of (command, experiments) to submit
+        """
+        limiter = ramble.util.submission.RateLimiter(self.submit_rate)
+
+        def _run_submission(command):
+            limiter.wait()
+            exec_parts = shlex.split(command)
+            executor = Executable(exec_parts[0])
+            if self.job_id_regex is None:
+                return executor(*exec_parts[1:])
+            return executor(*exec_parts[1:], output=str)
+
+        commands = [command for command, _ in submissions]
+        if self.submit_jobs > 1 and len(commands) > 1:
+            tp = multiprocessing.pool.ThreadPool(processes=min(self.submit_jobs, len(commands)))
+            try:
+                outputs = tp.imap(_run_submission, commands)
+                self._record_job_ids(submissions, outputs)
+            finally:
+                tp.terminate()
+                tp.join()
+        else:
+            self._record_job_ids(submissions, map(_run_submission, commands))
+
+    def _record_job_ids(self, submissions, outputs):
+        """Print the outputs of submissions, and record the job IDs they contain
+
+        Job IDs are written to the job_ids.json file of this execution, and to
+        the workspace state database (if enabled).
+        """
+        if self.job_id_regex is None:
+            for _ in outputs:
+                pass
+            return
+
+        state_db = self.workspace.state_database
+        for (command, exps), output in zip(submissions, outputs):
+            if output:
+                logger.all_msg(output.rstrip("\n"))
+
+            job_id = ramble.util.submission.parse_job_id(output, self.job_id_regex)
+            if job_id is None:
+                continue
+
+            for exp_idx, exp in enumerate(exps):
+                job = {"job_id": job_id}
+                if self.bulk == "array" and len(exps) > 1:
+                    job["array_index"] = exp_idx
+                self.job_ids[exp] = job
+                if state_db is not None:
+                    state_db.set(exp, "job", job)
+
+        if self.job_ids:
+            fs.mkdirp(self.log_dir)
+            with open(os.path.join(self.log_dir, self.job_ids_file_name), "w+") as f:
+                sjson.dump(self.job_ids, f)
+
+    def _experiment_cores(self, app_inst):
+        """Number of cores an experiment occupies, from its n_ranks and n_threads"""
+        cores = 1
+        for var in (app_inst.keywords.n_ranks, app_inst.keywords.n_threads):
+            try:
+                cores *= max(1, int(app_inst.expander.expand_var_name(var)))
+            except (TypeError, ValueError):
+                pass
+        return cores
+
+    def _local_log_file(self, app_inst):
+        """Log file for the output of an experiment's script, in local runs
+
+        This is separate from the experiment's log file, which holds the log
+        of its execute phases.
+        """
+        return os.path.join(self.log_dir, f"{app_inst.expander.experiment_namespace}.run.out")
+
+    def _execute_local(self):
+        """Run experiments on this machine, instead of through the executor
+
+        Each experiment's execute_experiment script runs in its own process.
+        Experiments are packed against the available cores, using n_ranks *
+        n_threads cores each. The status of each experiment is set to RUNNING
+        when it starts, and to COMPLETE or FAILED from the exit code of its
+        script.
+        """
+        total_cores = self.local_cores or spack.util.cpus.cpus_available()
+
+        tasks = []
+        apps = {}
+        for exp, app_inst, idx in self._experiment_set.filtered_experiments(self.filters):
+            if app_inst.is_template:
+                logger.debug(f"{app_inst.name} is a template. Skipping execution.")
+                continue
+            if app_inst.repeats.is_repeat_base:
+                logger.debug(f"{app_inst.name} is a repeat base. Skipping execution.")
+                continue
+
+            app_inst.add_expand_vars(self.workspace)
+            cores = self._experiment_cores(app_inst)
+            if cores > total_cores:
+                logger.warn(
+                    f"{exp} requests {cores} cores, but only {total_cores} are available. "
+                    "Running it on its own."
+                )
+
+            script = app_inst.expander.expand_var_name("execute_experiment")
+            run_dir = app_inst.expander.expand_var_name(app_inst.keywords.experiment_run_dir)
+            apps[exp] = app_inst
+            tasks.append(
+                ramble.util.local_runner.LocalTask(
+                    exp, [script], run_dir, self._local_log_file(app_inst), cores
+                )
+            )
+
+        if not self.suppress_run_header:
+            logger.all_msg(f"Running {len(tasks)} experiments locally on {total_cores} cores...")
+
+        fs.mkdirp(self.log_dir)
+
+        def _start(task):
+            logger.msg(f"Starting {task.name} on {task.cores} cores")
+            apps[task.name].update_status(
+                self.workspace, ramble.application.experiment_status.RUNNING
+            )
+            self.workspace.flush_state()
+
+        def _complete(task):
+            if task.returncode == 0:
+                status = ramble.application.experiment_status.COMPLETE
+            else:
+                status = ramble.application.experiment_status.FAILED
+            logger.msg(f"{task.name} finished with exit code {task.returncode}")
+            apps[task.name].update_status(self.workspace, status)
+            self.workspace.flush_state()
+
+        ramble.util.local_runner.run_tasks(
+            tasks, total_cores, on_start=_start, on_complete=_complete
+        )
+
+        failed = [task for task in tasks if task.returncode != 0]
+        if failed:
+            failed_list = "\n".join(
+                f"    {task.name} (exit code {task.returncode}, log: {task.log_path})"
+                for task in failed
+            )
+            logger.die(f"{len(failed)} of {len(tasks)} experiments failed:\n{failed_list}")
 
 
 class PushDeploymentPipeline(Pipeline):
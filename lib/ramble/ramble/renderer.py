@@ -6,6 +6,7 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import functools
 import itertools
 
 import ramble.error
@@ -13,6 +14,7 @@ import ramble.expander
 import ramble.repeats
 from ramble.namespace import namespace
 
+import ramble.util.layered_dict
 import ramble.util.matrices
 from ramble.util.logger import logger
 
@@ -114,6 +116,45 @@ class RenderGroup:
 
 
 class Renderer:
+    def used_variable_candidates(self, render_group):
+        """Determine which variables can be affected by used variable tracking
+
+        When render_objects is called with ignore_used=True, the set of used
+        variables only changes the rendered objects through vector variables
+        and zips which are not consumed by a matrix. All other variables are
+        rendered identically regardless of whether they are used or not.
+
+        This function does not modify the render group.
+
+        Returns:
+            (set): Names of vector variables, zips, and zip members whose
+                   presence in used_variables can change the rendered objects
+        """
+        variables = render_group.variables
+        expander = ramble.expander.Expander(variables, None)
+
+        matrix_vars = set()
+        for matrix in render_group.matrices:
+            for unexpanded_var in matrix:
+                matrix_vars.add(expander.expand_var(unexpanded_var))
+
+        candidates = set()
+        zip_members = set()
+        for zip_group, group_def in render_group.zips.items():
+            members = set(expander.expand_var(var) for var in group_def)
+            zip_members.update(members)
+            if zip_group not in matrix_vars:
+                candidates.add(zip_group)
+                candidates.update(members)
+
+        for name, unexpanded in variables.items():
+            if name in matrix_vars or name in zip_members:
+                continue
+            if isinstance(expander.expand_lists(unexpanded), list):
+                candidates.add(name)
+
+        return candidates
+
     def render_objects(self, render_group, exclude_where=None, ignore_used=True, fatal=True):
         """Render objects based on the input variables and matrices
 
@@ -181,10 +222,9 @@ class Renderer:
                 for i, unexpanded_var in enumerate(group_def):
                     group_def[i] = expander.expand_var(unexpanded_var)
 
-        new_objects = []
         defined_zips = {}
         consumed_zips = set()
-        matrix_objects = []
+        matrix_objects = None
 
         if ignore_used:
             # Add variables / zips in matrices to used variables
@@ -362,26 +402,18 @@ class Renderer:
                 matrix_vectors.append(vectors)
                 matrix_variables.append(variable_names)
 
-            # Create the empty initial dictionairies
-            matrix_objects = []
-            for _ in range(matrix_size):
-                matrix_objects.append({})
-
-            # Generate all of the obj var dicts
-            for names, vectors in zip(matrix_variables, matrix_vectors):
-                for obj_idx, entry in enumerate(itertools.product(*vectors)):
-                    for name_idx, name in enumerate(names):
-                        if name in defined_zips.keys():
-                            # Replace the zip name with the constituent variables
-                            for zip_var in defined_zips[name]["vars"]:
-                                matrix_objects[obj_idx][zip_var] = defined_zips[name]["vars"][
-                                    zip_var
-                                ][entry[name_idx]]
-
+            if matrix_size > 0:
+                matrix_zips = {}
+                for names in matrix_variables:
+                    for name in names:
+                        if name in defined_zips:
+                            matrix_zips[name] = defined_zips[name]["vars"]
                             # Consume the defined zip
                             consumed_zips.add(name)
-                        else:
-                            matrix_objects[obj_idx][name] = entry[name_idx]
+
+                matrix_objects = functools.partial(
+                    _matrix_objects, matrix_variables, matrix_vectors, matrix_zips
+                )
 
         # Remove all consumed zips and return all remaining zipped variables
         # back to real vector definitions
@@ -402,7 +434,7 @@ class Renderer:
         max_vector_size = 0
         for var, val in object_variables.items():
             if isinstance(val, list) and (var in used_variables or not ignore_used):
-                vector_vars[var] = val.copy()
+                vector_vars[var] = val
                 max_vector_size = max(len(val), max_vector_size)
 
         if vector_vars:
@@ -422,42 +454,35 @@ class Renderer:
                     err_str += f"\tVariable {var} has length {len(val)}\n"
                 logger.die(err_str)
 
-            # Iterate over the vector length, and set the value in the
-            # object dict to the index value.
-            for i in range(0, max_vector_size):
-                obj_vars = {}
-                for var, val in vector_vars.items():
-                    if len(val) > i:
-                        obj_vars[var] = val[i]
-
-                if matrix_objects:
-                    for matrix_object in matrix_objects:
-                        for var, val in matrix_object.items():
-                            obj_vars[var] = val
-
-                        new_objects.append(obj_vars.copy())
-                else:
-                    new_objects.append(obj_vars.copy())
-
+            new_objects = _vector_objects(vector_vars, max_vector_size, matrix_objects)
         elif matrix_objects:
-            new_objects = matrix_objects
+            new_objects = matrix_objects()
         else:
             # Ensure at least one object is rendered, if everything was a scalar
-            new_objects.append({})
-
-        where_expander = ramble.expander.Expander(object_variables, None)
-
+            new_objects = [{}]
+
+        # Excludes are compiled once, and reused by all objects which give
+        # the same definitions to the variables they depend on.
+        exclude_predicates = []
+        if exclude_where:
+            exclude_predicates = [
+                ramble.expander.CompiledPredicate(where, strict=False) for where in exclude_where
+            ]
+
+        # Remaining definitions are shared by all objects. Each object only
+        # stores the definitions of its matrix and vector variables, and
+        # anything defined on it after it was rendered.
         for obj in new_objects:
             logger.debug(f"Rendering {render_group.object}:")
-            for var, val in obj.items():
-                object_variables[var] = val
+            rendered_variables = ramble.util.layered_dict.LayeredDict(object_variables, obj)
 
             keep_object = True
-            if exclude_where:
-                for where in exclude_where:
-                    evaluated = where_expander.expand_var(where)
-                    if evaluated == "True":
+            if exclude_predicates:
+                where_expander = ramble.expander.Expander(rendered_variables, None)
+                for predicate in exclude_predicates:
+                    if predicate(where_expander):
                         keep_object = False
+                        break
 
             if keep_object:
                 # If n_repeats is set, yield 1 base and n duplicate copies of each object
@@ -470,7 +495,62 @@ class Renderer:
                     elif n_repeats > 0 and n > 0:  # this is a repeat with index n
                         repeats.set_repeat_index(n)
                     # maybe yield a tuple of vars and repeat info
-                    yield object_variables.copy(), repeats
+                    yield rendered_variables.copy(), repeats
+
+
+def _matrix_objects(matrix_variables, matrix_vectors, matrix_zips):
+    """Lazily generate the variable definitions of each matrix element
+
+    Vectors in the same matrix are crossed, sibling matrices are zipped.
+
+    Args:
+        matrix_variables (list): Names of the variables and zips in each matrix
+        matrix_vectors (list): Vectors of each matrix. Zips are represented by
+                               a vector of their indices.
+        matrix_zips (dict): Variable definitions of the zips in all matrices
+
+    Yields:
+        (dict): Definitions of the matrix variables of one object
+    """
+    products = [itertools.product(*vectors) for vectors in matrix_vectors]
+    for entries in zip(*products):
+        obj_vars = {}
+        for names, entry in zip(matrix_variables, entries):
+            for name, val in zip(names, entry):
+                if name in matrix_zips:
+                    # Replace the zip name with the constituent variables
+                    for zip_var, zip_vals in matrix_zips[name].items():
+                        obj_vars[zip_var] = zip_vals[val]
+                else:
+                    obj_vars[name] = val
+        yield obj_vars
+
+
+def _vector_objects(vector_vars, vector_size, matrix_objects=None):
+    """Lazily generate the variable definitions of zipped vectors
+
+    The zipped vectors are crossed with the matrix elements, if any.
+
+    Args:
+        vector_vars (dict): Vector variables to zip
+        vector_size (int): Length of the longest vector
+        matrix_objects (func): Function returning a generator of matrix elements
+
+    Yields:
+        (dict): Definitions of the vector and matrix variables of one object
+    """
+    for i in range(0, vector_size):
+        obj_vars = {}
+        for var, val in vector_vars.items():
+            if len(val) > i:
+                obj_vars[var] = val[i]
+
+        if matrix_objects:
+            for matrix_object in matrix_objects():
+                obj_vars.update(matrix_object)
+                yield obj_vars.copy()
+        else:
+            yield obj_vars
 
 
 class RambleRendererError(ramble.error.RambleError):
@@ -12,6 +12,8 @@ from ramble.util.logger import logger
 class Repeats:
     """Class to represent configuration of experiment repeats"""
 
+    __slots__ = ("n_repeats", "is_repeat_base", "repeat_index")
+
     def __init__(self):
         """Constructor for a Repeats object
 
@@ -228,6 +228,11 @@ def get(spec, object_type=default_type):
     return paths[object_type].get(spec)
 
 
+def object_metadata(obj_name, object_type=default_type):
+    """Convenience wrapper around ``ramble.repository.object_metadata()``."""
+    return paths[object_type].object_metadata(obj_name)
+
+
 def set_path(repo, object_type=default_type):
     """Set the path singleton to a specific value.
 
@@ -450,19 +455,141 @@ class TagIndex(Mapping):
             index
 
         """
-        obj = paths[self.object_type].get(obj_name)
-
         # Remove the object from the list of objects, if present
         for obj_list in self._tag_dict.values():
             if obj_name in obj_list:
                 obj_list.remove(obj_name)
 
+        try:
+            obj = paths[self.object_type].get(obj_name)
+        except Exception as e:
+            # All indexes are built together, so an object which cannot be
+            # constructed must not prevent building the other indexes
+            logger.debug(f"Not indexing tags of {obj_name}: {e}")
+            return
+
         # Add it again under the appropriate tags
         for tag in getattr(obj, "tags", []):
             tag = tag.lower()
             self._tag_dict[tag].append(obj.name)
 
 
+#: Attributes summarized in the metadata index, besides the directive attributes
+_metadata_extra_attributes = [
+    "maintainers",
+    "tags",
+    "_pipelines",
+    "phase_definitions",
+    "shell_support_pattern",
+    "_default_usage_mode",
+]
+
+
+def _summarize_attribute(value):
+    """Summarize the value of an object attribute for the metadata index
+
+    Dictionaries are reduced to their keys (keeping the keys of nested
+    dictionaries), lists to the strings of their items, and all other values
+    to strings, keeping the truth value of the original value.
+    """
+    if isinstance(value, dict):
+        return {
+            str(key): list(val.keys()) if isinstance(val, dict) else None
+            for key, val in value.items()
+        }
+    if isinstance(value, list):
+        return [str(item) for item in value]
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value) if value else None
+
+
+class ObjectMetadata:
+    """Summary of an object, read from the metadata index of its repository
+
+    The summary has the name and description of the object, and the summary
+    of each of its attributes, allowing the object to be inspected without
+    importing its module.
+    """
+
+    def __init__(self, name, metadata):
+        self.name = name
+        self.__doc__ = metadata["description"]
+        for attr, value in metadata["attributes"].items():
+            setattr(self, attr, value)
+
+
+class MetadataIndex(Mapping):
+    """Maps object names to the description and attributes of the object."""
+
+    #: Version of the layout of the index, to be increased when it changes
+    index_format = 1
+
+    def __init__(self, object_type=default_type):
+        self.object_type = object_type
+        self._metadata = {}
+        self.version = self._current_version()
+
+    @classmethod
+    def _current_version(cls):
+        return f"{ramble.ramble_version}-{cls.index_format}"
+
+    def is_current(self):
+        """Whether this index was generated by this version of Ramble"""
+        return self.version == self._current_version()
+
+    def to_json(self, stream):
+        sjson.dump({"version": self.version, "objects": self._metadata}, stream)
+
+    @staticmethod
+    def from_json(stream, object_type):
+        d = sjson.load(stream)
+
+        r = MetadataIndex(object_type=object_type)
+        r.version = d.get("version")
+        r._metadata.update(d["objects"])
+
+        return r
+
+    def __getitem__(self, item):
+        return self._metadata[item]
+
+    def __iter__(self):
+        return iter(self._metadata)
+
+    def __len__(self):
+        return len(self._metadata)
+
+    def update_object(self, obj_name):
+        """Updates an object in the metadata index.
+
+        Args:
+            obj_name (str): name of the object to be updated in the index
+        """
+        # Objects are indexed by their name in the repository, which their
+        # name attribute might not match
+        name = obj_name.rpartition(".")[2]
+        self._metadata.pop(name, None)
+
+        try:
+            obj = paths[self.object_type].get(obj_name)
+        except Exception as e:
+            # Objects which cannot be constructed are loaded when requested,
+            # to report the error then
+            logger.debug(f"Not indexing {obj_name}: {e}")
+            return
+
+        attr_names = sorted(getattr(obj, "_directive_names", []))
+        attr_names.extend(_metadata_extra_attributes)
+
+        attributes = {}
+        for attr in attr_names:
+            if hasattr(obj, attr):
+                attributes[attr] = _summarize_attribute(getattr(obj, attr))
+
+        self._metadata[name] = {"description": obj.__doc__, "attributes": attributes}
+
+
 class Indexer(metaclass=abc.ABCMeta):
     """Adaptor for indexes that need to be generated when repos are updated."""
 
@@ -495,6 +622,15 @@ class Indexer(metaclass=abc.ABCMeta):
         """
         return False
 
+    def is_current(self):
+        """Whether the index can be used, or has to be regenerated for all objects.
+
+        Returns:
+            (bool): ``False`` if the index was generated in a way that is no
+                longer compatible, e.g. by another version of Ramble.
+        """
+        return True
+
     @abc.abstractmethod
     def read(self, stream):
         """Read this index from a provided file object."""
@@ -524,6 +660,25 @@ class TagIndexer(Indexer):
         self.index.to_json(stream)
 
 
+class MetadataIndexer(Indexer):
+    """Lifecycle methods for a MetadataIndex on a Repo."""
+
+    def _create(self):
+        return MetadataIndex(object_type=self.object_type)
+
+    def read(self, stream):
+        self.index = MetadataIndex.from_json(stream, self.object_type)
+
+    def is_current(self):
+        return self.index.is_current()
+
+    def update(self, obj_fullname):
+        self.index.update_object(obj_fullname)
+
+    def write(self, stream):
+        self.index.to_json(stream)
+
+
 class RepoIndex:
     """Container class that manages a set of Indexers for a Repo.
 
@@ -588,7 +743,8 @@ class RepoIndex:
         """Determine which objects need an update, and update indexes."""
 
         # Filename of the provider index cache (we assume they're all json)
-        cache_filename = f"{name}/{self.namespace}-index.json"
+        # Repos of different object types can share a namespace
+        cache_filename = f"{name}/{self.object_type.name}/{self.namespace}-index.json"
 
         # Compute which objects needs to be updated in the cache
         misc_cache = ramble.caches.misc_cache
@@ -602,16 +758,23 @@ class RepoIndex:
             with misc_cache.read_transaction(cache_filename) as f:
                 indexer.read(f)
 
-        else:
-            # Otherwise update it and rewrite the cache file
-            with misc_cache.write_transaction(cache_filename) as (old, new):
-                indexer.read(old) if old else indexer.create()
+            if indexer.is_current():
+                return indexer.index
 
-                for obj_name in needs_update:
-                    namespaced_name = f"{self.namespace}.{obj_name}"
-                    indexer.update(namespaced_name)
+        # Otherwise update it and rewrite the cache file
+        with misc_cache.write_transaction(cache_filename) as (old, new):
+            indexer.read(old) if old else indexer.create()
 
-                indexer.write(new)
+            # Outdated indexes are regenerated for all objects
+            if not indexer.is_current():
+                indexer.create()
+                needs_update = list(self.checker.keys())
+
+            for obj_name in needs_update:
+                namespaced_name = f"{self.namespace}.{obj_name}"
+                indexer.update(namespaced_name)
+
+            indexer.write(new)
 
         return indexer.index
 
@@ -821,6 +984,10 @@ class RepoPath:
         """Find a class for the spec's object and return the class object."""  # noqa: E501
         return self.repo_for_obj(obj_name).get_obj_class(obj_name)
 
+    def object_metadata(self, obj_name):
+        """Find the summary of an object in the metadata index of its repo."""
+        return self.repo_for_obj(obj_name).object_metadata(obj_name)
+
     @autospec
     def dump_provenance(self, spec, path):
         """Dump provenance information for a spec to a particular path.
@@ -1140,6 +1307,7 @@ class Repo:
         if self._repo_index is None:
             self._repo_index = RepoIndex(self._obj_checker, self.namespace, self.object_type)
             self._repo_index.add_indexer("tags", TagIndexer(self.object_type))
+            self._repo_index.add_indexer("metadata", MetadataIndexer(self.object_type))
         return self._repo_index
 
     @property
@@ -1147,6 +1315,33 @@ class Repo:
         """Index of tags and which objects they're defined on."""
         return self.index["tags"]
 
+    @property
+    def metadata_index(self):
+        """Index of the description and attributes of each object."""
+        return self.index["metadata"]
+
+    def object_metadata(self, obj_name):
+        """Get the summary of an object from the metadata index.
+
+        Unlike get(), this does not import the module of the object, unless
+        the index needs to be updated. Objects which could not be indexed are
+        returned as they are by get().
+        """
+        namespace, _, obj_name = obj_name.rpartition(".")
+        if namespace and (namespace != self.namespace):
+            raise InvalidNamespaceError(
+                f"Invalid namespace for {self.namespace} repo: {namespace}"
+            )
+
+        if not self.exists(obj_name):
+            raise UnknownObjectError(obj_name, self)
+
+        metadata = self.metadata_index.get(obj_name)
+        if metadata is None:
+            # The object could not be indexed, load it to get its attributes
+            return self.get(obj_name)
+        return ObjectMetadata(obj_name, metadata)
+
     def dirname_for_object_name(self, obj_name):
         """Get the directory name for a particular object.  This is the
         directory that contains its object.py file."""
@@ -132,6 +132,10 @@ properties["config"]["pip"] = {
 
 properties["config"]["input_cache"] = {"type": "string", "default": "$ramble/var/ramble/cache"}
 
+properties["config"]["input_fetch_jobs"] = {"type": "integer", "minimum": 1, "default": 4}
+
+properties["config"]["software_install_jobs"] = {"type": "integer", "minimum": 1, "default": 1}
+
 properties["config"]["workspace_dirs"] = {
     "type": "string",
     "default": "$ramble/var/ramble/workspaces",
@@ -157,6 +161,8 @@ properties["config"]["n_repeats"] = {"type": "string", "default": "0"}
 
 properties["config"]["repeat_success_strict"] = {"type": "boolean", "default": True}
 
+properties["config"]["state_database"] = {"type": "boolean", "default": False}
+
 
 #: Full schema with metadata
 schema = {
@@ -6,6 +6,8 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import re
+import string
 from collections import defaultdict
 
 import ramble.repository
@@ -35,9 +37,96 @@ def _is_dict_empty(rendered: defaultdict):
     return True
 
 
+#: Characters which can change the literal text of a template name when it is
+#: expanded. Names containing them are never excluded by a TemplateIndex.
+_unindexable_chars = frozenset("\\()'\"" + string.whitespace)
+
+
+def _may_be_evaluated(name: str) -> bool:
+    """Whether a name might be the result of evaluating math in a template name"""
+    if name in ("True", "False") or name.startswith("["):
+        return True
+    try:
+        complex(name)
+    except ValueError:
+        return False
+    return True
+
+
+def _template_pattern(name: str):
+    """Compile a pattern matching every name a template name can expand to"""
+    parts = []
+    for part in ramble.expander.compile_template(name).parts:
+        if isinstance(part, str):
+            parts.append(re.escape(part))
+        else:
+            parts.append(".*")
+    return re.compile("".join(parts), re.DOTALL)
+
+
+class TemplateIndex:
+    """Index of template names by the names they can expand to
+
+    Literal template names are indexed by their expansion, and parameterized
+    template names are matched with a pattern built from their literal text.
+    The index only narrows down the templates which can expand to a name, so
+    candidates still need to be expanded to check if they match.
+    """
+
+    def __init__(self, template_names):
+        """TemplateIndex constructor
+
+        Args:
+            template_names (iterable): Template names to index
+        """
+        self._order = {}
+        self._literal_names = []
+        self._literal_index = None
+        self._patterns = []
+        self._unindexed = []
+
+        for template_name in template_names:
+            self._order[template_name] = len(self._order)
+            if not _unindexable_chars.isdisjoint(template_name):
+                self._unindexed.append(template_name)
+            elif "{" in template_name or "}" in template_name:
+                self._patterns.append((template_name, _template_pattern(template_name)))
+            else:
+                self._literal_names.append(template_name)
+
+    def candidates(self, name: str, expander: object):
+        """Template names which might expand to a name
+
+        Args:
+            name (str): Expanded name to find templates for
+            expander (Expander): Expander the templates are expanded with
+
+        Returns:
+            (list): Candidate template names, in the order they were defined
+        """
+        if self._literal_index is None:
+            # Literal names do not reference any variables, so they expand the
+            # same way with every expander.
+            self._literal_index = defaultdict(list)
+            for template_name in self._literal_names:
+                self._literal_index[expander.expand_var(template_name)].append(template_name)
+
+        candidates = list(self._literal_index.get(name, []))
+        match_all = _may_be_evaluated(name)
+        for template_name, pattern in self._patterns:
+            if match_all or pattern.fullmatch(name):
+                candidates.append(template_name)
+        candidates.extend(self._unindexed)
+
+        candidates.sort(key=self._order.get)
+        return candidates
+
+
 class SoftwarePackage:
     """Class to represent a single software package"""
 
+    __slots__ = ("name", "pkg_info", "_package_type")
+
     def __init__(
         self,
         name: str,
@@ -117,6 +206,8 @@ class SoftwarePackage:
 class RenderedPackage(SoftwarePackage):
     """Class representing an already rendered software package"""
 
+    __slots__ = ("package_manager", "spec", "compiler", "compiler_spec")
+
     def __init__(
         self,
         name: str,
@@ -193,6 +284,8 @@ class RenderedPackage(SoftwarePackage):
 class TemplatePackage(SoftwarePackage):
     """Class representing a template software package"""
 
+    __slots__ = ("_rendered_packages",)
+
     def __init__(
         self,
         name: str,
@@ -439,13 +532,16 @@ class TemplateEnvironment(SoftwareEnvironment):
         all_package_templates: dict,
         all_packages: dict,
         package_manager: PackageManagerBase,
+        package_index: TemplateIndex = None,
     ):
         """Render a SoftwareEnvironment from this TemplateEnvironment
 
         Args:
             expander (Expander): Expander object to use when rendering
+            all_package_templates (dict): All package templates
             all_packages (dict): All package definitions
             package_manager (PackageManagerBase): Package manager the environment is rendered with
+            package_index (TemplateIndex): Index of all_package_templates
 
         Returns:
             (RenderedEnvironment) Reference to the rendered SoftwareEnvironment
@@ -453,6 +549,9 @@ class TemplateEnvironment(SoftwareEnvironment):
         name = expander.expand_var(self.name)
         pm_name = package_manager.name
 
+        if package_index is None:
+            package_index = TemplateIndex(all_package_templates)
+
         new_env = RenderedEnvironment(name, package_manager)
 
         for env_pkg_template in self._package_names:
@@ -460,7 +559,11 @@ class TemplateEnvironment(SoftwareEnvironment):
 
             if rendered_env_pkg_name:
                 added = False
-                for template_pkg in all_package_templates.values():
+                for template_name in package_index.candidates(rendered_env_pkg_name, expander):
+                    template_pkg = all_package_templates[template_name]
+                    if expander.expand_var(template_name) != rendered_env_pkg_name:
+                        continue
+
                     rendered_pkg = template_pkg.render_package(expander, package_manager)
 
                     if rendered_env_pkg_name == rendered_pkg.name:
@@ -525,8 +628,16 @@ class SoftwareEnvironments:
         self._rendered_packages = defaultdict(dict)
         self._rendered_environments = defaultdict(dict)
 
+        # Rendered environments by (template name, package manager name), then
+        # by the names of the variables rendering them consumed, then by the
+        # definitions of those variables.
+        self._environment_cache = defaultdict(dict)
+
         self._define_templates()
 
+        self._environment_index = TemplateIndex(self._environment_templates)
+        self._package_index = TemplateIndex(self._package_templates)
+
     def info(self, indent: int = 0, verbosity: int = 0, color_level: int = 0):
         """Information for all packages and environments
 
@@ -613,7 +724,8 @@ class SoftwareEnvironments:
                 cur_compiler = pkg.compiler
                 while cur_compiler and cur_compiler not in self._rendered_packages[pm_name]:
                     added = False
-                    for template_name, template_def in self._package_templates.items():
+                    for template_name in self._package_index.candidates(cur_compiler, expander):
+                        template_def = self._package_templates[template_name]
                         rendered_name = expander.expand_var(template_name)
 
                         if rendered_name == cur_compiler:
@@ -731,6 +843,51 @@ class SoftwareEnvironments:
                 logger.warn(f"    Package: {pkg_name}, Compiler: {comp_name}")
             logger.warn("This might cause problems when installing the packages.")
 
+    def _cached_environment(self, cache_key: tuple, expander: object):
+        """Find a previously rendered environment the expander would render again
+
+        Rendered environments are reused when all variables consumed while
+        rendering them have the same definitions in the expander. Those
+        variables are marked as used in the expander, as rendering the
+        environment would have.
+
+        Args:
+            cache_key (tuple): Environment template and package manager names
+            expander (Expander): Expander object from the experiment
+
+        Returns:
+            (RenderedEnvironment): The environment, or None if it was not rendered yet
+        """
+        for var_names, environments in self._environment_cache[cache_key].items():
+            try:
+                rendered_env = environments.get(expander.dependency_key(var_names))
+            except TypeError:
+                # Variables with unhashable definitions are never cached
+                continue
+            if rendered_env is not None:
+                expander.mark_used(var_names)
+                return rendered_env
+        return None
+
+    def _cache_environment(
+        self, cache_key: tuple, expander: object, dependencies: object, rendered_env: object
+    ):
+        """Store a rendered environment for reuse by later experiments
+
+        Args:
+            cache_key (tuple): Environment template and package manager names
+            expander (Expander): Expander the environment was rendered with
+            dependencies (VariableDependencies): Variables consumed while rendering
+            rendered_env (RenderedEnvironment): The rendered environment
+        """
+        var_names = tuple(sorted(dependencies.variables))
+        try:
+            definitions = expander.dependency_key(var_names)
+            hash(definitions)
+        except TypeError:
+            return
+        self._environment_cache[cache_key].setdefault(var_names, {})[definitions] = rendered_env
+
     def render_environment(
         self, env_name: str, expander: object, package_manager: PackageManagerBase, require=True
     ):
@@ -758,27 +915,45 @@ class SoftwareEnvironments:
             if isinstance(self._rendered_environments[pm_name][env_name], ExternalEnvironment):
                 return self._rendered_environments[pm_name][env_name]
 
-        for template_name, template_def in self._environment_templates.items():
+        for template_name in self._environment_index.candidates(env_name, expander):
+            template_def = self._environment_templates[template_name]
             rendered_name = expander.expand_var(template_name)
             if rendered_name == env_name:
-                rendered_env = template_def.render_environment(
-                    expander, self._package_templates, self._rendered_packages, package_manager
-                )
-
-                if rendered_env.name == env_name:
-                    if env_name in self._rendered_environments[pm_name]:
-                        if rendered_env != self._rendered_environments[pm_name][env_name]:
-                            raise RambleSoftwareEnvironmentError(
-                                f"Environment {env_name} defined multiple times "
-                                "in inconsistent ways"
-                            )
-                        rendered_env = self._rendered_environments[pm_name][env_name]
+                cache_key = (template_name, pm_name)
+                rendered_env = self._cached_environment(cache_key, expander)
+                if rendered_env is not None:
+                    return rendered_env
 
-                    template_def.add_rendered_environment(
-                        rendered_env, self._rendered_environments, self._rendered_packages, pm_name
+                with expander.track_dependencies() as dependencies:
+                    rendered_env = template_def.render_environment(
+                        expander,
+                        self._package_templates,
+                        self._rendered_packages,
+                        package_manager,
+                        package_index=self._package_index,
                     )
-                    self.define_compiler_packages(rendered_env, expander)
+
+                    if rendered_env.name == env_name:
+                        if env_name in self._rendered_environments[pm_name]:
+                            if rendered_env != self._rendered_environments[pm_name][env_name]:
+                                raise RambleSoftwareEnvironmentError(
+                                    f"Environment {env_name} defined multiple times "
+                                    "in inconsistent ways"
+                                )
+                            rendered_env = self._rendered_environments[pm_name][env_name]
+
+                        template_def.add_rendered_environment(
+                            rendered_env,
+                            self._rendered_environments,
+                            self._rendered_packages,
+                            pm_name,
+                        )
+                        self.define_compiler_packages(rendered_env, expander)
+
+                if rendered_env.name == env_name:
                     self._check_environment(rendered_env)
+                    if dependencies.cacheable:
+                        self._cache_environment(cache_key, expander, dependencies, rendered_env)
                     return rendered_env
 
         if require:
@@ -7,14 +7,17 @@
 # except according to those terms.
 
 
+import copy
 import errno
 import getpass
 import glob
 import hashlib
+import multiprocessing.pool
 import os
 import shutil
 import stat
 import sys
+import tempfile
 
 import llnl.util.lang
 import llnl.util.tty as tty
@@ -805,6 +808,50 @@ def ensure_access(file):
         logger.die(f"Insufficient permissions for {file}")
 
 
+def fetch_to_input_cache(inputs, jobs=1):
+    """Fetch inputs into the input cache, concurrently.
+
+    Each input is stored in the input cache under its checksum, so stages can
+    later link it from the cache instead of downloading it. Inputs which are
+    already cached are skipped. Inputs which fail to fetch are only reported,
+    so stages can retry them and raise their errors.
+
+    Args:
+        inputs (list): (name, fetcher, mirror_paths) of each input to fetch.
+            Fetchers need a checksum to be cached.
+        jobs (int): Maximum number of inputs to fetch at once
+    """
+    cache_root = ramble.caches.fetch_cache.root
+
+    def _fetch(name, fetcher, mirror_paths):
+        if os.path.isfile(os.path.join(cache_root, mirror_paths.storage_path)):
+            return
+
+        # Stages set themselves on their fetcher, so use a copy of it
+        fetcher = copy.copy(fetcher)
+        mkdirp(cache_root)
+        stage_path = tempfile.mkdtemp(prefix=".stage-", dir=cache_root)
+        try:
+            stage = InputStage(
+                fetcher, name=name, path=stage_path, mirror_paths=mirror_paths, lock=False
+            )
+            stage.fetch()
+            stage.check()
+            stage.cache_local()
+        except ramble.error.RambleError as e:
+            logger.warn(f"Unable to fetch input {name} into the input cache: {str(e)}")
+        finally:
+            shutil.rmtree(stage_path, ignore_errors=True)
+
+    tp = multiprocessing.pool.ThreadPool(processes=max(1, min(jobs, len(inputs))))
+    try:
+        for _ in tp.imap_unordered(llnl.util.lang.star(_fetch), inputs):
+            pass
+    finally:
+        tp.terminate()
+        tp.join()
+
+
 # TODO (dwj): Need to add checksums for inputs.
 def get_checksums_for_versions(
     url_dict, name, first_stage_function=None, keep_stage=False, fetch_options=None, batch=False
@@ -358,6 +358,31 @@ def test_set_input_path_multi_input(mutable_mock_apps_repo):
     assert executable_application_instance.variables["test-input3"] == input3_path
 
 
+def test_cachable_inputs_skip_staged(mutable_mock_apps_repo, tmpdir):
+    """cachable_inputs skips inputs already staged in the workspace"""
+
+    app_inst = mutable_mock_apps_repo.get("input-test")
+
+    input_names = ["archived", "expanded", "missing"]
+    for name in input_names:
+        app_inst.input_file(
+            name, url=f"file://{tmpdir}/{name}.tar.gz", sha256="0" * 64, description="Test"
+        )
+    app_inst.workload("cached", executables=["test"], inputs=input_names)
+
+    input_dir = tmpdir.join("inputs")
+    expansion_vars = basic_exp_dict()
+    expansion_vars["workload_name"] = "cached"
+    expansion_vars["workload_input_dir"] = str(input_dir)
+    app_inst.expander = ramble.expander.Expander(expansion_vars, None)
+
+    input_dir.ensure("archived.tar.gz")
+    input_dir.ensure("expanded", dir=True)
+
+    urls = [fetcher.url for _, fetcher, _ in app_inst.cachable_inputs()]
+    assert urls == [f"file://{tmpdir}/missing.tar.gz"]
+
+
 def test_set_default_experiment_variables(mutable_mock_apps_repo):
     """_set_default_experiment_variables"""
 
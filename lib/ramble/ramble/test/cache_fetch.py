@@ -13,8 +13,13 @@ import pytest
 
 from llnl.util.filesystem import mkdirp, touch
 
+import ramble.caches
 import ramble.config
-from ramble.fetch_strategy import CacheURLFetchStrategy, NoCacheError
+import ramble.fetch_strategy
+import ramble.mirror
+import ramble.stage
+import ramble.util.hashing
+from ramble.fetch_strategy import CacheURLFetchStrategy, ChecksumError, NoCacheError
 from ramble.stage import InputStage
 
 is_windows = sys.platform == "win32"
@@ -50,3 +55,59 @@ def test_fetch(tmpdir, _fetch_method):
             source_path = stage.source_path
             mkdirp(source_path)
             fetcher.fetch()
+
+
+def test_fetch_links_cached_archive(tmpdir):
+    """Ensure cached archives are linked into stages, and checked"""
+    cache = tmpdir.join("cache.tar.gz")
+    cache.write("cached input")
+    digest = ramble.util.hashing.hash_file(str(cache))
+
+    fetcher = CacheURLFetchStrategy(url=f"file://{cache}", sha256=digest)
+    stage_path = str(tmpdir.join("stage"))
+    with InputStage(fetcher, name="test_fetch_links_cached_archive", path=stage_path) as stage:
+        fetcher.fetch()
+        assert os.path.samefile(stage.archive_file, str(cache))
+        fetcher.check()
+
+    fetcher = CacheURLFetchStrategy(url=f"file://{cache}", sha256="0" * 64)
+    with InputStage(fetcher, name="test_fetch_links_cached_archive", path=stage_path):
+        with pytest.raises(ChecksumError):
+            fetcher.fetch()
+
+
+@pytest.mark.skipif(is_windows, reason="file:// paths differ on Windows")
+def test_fetch_to_input_cache(tmpdir, monkeypatch):
+    """Ensure inputs are fetched into the input cache once"""
+    cache = ramble.fetch_strategy.FsCache(str(tmpdir.join("cache")))
+    monkeypatch.setattr(ramble.caches, "fetch_cache", cache)
+
+    inputs = []
+    for name, contents in [("a", "input a"), ("b", "input b"), ("c", "input a")]:
+        input_file = tmpdir.join(f"{name}.tar.gz")
+        input_file.write(contents)
+        fetcher = ramble.fetch_strategy.URLFetchStrategy(
+            url=f"file://{input_file}", sha256=ramble.util.hashing.hash_file(str(input_file))
+        )
+        mirror_paths = ramble.mirror.mirror_archive_paths(fetcher, f"app/{name}")
+        inputs.append((f"app.{name}", fetcher, mirror_paths))
+
+    bad_file = tmpdir.join("bad.tar.gz")
+    bad_file.write("bad input")
+    bad_fetcher = ramble.fetch_strategy.URLFetchStrategy(url=f"file://{bad_file}", sha256="0" * 64)
+    bad_paths = ramble.mirror.mirror_archive_paths(bad_fetcher, "app/bad")
+    inputs.append(("app.bad", bad_fetcher, bad_paths))
+
+    ramble.stage.fetch_to_input_cache(inputs, jobs=2)
+
+    cached = [os.path.join(cache.root, paths.storage_path) for _, _, paths in inputs]
+    assert cached[0] == cached[2]
+    assert open(cached[0]).read() == "input a"
+    assert open(cached[1]).read() == "input b"
+    assert not os.path.exists(cached[3])
+    assert sorted(os.listdir(cache.root)) == ["_input-cache"]
+
+    # Cached inputs are not fetched again
+    tmpdir.join("a.tar.gz").remove()
+    ramble.stage.fetch_to_input_cache(inputs[:1], jobs=2)
+    assert open(cached[0]).read() == "input a"
@@ -6,6 +6,7 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import ramble.cmd.debug
 from ramble.main import RambleCommand
 
 debug = RambleCommand("debug")
@@ -17,3 +18,31 @@ def test_debug_report():
     assert "* **Ramble:**" in output
     assert "* **Python:**" in output
     assert "* **Platform:**" in output
+
+
+def test_parse_import_times():
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     _io",
+        "import time:      1500 |       2500 |   ramble.main",
+        "==> Error: not an import time",
+    ]
+
+    assert ramble.cmd.debug.parse_import_times(lines) == [
+        ("_io", 120, 120),
+        ("ramble.main", 1500, 2500),
+    ]
+
+
+def test_debug_startup_profile():
+    output = debug("startup-profile", "-n", "5", "--", "--version")
+
+    assert "Command: ramble --version" in output
+    assert "Exit code: 0" in output
+    assert "Wall time:" in output
+    assert "ramble.main" in output
+
+    output = debug("startup-profile", "-n", "5", "help")
+
+    assert "Command: ramble help" in output
+    assert "Exit code: 0" in output
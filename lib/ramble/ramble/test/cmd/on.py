@@ -7,6 +7,7 @@
 # except according to those terms.
 
 import os
+import time
 
 import pytest
 
@@ -14,6 +15,8 @@ import ramble.workspace
 import ramble.test.cmd.workspace
 import ramble.pipeline
 import ramble.filters
+import ramble.util.local_runner
+import ramble.util.submission
 from ramble.main import RambleCommand
 
 # everything here uses the mock_workspace_path
@@ -89,3 +92,260 @@ def test_on_executor(mutable_mock_workspace_path):
         assert os.path.exists(ws.root + "/all_experiments")
 
         on("--executor", 'echo "Index = {experiment_index}"', global_args=["-w", ws_name])
+
+
+def _setup_vector_workspace(ws_name):
+    test_config = """
+ramble:
+  variables:
+    mpi_command: 'mpirun -n {n_ranks} -ppn {processes_per_node}'
+    batch_submit: 'batch_submit {execute_experiment}'
+    processes_per_node: '2'
+    n_ranks: '{processes_per_node}*{n_nodes}'
+  applications:
+    basic:
+      workloads:
+        test_wl:
+          experiments:
+            exp_{n_nodes}:
+              variables:
+                n_nodes: [1, 2, 3]
+  software:
+    packages: {}
+    environments: {}
+"""
+    ws = ramble.workspace.create(ws_name)
+    ws.write()
+
+    with open(os.path.join(ws.config_dir, ramble.workspace.config_file_name), "w+") as f:
+        f.write(test_config)
+    ws._re_read()
+
+    workspace("setup", "--dry-run", global_args=["-w", ws_name])
+    return ws
+
+
+@pytest.mark.parametrize("bulk", ["manifest", "array"])
+def test_execute_pipeline_bulk(mutable_mock_workspace_path, bulk):
+    ws_name = "test_bulk"
+    _setup_vector_workspace(ws_name)
+
+    execute_pipeline_class = ramble.pipeline.pipeline_class(ramble.pipeline.pipelines.execute)
+    filters = ramble.filters.Filters()
+
+    with ramble.workspace.read(ws_name) as ws:
+        executor = "echo Submitted batch job 42 {array_size} {execute_experiment}"
+        execute_pipeline = execute_pipeline_class(
+            ws, filters, executor=executor, bulk=bulk, submit_jobs=2, submit_rate=100
+        )
+        execute_pipeline.run()
+
+        bulk_dir = os.path.join(execute_pipeline.log_dir, "bulk")
+        with open(os.path.join(bulk_dir, "submission_0.manifest")) as f:
+            scripts = f.read().splitlines()
+        assert len(scripts) == 3
+        assert all(script.endswith("execute_experiment") for script in scripts)
+        assert os.access(os.path.join(bulk_dir, "submission_0.sh"), os.X_OK)
+
+        job_ids = execute_pipeline.job_ids
+        assert sorted(job_ids.keys()) == [f"basic.test_wl.exp_{n}" for n in range(1, 4)]
+        assert all(job["job_id"] == "42" for job in job_ids.values())
+        if bulk == "array":
+            assert [job_ids[f"basic.test_wl.exp_{n}"]["array_index"] for n in range(1, 4)] == [
+                0,
+                1,
+                2,
+            ]
+        assert os.path.exists(
+            os.path.join(execute_pipeline.log_dir, execute_pipeline.job_ids_file_name)
+        )
+
+
+def test_execute_pipeline_bulk_directives(mutable_mock_workspace_path):
+    ws_name = "test_bulk_directives"
+    _setup_vector_workspace(ws_name)
+
+    execute_pipeline_class = ramble.pipeline.pipeline_class(ramble.pipeline.pipelines.execute)
+    filters = ramble.filters.Filters()
+
+    with ramble.workspace.read(ws_name) as ws:
+        for n_nodes in range(1, 4):
+            script = os.path.join(
+                ws.experiment_dir, "basic", "test_wl", f"exp_{n_nodes}", "execute_experiment"
+            )
+            with open(script, "w+") as f:
+                f.write(
+                    "#!/bin/bash\n"
+                    f"#SBATCH -N {1 if n_nodes != 2 else 2}\n"
+                    "#SBATCH -p debug\n"
+                    "\n"
+                    "# Comment\n"
+                    "echo run\n"
+                    "#SBATCH --ignored\n"
+                )
+
+        executor = "echo Submitted batch job 42 {array_size} {execute_experiment}"
+        execute_pipeline = execute_pipeline_class(ws, filters, executor=executor, bulk="array")
+        execute_pipeline.run()
+
+        # exp_1 and exp_3 request the same resources, and are submitted together
+        bulk_dir = os.path.join(execute_pipeline.log_dir, "bulk")
+        with open(os.path.join(bulk_dir, "submission_0.manifest")) as f:
+            scripts = f.read().splitlines()
+        assert [os.path.basename(os.path.dirname(script)) for script in scripts] == [
+            "exp_1",
+            "exp_3",
+        ]
+        with open(os.path.join(bulk_dir, "submission_0.sh")) as f:
+            driver = f.read().splitlines()
+        assert driver[1:3] == ["#SBATCH -N 1", "#SBATCH -p debug"]
+        assert "#SBATCH --ignored" not in driver
+
+        with open(os.path.join(bulk_dir, "submission_1.sh")) as f:
+            assert "#SBATCH -N 2" in f.read().splitlines()
+
+
+def test_execute_pipeline_only_records_requested_job_ids(mutable_mock_workspace_path):
+    ws_name = "test_no_job_ids"
+    _setup_vector_workspace(ws_name)
+
+    execute_pipeline_class = ramble.pipeline.pipeline_class(ramble.pipeline.pipelines.execute)
+    filters = ramble.filters.Filters()
+
+    with ramble.workspace.read(ws_name) as ws:
+        executor = 'echo "Index = {experiment_index}"'
+        execute_pipeline = execute_pipeline_class(ws, filters, executor=executor)
+        execute_pipeline.run()
+        assert not execute_pipeline.job_ids
+        assert not os.path.exists(
+            os.path.join(execute_pipeline.log_dir, execute_pipeline.job_ids_file_name)
+        )
+
+        execute_pipeline = execute_pipeline_class(
+            ws, filters, executor=executor, job_id_regex=r"Index = (\d+)"
+        )
+        execute_pipeline.run()
+        assert sorted(job["job_id"] for job in execute_pipeline.job_ids.values()) == [
+            "1",
+            "2",
+            "3",
+        ]
+
+
+def test_on_array_requires_array_executor(mutable_mock_workspace_path):
+    ws_name = "test_bulk_array"
+    _setup_vector_workspace(ws_name)
+
+    output = on(
+        "--bulk",
+        "array",
+        "--executor",
+        "echo {execute_experiment}",
+        global_args=["-w", ws_name],
+        fail_on_error=False,
+    )
+    assert "Array submissions require an executor" in output
+
+
+def test_execute_pipeline_local(mutable_mock_workspace_path):
+    ws_name = "test_local"
+    _setup_vector_workspace(ws_name)
+
+    execute_pipeline_class = ramble.pipeline.pipeline_class(ramble.pipeline.pipelines.execute)
+    filters = ramble.filters.Filters()
+
+    with ramble.workspace.read(ws_name) as ws:
+        run_dirs = {}
+        for n_nodes in range(1, 4):
+            run_dir = os.path.join(ws.experiment_dir, "basic", "test_wl", f"exp_{n_nodes}")
+            run_dirs[n_nodes] = run_dir
+            exit_code = 1 if n_nodes == 2 else 0
+            script = os.path.join(run_dir, "execute_experiment")
+            with open(script, "w+") as f:
+                f.write(f"#!/bin/sh\necho running {n_nodes}\nexit {exit_code}\n")
+            os.chmod(script, 0o755)
+
+        execute_pipeline = execute_pipeline_class(ws, filters, local=True, local_cores=4)
+        with pytest.raises(SystemExit):
+            execute_pipeline.run()
+
+        for n_nodes, status in [(1, "COMPLETE"), (2, "FAILED"), (3, "COMPLETE")]:
+            with open(os.path.join(run_dirs[n_nodes], "ramble_status.json")) as f:
+                assert f'"{status}"' in f.read()
+
+            log_file = os.path.join(
+                execute_pipeline.log_dir, f"basic.test_wl.exp_{n_nodes}.run.out"
+            )
+            with open(log_file) as f:
+                assert f"running {n_nodes}" in f.read()
+
+            # The log of the execute phases is kept
+            log_file = os.path.join(execute_pipeline.log_dir, f"basic.test_wl.exp_{n_nodes}.out")
+            assert os.path.exists(log_file)
+            with open(log_file) as f:
+                assert f"running {n_nodes}" not in f.read()
+
+
+def test_local_runner_packs_tasks(tmpdir):
+    tasks = [
+        ramble.util.local_runner.LocalTask(
+            name, ["sleep", "0.2"], str(tmpdir), str(tmpdir.join(f"{name}.out")), cores
+        )
+        for name, cores in [("a", 3), ("b", 2), ("c", 1), ("d", 8)]
+    ]
+
+    running = set()
+    overlaps = []
+
+    def _start(task):
+        running.add(task.name)
+        overlaps.append(set(running))
+
+    ramble.util.local_runner.run_tasks(
+        tasks, 4, on_start=_start, on_complete=lambda task: running.discard(task.name)
+    )
+
+    # c backfills alongside a, and d (clamped to all cores) runs on its own
+    assert {"a", "c"} in overlaps
+    assert {"d"} in overlaps
+    assert all(len(names) == 1 for names in overlaps if "d" in names)
+    assert all(task.returncode == 0 for task in tasks)
+
+
+def test_local_runner_kills_processes_on_error(tmpdir):
+    tasks = [
+        ramble.util.local_runner.LocalTask(
+            name, ["sleep", "60"], str(tmpdir), str(tmpdir.join(f"{name}.out"))
+        )
+        for name in ["a", "b"]
+    ]
+
+    def _start(task):
+        if task.name == "b":
+            raise KeyboardInterrupt()
+
+    start = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        ramble.util.local_runner.run_tasks(tasks, 2, on_start=_start)
+    assert time.monotonic() - start < 30
+
+
+def test_submission_rate_limiter():
+    limiter = ramble.util.submission.RateLimiter(rate=50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.wait()
+    assert time.monotonic() - start >= 0.1
+
+
+@pytest.mark.parametrize(
+    "output,job_id",
+    [
+        ("Submitted batch job 1234\n", "1234"),
+        ("5678.pbs-server\n", "5678"),
+        ("Job <910> is submitted to queue <normal>.\n", "910"),
+        ("", None),
+    ],
+)
+def test_parse_job_id(output, job_id):
+    assert ramble.util.submission.parse_job_id(output) == job_id
@@ -8,6 +8,7 @@
 
 import os
 import glob
+import time
 
 import pytest
 
@@ -122,10 +123,12 @@ def check_info_zlib(output):
 
 
 def check_results(ws):
-    fn = ws.dump_results(output_formats=["text", "json", "yaml"])
+    fn = ws.dump_results(output_formats=["text", "json", "yaml", "jsonl", "csv"])
     assert os.path.exists(os.path.join(ws.root, fn + ".txt"))
     assert os.path.exists(os.path.join(ws.root, fn + ".json"))
     assert os.path.exists(os.path.join(ws.root, fn + ".yaml"))
+    assert os.path.exists(os.path.join(ws.root, fn + ".jsonl"))
+    assert os.path.exists(os.path.join(ws.root, fn + ".csv"))
 
 
 def test_workspace_create_links(mutable_mock_workspace_path, tmpdir):
@@ -953,6 +956,130 @@ ramble:
         assert os.path.exists(os.path.join(exp_base, exp))
 
 
+def test_parallel_setup_and_analyze_match_serial_order():
+    test_config = """
+ramble:
+  variables:
+    mpi_command: 'mpirun -n {n_ranks} -ppn {processes_per_node}'
+    batch_submit: 'batch_submit {execute_experiment}'
+    processes_per_node: '2'
+    n_ranks: '{processes_per_node}*{n_nodes}'
+  applications:
+    basic:
+      workloads:
+        test_wl:
+          experiments:
+            exp_{n_nodes}:
+              variables:
+                n_nodes: [1, 2, 3, 4, 5, 6, 7, 8]
+  software:
+    packages: {}
+    environments: {}
+"""
+
+    workspace_name = "test_parallel_setup"
+    ws1 = ramble.workspace.create(workspace_name)
+    ws1.write()
+
+    config_path = os.path.join(ws1.config_dir, ramble.workspace.config_file_name)
+
+    with open(config_path, "w+") as f:
+        f.write(test_config)
+
+    ws1._re_read()
+
+    workspace_flags = ["-w", workspace_name]
+
+    workspace("setup", "--dry-run", global_args=workspace_flags)
+    with open(ws1.all_experiments_path) as f:
+        serial_script = f.read()
+
+    workspace("setup", "--dry-run", "-j", "4", global_args=workspace_flags)
+    with open(ws1.all_experiments_path) as f:
+        parallel_script = f.read()
+
+    assert parallel_script == serial_script
+
+    exp_base = os.path.join(ws1.experiment_dir, "basic", "test_wl")
+    setup_logs = os.path.join(ws1.log_dir, "setup.latest")
+    for n_nodes in range(1, 9):
+        assert os.path.exists(os.path.join(exp_base, f"exp_{n_nodes}", "execute_experiment"))
+        assert os.path.exists(os.path.join(setup_logs, f"basic.test_wl.exp_{n_nodes}.out"))
+
+    workspace("analyze", "--dry-run", "-f", "json", "-j", "4", global_args=workspace_flags)
+    with open(os.path.join(ws1.root, "results.latest.json")) as f:
+        results = f.read()
+
+    result_positions = [results.index(f'"basic.test_wl.exp_{n}"') for n in range(1, 9)]
+    assert result_positions == sorted(result_positions)
+
+
+def test_parallel_analyze_keeps_all_results(monkeypatch):
+    test_config = """
+ramble:
+  variables:
+    mpi_command: 'mpirun -n {n_ranks} -ppn {processes_per_node}'
+    batch_submit: 'batch_submit {execute_experiment}'
+    processes_per_node: '2'
+    n_ranks: '{processes_per_node}*{n_nodes}'
+  applications:
+    basic:
+      workloads:
+        test_wl:
+          experiments:
+            exp_{n_nodes}:
+              variables:
+                n_nodes: [1, 2, 3, 4, 5, 6, 7, 8]
+  software:
+    packages: {}
+    environments: {}
+"""
+
+    workspace_name = "test_parallel_analyze_results"
+    ws1 = ramble.workspace.create(workspace_name)
+    ws1.write()
+
+    with open(os.path.join(ws1.config_dir, ramble.workspace.config_file_name), "w+") as f:
+        f.write(test_config)
+    ws1._re_read()
+
+    workspace("setup", "--dry-run", global_args=["-w", workspace_name])
+
+    # Slow down creating results, so concurrent workers would each create
+    # their own if they were not created before the workers start
+    default_results = ramble.workspace.Workspace.default_results
+
+    def _slow_default_results(self):
+        time.sleep(0.05)
+        return default_results(self)
+
+    monkeypatch.setattr(ramble.workspace.Workspace, "default_results", _slow_default_results)
+
+    analyze_pipeline_class = ramble.pipeline.pipeline_class(ramble.pipeline.pipelines.analyze)
+    with ramble.workspace.read(workspace_name) as ws:
+        ws.dry_run = True
+        ws.results = {}
+        analyze_pipeline = analyze_pipeline_class(
+            ws, ramble.filters.Filters(), output_formats=["json"]
+        )
+        analyze_pipeline.jobs = 8
+        analyze_pipeline.run()
+
+        result_names = [result["name"] for result in ws.results["experiments"]]
+        assert result_names == [f"basic.test_wl.exp_{n}" for n in range(1, 9)]
+
+
+def test_invalid_jobs_errors():
+    workspace_name = "test_invalid_jobs"
+    ws1 = ramble.workspace.create(workspace_name)
+    ws1.write()
+
+    output = workspace(
+        "setup", "--dry-run", "-j", "0", global_args=["-w", workspace_name], fail_on_error=False
+    )
+    assert "The number of jobs must be at least 1" in output
+
+
 def test_invalid_vector_workspace():
     test_config = """
 ramble:
@@ -26,3 +26,38 @@ def test_available_command():
         logger.msg(f"Command = {command}")
 
         RambleCommand(command)
+
+
+def test_command_properties_match_modules():
+    import ramble.cmd
+    import ramble.main
+
+    properties = ramble.main.required_command_properties
+    for command in ramble.cmd.all_commands():
+        module = ramble.cmd.get_module(command)
+
+        expected = {prop: getattr(module, prop) for prop in properties}
+        assert ramble.cmd.command_properties(command, properties) == expected
+
+
+def test_help_does_not_set_up_commands():
+    import ramble.main
+
+    parser = ramble.main.make_argument_parser(prog="ramble")
+    assert "debug" in parser.format_help(level="long")
+    assert "debug" in parser.unset_commands
+
+
+def test_set_up_command_after_description():
+    import ramble.main
+
+    parser = ramble.main.make_argument_parser()
+    assert parser.add_command("debug", setup=False) is None
+    assert "debug" in parser.unset_commands
+
+    parser.add_command("debug")
+    assert "debug" not in parser.unset_commands
+
+    args, unknown = parser.parse_known_args(["debug", "report"])
+    assert args.command == "debug"
+    assert args.debug_command == "report"
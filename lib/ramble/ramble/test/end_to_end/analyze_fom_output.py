@@ -13,7 +13,9 @@ import pytest
 
 import llnl.util.tty as tty
 
+import ramble.application
 import ramble.workspace
+import ramble.workspace.state_database
 import ramble.config
 import ramble.software_environments
 from ramble.main import RambleCommand
@@ -95,3 +97,78 @@ def test_analyze_print(monkeypatch):
     msg_list = []
     workspace("analyze", "-p", global_args=["-w", workspace_name])
     assert any(m.startswith("Results from the analysis pipeline") for m in msg_list)
+
+
+def test_analyze_reuses_unchanged_experiments(monkeypatch):
+    workspace_name = "test-analyze-cache"
+    ws = _setup_workspace(workspace_name)
+    exp_dir = os.path.join(ws.experiment_dir, "hostname", "local", "test")
+    result_file = os.path.join(ws.root, "results.latest.txt")
+
+    workspace("analyze", global_args=["-w", workspace_name])
+    assert os.path.exists(os.path.join(exp_dir, "ramble_analysis_cache.json"))
+
+    def _fail_matcher(*args, **kwargs):
+        raise AssertionError("Unchanged experiment was re-analyzed")
+
+    # Unchanged experiments reuse their cached results
+    with monkeypatch.context() as m:
+        m.setattr(ramble.application.ApplicationBase, "_analysis_matcher", _fail_matcher)
+        workspace("analyze", global_args=["-w", workspace_name])
+
+    with open(result_file) as f:
+        assert "possible hostname = test-user.c.googlers.com" in f.read()
+
+    # Modified logs are re-analyzed
+    with open(os.path.join(exp_dir, "test.out"), "w+") as f:
+        f.write("other-host.example.com\n")
+
+    workspace("analyze", global_args=["-w", workspace_name])
+
+    with open(result_file) as f:
+        assert "possible hostname = other-host.example.com" in f.read()
+
+    # --no-cache always re-analyzes
+    with monkeypatch.context() as m:
+        m.setattr(ramble.application.ApplicationBase, "_analysis_matcher", _fail_matcher)
+        with pytest.raises(AssertionError, match="re-analyzed"):
+            workspace("analyze", "--no-cache", global_args=["-w", workspace_name])
+
+
+def test_analyze_with_state_database(monkeypatch):
+    workspace_name = "test-analyze-state-db"
+    with ramble.config.override("config:state_database", True):
+        ws = _setup_workspace(workspace_name)
+        exp_dir = os.path.join(ws.experiment_dir, "hostname", "local", "test")
+        exp_namespace = "hostname.local.test"
+        result_file = os.path.join(ws.root, "results.latest.txt")
+
+        workspace("analyze", global_args=["-w", workspace_name])
+
+        # Status and inventory files are still exported to the experiment
+        for file_name in ["ramble_status.json", "ramble_inventory.json"]:
+            assert os.path.exists(os.path.join(exp_dir, file_name))
+        assert not os.path.exists(os.path.join(exp_dir, "ramble_analysis_cache.json"))
+
+        state_db = ramble.workspace.state_database.StateDatabase(
+            os.path.join(ws.root, ws.state_database_file_name)
+        )
+        assert state_db.get(exp_namespace, "status") == "SUCCESS"
+        assert state_db.get(exp_namespace, "inventory") is not None
+        assert "analyze_experiments" in state_db.get(exp_namespace, "phase_times")["analyze"]
+        assert state_db.get(exp_namespace, "analysis")["status"] == "SUCCESS"
+        state_db.close()
+
+        # Experiment state is read from the database, not the experiment
+        os.remove(os.path.join(exp_dir, "ramble_status.json"))
+        os.remove(os.path.join(exp_dir, "ramble_inventory.json"))
+
+        def _fail_matcher(*args, **kwargs):
+            raise AssertionError("Unchanged experiment was re-analyzed")
+
+        with monkeypatch.context() as m:
+            m.setattr(ramble.application.ApplicationBase, "_analysis_matcher", _fail_matcher)
+            workspace("analyze", global_args=["-w", workspace_name])
+
+        with open(result_file) as f:
+            assert "possible hostname = test-user.c.googlers.com" in f.read()
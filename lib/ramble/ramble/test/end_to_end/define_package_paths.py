@@ -25,8 +25,7 @@ pytestmark = pytest.mark.usefixtures(
 workspace = RambleCommand("workspace")
 
 
-def _spack_loc_log_line(pkg_spec):
-    return f"with args: ['location', '-i', '{pkg_spec}']"
+spack_find_log_line = "with args: ['find', '--format', '{name} {prefix}']"
 
 
 def test_define_package_paths():
@@ -78,23 +77,20 @@ ramble:
         global_args=["-w", workspace_name],
     )
 
-    # test1 should attempt to invoke `spack location -i` on dep packages.
+    # test1 should invoke `spack find` once for all dep packages.
     test1_log = os.path.join(ws.log_dir, "setup.latest", "gromacs.water_bare.test1.out")
-    gromacs_log_line = _spack_loc_log_line("gromacs")
-    impi_log_line = _spack_loc_log_line("intel-oneapi-mpi@2021.11.0")
     with open(test1_log) as f:
         content = f.read()
         assert "Executing phase define_package_paths" in content
-        assert content.count(gromacs_log_line) == 1
-        assert content.count(impi_log_line) == 1
+        assert content.count(spack_find_log_line) == 1
+        assert "'location', '-i'" not in content
 
     # test2 should use cached paths without invoking spack.
     test2_log = os.path.join(ws.log_dir, "setup.latest", "gromacs.water_bare.test2.out")
     with open(test2_log) as f:
         content = f.read()
         assert "Executing phase define_package_paths" in content
-        assert gromacs_log_line not in content
-        assert impi_log_line not in content
+        assert spack_find_log_line not in content
 
 
 def test_package_path_variables():
@@ -147,21 +143,19 @@ ramble:
         global_args=["-w", workspace_name],
     )
 
-    # test1 should attempt to invoke `spack location -i` on dep packages.
-    # However this will not be cached in practice.
+    # test1 should invoke `spack find` once for all dep packages, even though
+    # it defines a variable for the gromacs path.
     test1_log = os.path.join(ws.log_dir, "setup.latest", "gromacs.water_bare.test1.out")
-    gromacs_log_line = _spack_loc_log_line("gromacs")
-    impi_log_line = _spack_loc_log_line("intel-oneapi-mpi@2021.11.0")
     with open(test1_log) as f:
         content = f.read()
         assert "Executing phase define_package_paths" in content
-        assert content.count(gromacs_log_line) == 1
-        assert content.count(impi_log_line) == 1
+        assert content.count(spack_find_log_line) == 1
+        assert "Variable gromacs_path defined" in content
 
-    # test2 should not use a path, as test1 has a variable for the path defined
+    # test2 should use the paths cached for the environment, including gromacs
     test2_log = os.path.join(ws.log_dir, "setup.latest", "gromacs.water_bare.test2.out")
     with open(test2_log) as f:
         content = f.read()
         assert "Executing phase define_package_paths" in content
-        assert gromacs_log_line in content
-        assert impi_log_line not in content
+        assert spack_find_log_line not in content
+        assert "Variable gromacs_path defined" not in content
@@ -124,3 +124,82 @@ ramble:
             assert "spack concretize" not in content
     except RunnerError as e:
         pytest.skip("%s" % e)
+
+
+def test_spack_envs_set_up_concurrently():
+    test_config = """
+ramble:
+  variants:
+    package_manager: spack
+  variables:
+    mpi_command: 'mpirun -n {n_ranks} -ppn {processes_per_node}'
+    batch_submit: '{execute_experiment}'
+    processes_per_node: '1'
+  applications:
+    gromacs:
+      workloads:
+        water_bare:
+          experiments:
+            test1:
+              variables:
+                n_nodes: '1'
+            test2:
+              variables:
+                n_nodes: '2'
+                env_name: 'g2'
+            test3:
+              variables:
+                n_nodes: '3'
+  software:
+    packages:
+      intel-mpi:
+        pkg_spec: intel-oneapi-mpi@2021.11.0
+      gromacs:
+        pkg_spec: gromacs
+    environments:
+      gromacs:
+        packages:
+        - gromacs
+        - intel-mpi
+      g2:
+        packages:
+        - gromacs
+        - intel-mpi
+"""
+    try:
+        workspace_name = "test-spack-envs-set-up-concurrently"
+        ws = ramble.workspace.create(workspace_name)
+        ws.write()
+
+        config_path = os.path.join(ws.config_dir, ramble.workspace.config_file_name)
+
+        with open(config_path, "w+") as f:
+            f.write(test_config)
+
+        ws._re_read()
+
+        with ramble.config.override("config:software_install_jobs", 2):
+            workspace(
+                "setup",
+                "--dry-run",
+                global_args=["-w", workspace_name],
+            )
+
+        # Each environment is set up once, logging to its own file.
+        for env_name in ["gromacs", "g2"]:
+            env_log = os.path.join(ws.log_dir, "setup.latest", f"software.{env_name}.out")
+            with open(env_log) as f:
+                content = f.read()
+                assert "spack install" in content
+                assert "spack concretize" in content
+
+        for exp_name in ["test1", "test2", "test3"]:
+            exp_log = os.path.join(
+                ws.log_dir, "setup.latest", f"gromacs.water_bare.{exp_name}.out"
+            )
+            with open(exp_log) as f:
+                content = f.read()
+                assert "spack install" not in content
+                assert "spack concretize" not in content
+    except RunnerError as e:
+        pytest.skip("%s" % e)
@@ -6,6 +6,9 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import ast
+import threading
+
 import pytest
 
 import ramble.expander
@@ -175,3 +178,169 @@ def test_expansion_namespaces():
     assert expander.application_namespace == "foo"
     assert expander.workload_namespace == "foo.bar"
     assert expander.experiment_namespace == "foo.bar.baz"
+
+
+def test_compiled_templates_are_shared():
+    template_str = "{application_name}/{{n_ranks}*{processes_per_node}:05d}/{missing}"
+
+    template = ramble.expander.compile_template(template_str)
+    assert ramble.expander.compile_template(template_str) is template
+
+    first_vars = exp_dict()
+    second_vars = exp_dict()
+    second_vars["application_name"] = "other"
+    second_vars["n_ranks"] = "8"
+
+    first_expander = ramble.expander.Expander(first_vars, None)
+    second_expander = ramble.expander.Expander(second_vars, None)
+
+    assert first_expander.expand_var(template_str) == "foo/00008/{missing}"
+    assert second_expander.expand_var(template_str) == "other/00016/{missing}"
+
+
+def test_cached_expansions_follow_redefinitions():
+    expansion_vars = exp_dict()
+    expansion_vars["chain"] = "/path/{var1}/{later_var}"
+
+    expander = ramble.expander.Expander(expansion_vars, None)
+
+    assert expander.expand_var("{chain}") == "/path/3/{later_var}"
+    assert expander.expand_var("{chain}") == "/path/3/{later_var}"
+
+    # Redefining a transitive dependency invalidates the cached value
+    expansion_vars["var3"] = "4"
+    assert expander.expand_var("{chain}") == "/path/4/{later_var}"
+
+    # Defining a previously undefined dependency invalidates the cached value
+    expansion_vars["later_var"] = "{n_ranks}"
+    assert expander.expand_var("{chain}") == "/path/4/4"
+
+    # Unrelated variables do not invalidate the cached value
+    cache_key = ("chain", True)
+    cached = expander._value_cache[cache_key]
+    expansion_vars["n_nodes"] = "8"
+    assert expander.expand_var("{chain}") == "/path/4/4"
+    assert expander._value_cache[cache_key] is cached
+
+    # Cached expansions still track used variables
+    expander._used_variables.clear()
+    expander.expand_var("{chain}")
+    assert {"chain", "var1", "var2", "var3", "later_var", "n_ranks"} <= expander._used_variables
+
+
+def test_random_expansions_are_not_cached():
+    expansion_vars = exp_dict()
+    expansion_vars["rand_var"] = "randint(1, 3)"
+
+    expander = ramble.expander.Expander(expansion_vars, None)
+
+    assert expander.expand_var("{rand_var}") in ["1", "2", "3"]
+    assert ("rand_var", True) not in expander._value_cache
+
+
+@pytest.mark.parametrize(
+    "in_str",
+    [
+        "",
+        "/workspace/experiments/foo",
+        "$HOME/bin",
+        "echo hello; echo world",
+        "what?",
+        "!bang",
+        "a!b",
+        ")",
+        "*args",
+        "=value",
+        ": label",
+    ],
+)
+def test_non_math_strings_are_rejected_without_parsing(in_str):
+    assert not ramble.expander._may_be_math(in_str)
+
+    with pytest.raises(SyntaxError):
+        ast.parse(in_str, mode="eval")
+
+
+@pytest.mark.parametrize(
+    "in_str",
+    [
+        "4",
+        "{n_nodes}*{processes_per_node}",
+        ".5 + 1",
+        "-1",
+        "a != b",
+        '"$HOME" in ["$HOME"]',
+        "4 # $ comment",
+        "gromacs +blas",
+    ],
+)
+def test_possible_math_strings_are_not_rejected(in_str):
+    assert ramble.expander._may_be_math(in_str)
+
+
+def test_compiled_math_is_shared():
+    math_str = "(2 + 6) * 4"
+    math_expr = ramble.expander.compile_math(math_str)
+    assert ramble.expander.compile_math(math_str) is math_expr
+
+    expander = ramble.expander.Expander(exp_dict(), None)
+    assert math_expr(expander) == 32
+    assert expander.perform_math_eval(math_str) == 32
+
+    with pytest.raises(SyntaxError):
+        expander.perform_math_eval("/not/math")
+
+
+def test_compiled_predicates_reuse_results(monkeypatch):
+    predicate = ramble.expander.CompiledPredicate('"{application_name}" == "{var1}"')
+
+    foo_vars = exp_dict()
+    foo_vars["var3"] = "foo"
+    bar_vars = exp_dict()
+    bar_vars["application_name"] = "bar"
+
+    foo_expander = ramble.expander.Expander(foo_vars, None)
+    bar_expander = ramble.expander.Expander(bar_vars, None)
+    assert predicate(foo_expander)
+    assert not predicate(bar_expander)
+
+    # Experiments with the same definitions reuse the results without expanding
+    def _fail_expand(*args, **kwargs):
+        raise AssertionError("Predicate was expanded again")
+
+    other_foo_expander = ramble.expander.Expander(foo_vars.copy(), None)
+    other_bar_expander = ramble.expander.Expander(bar_vars.copy(), None)
+    with monkeypatch.context() as m:
+        m.setattr(ramble.expander.Expander, "expand_var", _fail_expand)
+        assert predicate(other_foo_expander)
+        assert not predicate(other_bar_expander)
+    assert {"application_name", "var1", "var2", "var3"} <= other_foo_expander._used_variables
+
+    # Redefining a transitive dependency is detected
+    foo_vars["var2"] = "bar"
+    assert not predicate(ramble.expander.Expander(foo_vars, None))
+
+
+def test_random_predicates_are_not_reused():
+    predicate = ramble.expander.CompiledPredicate("randint(1, 3) > 0", strict=False)
+
+    expander = ramble.expander.Expander(exp_dict(), None)
+    assert predicate(expander)
+    assert predicate._results == {}
+
+
+def test_dependency_tracking_is_per_thread():
+    expander = ramble.expander.Expander(exp_dict(), None)
+
+    # Expansions from another thread (e.g. another experiment looking up a
+    # variable of this one) are not recorded as dependencies of this thread's
+    # expansion, and are cached with their own dependencies.
+    with expander.track_dependencies() as dependencies:
+        assert expander.expand_var("{n_nodes}") == "2"
+        thread = threading.Thread(target=expander.expand_var, args=("{var1}",))
+        thread.start()
+        thread.join()
+
+    assert set(dependencies.variables) == {"n_nodes"}
+    _, var1_dependencies = expander._value_cache[("var1", True)]
+    assert set(var1_dependencies.variables) == {"var1", "var2", "var3"}
@@ -6,13 +6,19 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import gc
 import os
+import tracemalloc
+
 import pytest
 
+import ramble.application
 import ramble.workspace
 import ramble.experiment_set
 import ramble.context
+import ramble.keywords
 import ramble.renderer
+import ramble.repository
 from ramble.application import ChainCycleDetectedError, InvalidChainError
 from ramble.main import RambleCommand
 
@@ -1845,3 +1851,181 @@ def test_custom_executables_track_variables(request, mutable_mock_workspace_path
         app_inst = exp_set.get_experiment("basic.test_wl.test1.chain.0.expanded_foms.test_wl.test")
 
         assert app_inst.variables["my_var"] == "5.0"
+
+
+def test_vector_experiments_are_tracked_once(mutable_mock_workspace_path, monkeypatch):
+    workspace("create", "test")
+
+    assert "test" in workspace("list")
+
+    prepare_calls = []
+    tracking_calls = []
+
+    orig_prepare = ramble.experiment_set.ExperimentSet._prepare_experiment
+    orig_build_used = ramble.application.ApplicationBase.build_used_variables
+
+    def counting_prepare(self, *args, **kwargs):
+        prepare_calls.append(args[0])
+        return orig_prepare(self, *args, **kwargs)
+
+    def counting_build_used(self, *args, **kwargs):
+        tracking_calls.append(self)
+        return orig_build_used(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ramble.experiment_set.ExperimentSet, "_prepare_experiment", counting_prepare
+    )
+    monkeypatch.setattr(
+        ramble.application.ApplicationBase, "build_used_variables", counting_build_used
+    )
+
+    with ramble.workspace.read("test") as ws:
+        exp_set = ramble.experiment_set.ExperimentSet(ws)
+
+        application_context = ramble.context.Context()
+        application_context.context_name = "basic"
+        application_context.variables = {
+            "n_ranks": "{processes_per_node}*{n_nodes}",
+            "mpi_command": "",
+            "batch_submit": "",
+        }
+
+        workload_context = ramble.context.Context()
+        workload_context.context_name = "test_wl"
+        workload_context.variables = {"processes_per_node": "2"}
+        experiment_context = ramble.context.Context()
+        experiment_context.context_name = "series1_{n_ranks}"
+        experiment_context.variables = {"n_nodes": [str(i) for i in range(1, 51)]}
+        experiment_context.n_repeats = 2
+
+        exp_set.set_application_context(application_context)
+        exp_set.set_workload_context(workload_context)
+        exp_set.set_experiment_context(experiment_context)
+
+        # 50 vector entries, each with a base and 2 repeats
+        assert len(exp_set.experiments) == 150
+        assert "basic.test_wl.series1_100.2" in exp_set.experiments
+
+        # The used variables are fully resolved by the first experiment, so
+        # every other experiment is only rendered once.
+        assert len(tracking_calls) == 1
+        assert len(prepare_calls) == len(exp_set.experiments) + 1
+
+
+def test_experiments_copy_shared_application_prototype(mutable_mock_workspace_path, monkeypatch):
+    workspace("create", "test")
+
+    assert "test" in workspace("list")
+
+    repository_gets = []
+    orig_get = ramble.repository.get
+
+    def counting_get(*args, **kwargs):
+        repository_gets.append(args[0])
+        return orig_get(*args, **kwargs)
+
+    monkeypatch.setattr(ramble.repository, "get", counting_get)
+
+    with ramble.workspace.read("test") as ws:
+        exp_set = ramble.experiment_set.ExperimentSet(ws)
+
+        application_context = ramble.context.Context()
+        application_context.context_name = "basic"
+        application_context.variables = {
+            "n_ranks": "{processes_per_node}*{n_nodes}",
+            "mpi_command": "",
+            "batch_submit": "",
+        }
+
+        workload_context = ramble.context.Context()
+        workload_context.context_name = "test_wl"
+        workload_context.variables = {"processes_per_node": "2"}
+        experiment_context = ramble.context.Context()
+        experiment_context.context_name = "series1_{n_ranks}"
+        experiment_context.variables = {"n_nodes": [str(i) for i in range(1, 11)]}
+
+        exp_set.set_application_context(application_context)
+        exp_set.set_workload_context(workload_context)
+        exp_set.set_experiment_context(experiment_context)
+
+        assert len(exp_set.experiments) == 10
+        assert repository_gets.count("basic") == 1
+
+        first_inst = exp_set.experiments["basic.test_wl.series1_2"]
+        second_inst = exp_set.experiments["basic.test_wl.series1_4"]
+
+        # The prototype does not hold on to the experiments copied from it
+        assert exp_set._application_prototypes["basic"].generated_experiments == []
+
+        # Directive data is shared with the class until a directive modifies it
+        app_class = type(first_inst)
+        assert first_inst.workloads is app_class.workloads
+        assert second_inst.workloads is app_class.workloads
+        assert first_inst.keywords is not second_inst.keywords
+        assert first_inst.variables["n_nodes"] != second_inst.variables["n_nodes"]
+
+        # Directives can still be called as methods of each instance
+        first_inst.archive_pattern("*.extra")
+        assert "*.extra" in first_inst.archive_patterns
+        assert "*.extra" not in second_inst.archive_patterns
+        assert "*.extra" not in app_class.archive_patterns
+        assert first_inst.workloads == app_class.workloads
+        assert first_inst.workloads is not app_class.workloads
+
+
+def test_experiment_memory_per_experiment(mutable_mock_workspace_path, record_property):
+    n_experiments = 2000
+    workspace("create", "test")
+
+    with ramble.workspace.read("test") as ws:
+        exp_set = ramble.experiment_set.ExperimentSet(ws)
+
+        application_context = ramble.context.Context()
+        application_context.context_name = "basic"
+        application_context.variables = {
+            "n_ranks": "{processes_per_node}*{n_nodes}",
+            "mpi_command": "",
+            "batch_submit": "",
+        }
+
+        workload_context = ramble.context.Context()
+        workload_context.context_name = "test_wl"
+        workload_context.variables = {"processes_per_node": "2"}
+        experiment_context = ramble.context.Context()
+        experiment_context.context_name = "series1_{n_nodes}"
+        experiment_context.variables = {"n_nodes": [str(i) for i in range(1, n_experiments + 1)]}
+
+        exp_set.set_application_context(application_context)
+        exp_set.set_workload_context(workload_context)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            exp_set.set_experiment_context(experiment_context)
+            gc.collect()
+            used, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(exp_set.experiments) == n_experiments
+
+        bytes_per_experiment = used // n_experiments
+        record_property("bytes_per_experiment", bytes_per_experiment)
+        assert bytes_per_experiment < 14 * 1024
+
+        # Copies of the keywords share their definitions until keys are added
+        first_inst = exp_set.experiments["basic.test_wl.series1_1"]
+        second_inst = exp_set.experiments["basic.test_wl.series1_2"]
+        assert first_inst.keywords.keys is second_inst.keywords.keys
+        first_inst.keywords.update_keys(
+            {
+                "extra_path": {
+                    "type": ramble.keywords.key_type.required,
+                    "level": ramble.keywords.output_level.variable,
+                }
+            }
+        )
+        assert first_inst.keywords.is_required("extra_path")
+        assert first_inst.keywords.extra_path == "extra_path"
+        assert not second_inst.keywords.is_valid("extra_path")
+        assert first_inst.keywords.experiment_name == "experiment_name"
@@ -8,8 +8,10 @@
 
 import pytest
 
+import ramble.caches
 import ramble.repository
 import ramble.paths
+import ramble.util.file_cache
 
 
 @pytest.fixture(params=["applications", "", "foo"])
@@ -112,6 +114,71 @@ def test_list_object_files(
         assert actual[i][1].endswith(expected[i][1])
 
 
+@pytest.fixture
+def tmp_misc_cache(tmpdir, monkeypatch):
+    monkeypatch.setattr(ramble.caches, "misc_cache", ramble.util.file_cache.FileCache(str(tmpdir)))
+
+
+def _fresh_repo(repo_path):
+    """Construct a new Repo for the first repo in a RepoPath, with no loaded modules"""
+    repo = repo_path.repos[0]
+    return ramble.repository.Repo(repo.root, object_type=repo.object_type)
+
+
+def test_object_metadata_matches_object(mutable_mock_apps_repo, tmp_misc_cache):
+    repo = _fresh_repo(mutable_mock_apps_repo)
+    metadata = repo.object_metadata("basic")
+    obj = mutable_mock_apps_repo.get("basic")
+
+    assert metadata.name == "basic"
+    assert metadata.__doc__ == obj.__doc__
+    assert list(metadata.workloads) == list(obj.workloads.keys())
+    assert list(metadata.executables) == list(obj.executables.keys())
+    assert list(metadata.inputs) == list(obj.inputs.keys())
+    assert list(metadata.figures_of_merit) == list(obj.figures_of_merit.keys())
+    for pipeline, phases in obj.phase_definitions.items():
+        assert metadata.phase_definitions[pipeline] == list(phases.keys())
+
+    assert repo.object_metadata("maintained-1").maintainers == ["maintainer-1"]
+    assert repo.object_metadata("tagged-1").tags == ["tag-1"]
+
+    # Objects are indexed by their repository name, even if their name differs
+    assert repo.object_metadata("expanded_foms").figures_of_merit
+
+    with pytest.raises(ramble.repository.UnknownObjectError):
+        repo.object_metadata("nonexistentapplication")
+
+
+def test_object_metadata_read_without_import(mutable_mock_apps_repo, tmp_misc_cache):
+    _fresh_repo(mutable_mock_apps_repo).object_metadata("basic")
+
+    # Once the index is written, it is read without importing any object
+    repo = _fresh_repo(mutable_mock_apps_repo)
+    assert repo.object_metadata("builtin.mock.basic").workloads
+    assert not repo._modules
+
+
+def test_object_metadata_regenerated_for_other_versions(
+    mutable_mock_apps_repo, tmp_misc_cache, monkeypatch
+):
+    _fresh_repo(mutable_mock_apps_repo).object_metadata("basic")
+
+    updated = []
+    orig_update = ramble.repository.MetadataIndex.update_object
+
+    def recording_update(self, obj_name):
+        updated.append(obj_name)
+        return orig_update(self, obj_name)
+
+    monkeypatch.setattr(ramble.repository.MetadataIndex, "index_format", 0)
+    monkeypatch.setattr(ramble.repository.MetadataIndex, "update_object", recording_update)
+
+    repo = _fresh_repo(mutable_mock_apps_repo)
+    assert repo.object_metadata("basic").workloads
+    assert repo.metadata_index.is_current()
+    assert len(updated) == len(repo.all_object_names())
+
+
 #
 #
 # def test_repo_anonymous_app(mutable_mock_apps_repo):
@@ -385,3 +385,84 @@ def test_compiler_in_environment_warns(request, mutable_mock_workspace_path, cap
 
         assert "Environment basic contains packages and their compilers" in captured.err
         assert "Package: basic, Compiler: test_comp" in captured.err
+
+
+def test_template_index_candidates():
+    index = ramble.software_environments.TemplateIndex(
+        ["basic", "basic-{env_test}", "{env_test}-basic", "{a}-{b}", "other env", "1+1"]
+    )
+    env_expander = ramble.expander.Expander({}, None)
+
+    assert index.candidates("basic", env_expander) == ["basic", "other env"]
+    assert index.candidates("basic-basic", env_expander) == [
+        "basic-{env_test}",
+        "{env_test}-basic",
+        "{a}-{b}",
+        "other env",
+    ]
+    assert index.candidates("other-env", env_expander) == ["{a}-{b}", "other env"]
+    assert index.candidates("none", env_expander) == ["other env"]
+
+    # Names which might be evaluated math can come from any template name
+    assert index.candidates("2", env_expander) == [
+        "basic-{env_test}",
+        "{env_test}-basic",
+        "{a}-{b}",
+        "other env",
+        "1+1",
+    ]
+
+
+def test_rendered_environments_are_reused(request, mutable_mock_workspace_path, monkeypatch):
+    ws_name = request.node.name
+
+    workspace("create", ws_name)
+
+    with ramble.workspace.read(ws_name) as ws:
+        spack_dict = ws.get_software_dict()
+
+        spack_dict["packages"] = {}
+        spack_dict["packages"]["basic-{pkg_test}"] = {"pkg_spec": "basic@{pkg_ver}"}
+        spack_dict["packages"]["other-{pkg_test}"] = {"pkg_spec": "other@{other_ver}"}
+        spack_dict["environments"] = {
+            "basic-{env_test}": {"packages": ["basic-{pkg_test}"]},
+            "other-{env_test}": {"packages": ["other-{pkg_test}"]},
+        }
+
+        software_environments = ramble.software_environments.SoftwareEnvironments(ws)
+        package_manager = _get_package_manager("pip")
+
+        renders = []
+        render_environment = ramble.software_environments.TemplateEnvironment.render_environment
+
+        def _count_renders(self, *args, **kwargs):
+            renders.append(self.name)
+            return render_environment(self, *args, **kwargs)
+
+        monkeypatch.setattr(
+            ramble.software_environments.TemplateEnvironment, "render_environment", _count_renders
+        )
+
+        def _expander(**extra_vars):
+            variables = {"env_test": "env", "pkg_test": "pkg", "pkg_ver": "1.1"}
+            variables.update(extra_vars)
+            return ramble.expander.Expander(variables, None)
+
+        first_expander = _expander(unused="value")
+        first_env = software_environments.render_environment(
+            "basic-env", first_expander, package_manager
+        )
+        assert first_expander._used_variables == {"env_test", "pkg_test", "pkg_ver"}
+
+        second_expander = _expander(other_ver="2.0")
+        assert (
+            software_environments.render_environment("basic-env", second_expander, package_manager)
+            is first_env
+        )
+        assert renders == ["basic-{env_test}"]
+        assert second_expander._used_variables == {"env_test", "pkg_test", "pkg_ver"}
+
+        with pytest.raises(ramble.software_environments.RambleSoftwareEnvironmentError):
+            software_environments.render_environment(
+                "basic-env", _expander(pkg_ver="1.2"), package_manager
+            )
@@ -61,3 +61,7 @@ ramble:
             data = f.read()
             assert "FAILED" in data
             assert "0.9 s" not in data
+
+        # Success functions can depend on anything, so their results are not cached
+        exp_dir = os.path.join(ws.experiment_dir, "success-function", "test_wl", "simple_test")
+        assert not os.path.exists(os.path.join(exp_dir, "ramble_analysis_cache.json"))
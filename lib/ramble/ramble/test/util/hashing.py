@@ -0,0 +1,55 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Perform tests of the util/hashing functions"""
+
+import hashlib
+import os
+
+import ramble.util.hashing
+
+
+def test_hash_file_in_chunks(tmpdir, monkeypatch):
+    monkeypatch.setattr(ramble.util.hashing, "_file_chunk_size", 7)
+    contents = b"some file contents, longer than a single chunk\n" * 3
+    path = tmpdir.join("file.txt")
+    path.write_binary(contents)
+
+    assert ramble.util.hashing.hash_file(str(path)) == hashlib.sha256(contents).hexdigest()
+
+
+def test_hash_file_cached(tmpdir, monkeypatch):
+    monkeypatch.setattr(ramble.util.hashing, "_file_digests", {})
+    path = tmpdir.join("file.txt")
+    path.write("first")
+    digest = ramble.util.hashing.hash_file(str(path), cached=True)
+    assert digest == ramble.util.hashing.hash_string("first")
+
+    # The cached digest is used while the file's stat information is unchanged
+    stat_result = os.stat(str(path))
+    ramble.util.hashing._file_digests[str(path)] = (
+        (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino),
+        "cached digest",
+    )
+    assert ramble.util.hashing.hash_file(str(path), cached=True) == "cached digest"
+    assert ramble.util.hashing.hash_file(str(path)) == digest
+
+    path.write("second, with a different size")
+    assert ramble.util.hashing.hash_file(str(path), cached=True) == (
+        ramble.util.hashing.hash_string("second, with a different size")
+    )
+
+
+def test_hash_json_is_canonical():
+    first = {"b": [1, {"d": "x", "c": None}], "a": "value"}
+    second = {"a": "value", "b": [1, {"c": None, "d": "x"}]}
+
+    assert ramble.util.hashing.hash_json(first) == ramble.util.hashing.hash_json(second)
+    assert ramble.util.hashing.hash_json(first) == ramble.util.hashing.hash_string(
+        '{"a":"value","b":[1,{"c":null,"d":"x"}]}'
+    )
+    assert ramble.util.hashing.hash_json(first) != ramble.util.hashing.hash_json({"a": "value"})
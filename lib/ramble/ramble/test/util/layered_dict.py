@@ -0,0 +1,64 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Perform tests of the util/layered_dict functions"""
+
+import pytest
+
+from ramble.util.layered_dict import LayeredDict
+
+
+def test_layered_dict_matches_dict_copy():
+    base = {"a": 1, "b": 2, "c": 3}
+    layered = LayeredDict(base, {"b": 20})
+    expected = base.copy()
+    expected["b"] = 20
+
+    for mapping in (layered, expected):
+        mapping["d"] = 4
+        del mapping["a"]
+        mapping["c"] = 30
+
+    assert base == {"a": 1, "b": 2, "c": 3}
+    assert list(layered.items()) == list(expected.items())
+    assert len(layered) == len(expected)
+    assert "a" not in layered
+    assert layered.get("a", "unset") == "unset"
+    with pytest.raises(KeyError):
+        layered["a"]
+    with pytest.raises(KeyError):
+        del layered["a"]
+
+    # Keys removed from the base and set again move to the end, as in a dict
+    for mapping in (layered, expected):
+        mapping["a"] = 10
+        mapping["e"] = 5
+        del mapping["b"]
+        mapping["b"] = 21
+    assert layered["a"] == 10
+    assert list(layered.items()) == list(expected.items())
+    assert list(layered) == ["c", "d", "a", "e", "b"]
+    assert len(layered) == len(expected)
+
+    copied = layered.copy()
+    del copied["a"]
+    copied["a"] = 11
+    assert list(copied) == ["c", "d", "e", "b", "a"]
+    assert layered["a"] == 10
+
+
+def test_layered_dict_copies_share_base():
+    base = {"a": 1}
+    layered = LayeredDict(base, {"b": 2})
+
+    copied = layered.copy()
+    copied["b"] = 3
+    copied["c"] = 4
+
+    assert copied.base is layered.base
+    assert layered == {"a": 1, "b": 2}
+    assert copied == {"a": 1, "b": 3, "c": 4}
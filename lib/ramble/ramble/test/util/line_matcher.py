@@ -0,0 +1,64 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Perform tests of the util/line_matcher functions"""
+
+import re
+
+import pytest
+
+from ramble.util.line_matcher import LineMatcher, literal_prefix
+
+
+@pytest.mark.parametrize(
+    "pattern,prefix",
+    [
+        (r"Elapsed time: (?P<time>[0-9]+)", "Elapsed time: "),
+        (r"^Kernel\s+(?P<name>\S+)", "Kernel"),
+        (r"\s*Time = (?P<t>.*)", ""),
+        (r".*Completed", ""),
+        (r"Step\.done", "Step.done"),
+        (r"Runs?: (?P<n>\d+)", "Run"),
+        (r"ab*c", "a"),
+        (r"a{2}b", ""),
+        (r"ab+c", "ab"),
+        (r"(?P<name>\w+) = 1", ""),
+        (r"Time|Duration", ""),
+        (r"Time \| (?P<t>.*)", "Time | "),
+        (r"\(s\) total", "(s) total"),
+        (r"Total[:=]", "Total"),
+    ],
+)
+def test_literal_prefix(pattern, prefix):
+    assert literal_prefix(pattern) == prefix
+
+    # Any line matched by the pattern must start with the prefix
+    assert prefix == "" or not re.match(pattern, "x" + prefix)
+
+
+def test_line_matcher_preserves_order():
+    entries = [
+        (re.compile(r"Time: (?P<a>\d+)"), "first"),
+        (re.compile(r".*: (?P<b>\d+)"), "second"),
+        (re.compile(r"Count: (?P<c>\d+)"), "third"),
+        (re.compile(r"Time: (?P<d>\d+)", re.IGNORECASE), "fourth"),
+    ]
+    matcher = LineMatcher(entries)
+
+    assert [payload for _, payload in matcher.matches("Time: 4")] == [
+        "first",
+        "second",
+        "fourth",
+    ]
+    assert [payload for _, payload in matcher.matches("time: 4")] == ["second", "fourth"]
+    assert [payload for _, payload in matcher.matches("Count: 2")] == ["second", "third"]
+    assert [payload for _, payload in matcher.matches("Other")] == []
+    assert [payload for _, payload in matcher.matches("")] == []
+
+    match, payload = next(matcher.matches("Time: 4"))
+    assert payload == "first"
+    assert match.group("a") == "4"
@@ -0,0 +1,103 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+"""Perform tests of the util/results_writers functions"""
+
+import csv
+import io
+import json
+
+import pytest
+
+import spack.util.spack_json as sjson
+import spack.util.spack_yaml as syaml
+
+import ramble.util.results_writers
+
+
+def _fom(name, value, origin_type="application"):
+    return {
+        "name": name,
+        "value": value,
+        "units": "s",
+        "origin": "basic",
+        "origin_type": origin_type,
+    }
+
+
+def _results(n_experiments):
+    experiments = []
+    for idx in range(n_experiments):
+        experiments.append(
+            {
+                "name": f"basic.test_wl.exp_{idx}",
+                "N_REPEATS": 0,
+                "EXPERIMENT_CHAIN": [],
+                "RAMBLE_STATUS": "SUCCESS" if idx % 2 == 0 else "FAILED",
+                "RAMBLE_VARIABLES": {"n_nodes": str(idx)},
+                "TAGS": ["tag"],
+                "CONTEXTS": [
+                    {
+                        "name": "null",
+                        "display_name": "default (null) context",
+                        "foms": [_fom("time", f"{idx}.5"), _fom("count", str(idx))],
+                    }
+                ],
+            }
+        )
+    return {"workspace_hash": "abc123", "workspace_name": "test", "experiments": experiments}
+
+
+def _write(writer_cls, results):
+    stream = io.StringIO()
+    writer = writer_cls(stream)
+    writer.begin(results)
+    for exp in results.get("experiments", []):
+        writer.write_experiment(exp)
+    writer.end(results)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("n_experiments", [0, 1, 3])
+def test_streamed_documents_match_full_dumps(n_experiments):
+    results = _results(n_experiments)
+
+    assert _write(ramble.util.results_writers.JsonResultsWriter, results) == sjson.dump(results)
+    assert _write(ramble.util.results_writers.YamlResultsWriter, results) == syaml.dump(results)
+
+
+def test_streamed_json_keys_after_experiments():
+    results = {"experiments": _results(2)["experiments"], "workspace_name": "test"}
+
+    assert _write(ramble.util.results_writers.JsonResultsWriter, results) == sjson.dump(results)
+    assert _write(ramble.util.results_writers.YamlResultsWriter, results) == syaml.dump(results)
+    assert _write(ramble.util.results_writers.JsonResultsWriter, {}) == sjson.dump({})
+
+
+def test_json_lines_writer():
+    results = _results(3)
+
+    output = _write(ramble.util.results_writers.JsonLinesResultsWriter, results)
+
+    lines = output.splitlines()
+    assert len(lines) == 3
+    assert [json.loads(line) for line in lines] == results["experiments"]
+
+
+def test_csv_writer():
+    results = _results(2)
+
+    output = _write(ramble.util.results_writers.CsvResultsWriter, results)
+
+    rows = list(csv.reader(io.StringIO(output)))
+    assert rows[0] == ramble.util.results_writers.CsvResultsWriter.columns
+    assert rows[1:] == [
+        ["basic.test_wl.exp_0", "SUCCESS", "null", "time", "0.5", "s", "basic", "application"],
+        ["basic.test_wl.exp_0", "SUCCESS", "null", "count", "0", "s", "basic", "application"],
+        ["basic.test_wl.exp_1", "FAILED", "null", "time", "1.5", "s", "basic", "application"],
+        ["basic.test_wl.exp_1", "FAILED", "null", "count", "1", "s", "basic", "application"],
+    ]
@@ -40,3 +40,65 @@ import ramble.util.stats
 )
 def test_stats_for_repeat_foms(statistic, input_values, input_units, output):
     assert statistic.report(input_values, input_units) == output
+
+
+@pytest.mark.parametrize(
+    "statistic,input_values,input_units,output",
+    [
+        (ramble.util.stats.StatsPercentile(5), [-2, 0, 2, 5.5], "s", (-1.7, "s", "summary::p5")),
+        (ramble.util.stats.StatsPercentile(25), [-2, 0, 2, 5.5], "s", (-0.5, "s", "summary::p25")),
+        (ramble.util.stats.StatsPercentile(75), [-2, 0, 2, 5.5], "s", (2.9, "s", "summary::p75")),
+        (ramble.util.stats.StatsPercentile(95), [3.0], "s", (3.0, "s", "summary::p95")),
+        (
+            ramble.util.stats.StatsConfidenceInterval(upper=False),
+            [-2, 0, 2, 5.5],
+            "s",
+            (-3.7, "s", "summary::ci95_lower"),
+        ),
+        (
+            ramble.util.stats.StatsConfidenceInterval(upper=True),
+            [-2, 0, 2, 5.5],
+            "s",
+            (6.5, "s", "summary::ci95_upper"),
+        ),
+        (
+            ramble.util.stats.StatsConfidenceInterval(upper=True),
+            [3],
+            "s",
+            ("NA", "", "summary::ci95_upper"),
+        ),
+    ],
+)
+def test_percentiles_and_confidence_intervals(statistic, input_values, input_units, output):
+    assert statistic.report(input_values, input_units) == output
+
+
+def test_t_critical_values():
+    assert ramble.util.stats.t_critical_95(1) == 12.706
+    assert ramble.util.stats.t_critical_95(30) == 2.042
+    assert round(ramble.util.stats.t_critical_95(60), 3) == 2.000
+    assert round(ramble.util.stats.t_critical_95(120), 3) == 1.980
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_report_all_matches_report(monkeypatch, use_numpy):
+    if use_numpy and ramble.util.stats.np is None:
+        pytest.skip("numpy is not available")
+    if not use_numpy:
+        monkeypatch.setattr(ramble.util.stats, "np", None)
+
+    value_lists = [
+        [6.79, 5.6, 4.31, 5.5],
+        [1.0, 2.0, 3.0, 4.0],
+        [3.0],
+        [10.125, 10.25, 9.875, 10.5, 10.0, 9.75, 10.375],
+        [],
+    ]
+    units = ["s", "GB/s", "s", "ms", "s"]
+
+    reports = ramble.util.stats.report_all(value_lists, units)
+
+    for values, unit, report in zip(value_lists, units, reports):
+        assert report == [
+            statistic.report(values, unit) for statistic in ramble.util.stats.all_stats
+        ]
@@ -10,7 +10,10 @@ import os
 
 import pytest
 
+import ramble.config
+import ramble.schema.workspace
 import ramble.workspace
+import ramble.workspace.state_database
 
 # everything here uses the mock_workspace_path
 pytestmark = pytest.mark.usefixtures(
@@ -30,3 +33,166 @@ def test_re_read(tmpdir):
         test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
         test_workspace.clear()
         test_workspace._re_read()
+
+
+def test_insert_result_order(tmpdir):
+    with tmpdir.as_cwd():
+        test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
+
+        for name in ["a.1", "b.1", "b.2"]:
+            test_workspace.append_result({"name": name})
+
+        test_workspace.insert_result({"name": "b"}, "b.1")
+        test_workspace.insert_result({"name": "b.extra"}, "b.1")
+        test_workspace.insert_result({"name": "a"}, "a.1")
+        test_workspace.insert_result({"name": "a.base"}, "a")
+        test_workspace.insert_result({"name": "c"}, "c.1")
+
+        names = [result["name"] for result in test_workspace.results["experiments"]]
+        assert names == ["a.base", "a", "a.1", "b", "b.extra", "b.1", "b.2", "c"]
+
+
+@pytest.mark.parametrize("n_experiments", [10000, 100000])
+def test_insert_result_scaling(tmpdir, n_experiments):
+    n_repeats = 5
+    with tmpdir.as_cwd():
+        test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
+
+        n_bases = n_experiments // n_repeats
+        for base in range(n_bases):
+            for n in range(1, n_repeats + 1):
+                test_workspace.append_result({"name": f"exp_{base}.{n}"})
+
+        for base in range(n_bases):
+            test_workspace.insert_result({"name": f"exp_{base}"}, f"exp_{base}.1")
+
+        results = test_workspace.results["experiments"]
+        assert len(results) == n_bases * (n_repeats + 1)
+        for base in range(0, n_bases, 997):
+            idx = base * (n_repeats + 1)
+            assert results[idx]["name"] == f"exp_{base}"
+            assert results[idx + 1]["name"] == f"exp_{base}.1"
+
+
+@pytest.fixture()
+def count_yaml_loads(monkeypatch):
+    """Count the YAML files loaded through ramble.config"""
+    loads = []
+    load_config = ramble.config.syaml.load_config
+
+    def _load_config(*args, **kwargs):
+        loads.append(args[0])
+        return load_config(*args, **kwargs)
+
+    monkeypatch.setattr(ramble.config.syaml, "load_config", _load_config)
+    return loads
+
+
+def test_config_cache(tmpdir, count_yaml_loads):
+    schema = ramble.schema.workspace.schema
+    config_path = tmpdir.join("ramble.yaml")
+    config_path.write("ramble:\n  variables::\n    n_ranks: '1'\n")
+    cache = ramble.config.ConfigCache(str(tmpdir.join("cache")))
+
+    data, validated = cache.read(str(config_path), schema)
+    assert len(count_yaml_loads) == 1
+
+    cached_data, cached_validated = cache.read(str(config_path), schema)
+    assert len(count_yaml_loads) == 1
+    assert cached_data == data
+    assert cached_validated == validated
+    assert cached_data is not data
+    key = list(cached_data["ramble"].keys())[0]
+    assert key == "variables"
+    assert getattr(key, "override", False)
+
+    # Changed contents, even of the same size, are read again
+    config_path.write("ramble:\n  variables::\n    n_ranks: '2'\n")
+    data, _ = cache.read(str(config_path), schema)
+    assert len(count_yaml_loads) == 2
+    assert data["ramble"]["variables"]["n_ranks"] == "2"
+
+    # So are files validated against a different schema
+    cache.read(str(config_path), dict(schema, title="Modified workspace schema"))
+    assert len(count_yaml_loads) == 3
+
+
+def test_config_cache_ignores_bad_entries(tmpdir, count_yaml_loads):
+    schema = ramble.schema.workspace.schema
+    config_path = tmpdir.join("ramble.yaml")
+    config_path.write("ramble:\n  variables:\n    n_ranks: '1'\n")
+    cache = ramble.config.ConfigCache(str(tmpdir.join("cache")))
+
+    cache.read(str(config_path), schema)
+    for entry in tmpdir.join("cache").listdir():
+        entry.write("not a pickle")
+
+    data, _ = cache.read(str(config_path), schema)
+    assert len(count_yaml_loads) == 2
+    assert data["ramble"]["variables"]["n_ranks"] == "1"
+
+
+def test_workspace_reads_cached_config(tmpdir, count_yaml_loads):
+    with tmpdir.as_cwd():
+        ramble.workspace.Workspace(os.getcwd(), True).write()
+        ramble.workspace.Workspace(os.getcwd(), True)
+        count_yaml_loads.clear()
+
+        test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
+        assert os.path.isdir(test_workspace.config_cache_dir)
+        assert count_yaml_loads == []
+
+        with open(test_workspace.config_file_path, "a") as f:
+            f.write("# Modified\n")
+        test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
+        assert len(count_yaml_loads) == 1
+
+
+def test_state_database(tmpdir):
+    db_path = str(tmpdir.join("ramble_state.db"))
+    state_db = ramble.workspace.state_database.StateDatabase(db_path)
+
+    state_db.set("app.wl.exp_1", "status", "SETUP")
+    state_db.set("app.wl.exp_1", "inventory", {"attributes": [{"name": "a", "digest": "0"}]})
+    state_db.set("app.wl.exp_2", "status", "SETUP")
+    assert state_db.get("app.wl.exp_1", "status") == "SETUP"
+
+    # Nothing is written before flushing
+    unflushed_db = ramble.workspace.state_database.StateDatabase(db_path)
+    assert unflushed_db.get("app.wl.exp_1", "status") is None
+    unflushed_db.close()
+    state_db.flush()
+
+    state_db.set("app.wl.exp_2", "status", "SUCCESS")
+    state_db.close()
+
+    state_db = ramble.workspace.state_database.StateDatabase(db_path)
+    assert state_db.get("app.wl.exp_1", "status") == "SETUP"
+    assert state_db.get("app.wl.exp_1", "inventory")["attributes"][0]["name"] == "a"
+    assert state_db.get("app.wl.exp_2", "status") == "SUCCESS"
+    assert state_db.get("app.wl.exp_2", "inventory") is None
+    assert state_db.get("app.wl.exp_3", "status") is None
+
+    state_db.set("app.wl.exp_1", "analysis", {"key": {"foms": [1, 2]}})
+    state_db.close()
+
+    # Analysis caches are only read for the experiments requesting them
+    state_db = ramble.workspace.state_database.StateDatabase(db_path)
+    assert state_db.get("app.wl.exp_1", "status") == "SETUP"
+    assert all("analysis" not in exp_state for exp_state in state_db._state.values())
+    assert state_db.get("app.wl.exp_1", "analysis") == {"key": {"foms": [1, 2]}}
+    assert state_db.get("app.wl.exp_2", "analysis") is None
+    assert state_db.get("app.wl.exp_1", "status") == "SETUP"
+    state_db.close()
+
+
+def test_workspace_state_database_config(tmpdir):
+    with tmpdir.as_cwd():
+        test_workspace = ramble.workspace.Workspace(os.getcwd(), True)
+        assert test_workspace.state_database is None
+
+        with ramble.config.override("config:state_database", True):
+            state_db = test_workspace.state_database
+            assert state_db.path == os.path.join(
+                test_workspace.root, test_workspace.state_database_file_name
+            )
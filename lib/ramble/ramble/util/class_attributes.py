@@ -7,19 +7,37 @@
 # except according to those terms.
 
 
+# Names of the attributes to convert, per class
+_class_attribute_names = {}
+
+
 def convert_class_attributes(obj):
     """Convert class attributes defined from directives to instance attributes
     Class attributes that are valid for conversion are stored in the _directive_names
     attribute.
 
+    Until this is called, instances read the class attributes, which are
+    shared by all instances of the class and must not be modified through
+    them. Directives executed on an instance call this before modifying its
+    attributes, so only instances using directives hold their own copies.
+
+    The names of the attributes to convert are computed once per class.
+
     Args:
         obj (Object): Input object instance to convert attributes in
     """
 
-    if hasattr(obj, "_directive_names"):
-        dir_set = dir(obj)
-        var_set = vars(obj)
-        for attr in obj._directive_names:
-            if attr in dir_set and attr not in var_set:
-                inst_val = getattr(obj, attr).copy()
-                setattr(obj, attr, inst_val)
+    obj_class = type(obj)
+    attr_names = _class_attribute_names.get(obj_class)
+    if attr_names is None:
+        attr_names = ()
+        if hasattr(obj, "_directive_names"):
+            dir_set = set(dir(obj_class))
+            attr_names = tuple(attr for attr in obj._directive_names if attr in dir_set)
+        _class_attribute_names[obj_class] = attr_names
+
+    var_set = vars(obj)
+    for attr in attr_names:
+        if attr not in var_set:
+            inst_val = getattr(obj, attr).copy()
+            setattr(obj, attr, inst_val)
@@ -6,12 +6,30 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import ramble.util.class_attributes
+
+
+class DirectiveMethod:
+    """Descriptor which exposes a directive as a method of class instances
+
+    Accessing the directive through an instance returns a wrapper which
+    executes the directive on that instance.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj_inst, obj_class=None):
+        if obj_inst is None:
+            return self
+        return wrap_named_directive(obj_inst, self.name)
+
 
 def define_directive_methods(obj_inst):
     """Create class methods that execute directives
 
-    Wrap each directive, and inject it into this class instance as a class
-    method.
+    Wrap each directive, and inject it into the class of this instance as a
+    method. This only happens once per class.
 
     This allows:
 
@@ -39,6 +57,10 @@ def define_directive_methods(obj_inst):
     ):
         return
 
+    obj_class = type(obj_inst)
+    if "_directive_methods_defined" in vars(obj_class):
+        return
+
     for directive, directive_class in obj_inst._directive_classes.items():
         is_valid_lang = False
         if hasattr(obj_inst, "_language_classes"):
@@ -46,8 +68,10 @@ def define_directive_methods(obj_inst):
                 if directive_class is lang_class:
                     is_valid_lang = True
 
-        if not hasattr(obj_inst, directive) and is_valid_lang:
-            setattr(obj_inst, directive, wrap_named_directive(obj_inst, directive))
+        if not hasattr(obj_class, directive) and is_valid_lang:
+            setattr(obj_class, directive, DirectiveMethod(directive))
+
+    obj_class._directive_methods_defined = True
 
 
 def wrap_named_directive(obj_inst, name):
@@ -55,9 +79,13 @@ def wrap_named_directive(obj_inst, name):
 
     Create a wrapper method that executes a directive, to inject the
     `(self)` argument to simplify use of directives as class methods
+
+    Directive attributes are converted to instance attributes before the
+    directive executes, so the class attributes are left unmodified.
     """
 
     def _execute_directive(*args, directive_name=name, **kwargs):
+        ramble.util.class_attributes.convert_class_attributes(obj_inst)
         obj_inst._directive_functions[directive_name](*args, **kwargs)(obj_inst)
 
     return _execute_directive
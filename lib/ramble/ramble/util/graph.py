@@ -16,6 +16,8 @@ class GraphNode:
     node easily.
     """
 
+    __slots__ = ("key", "attribute", "_order_before", "_order_after", "obj_inst")
+
     def __init__(self, key, attribute=None, obj_inst=None):
         """Construct a graph node
 
@@ -8,15 +8,50 @@
 
 import json
 import hashlib
+import os
+
 import spack.util.spack_json as sjson
 
+#: Size of the chunks files are read in while hashing them
+_file_chunk_size = 1024 * 1024
+
+#: Digests of files hashed by this process, by path. Each is stored with the
+#: size, modification time, and inode of the file it was computed for.
+_file_digests = {}
+
+#: Arguments for the canonical JSON encoding of hashed data
+_json_hash_args = {"separators": (",", ":"), "sort_keys": True}
+
+
+def hash_file(file_path, cached=False):
+    """Compute the sha256 digest of a file, reading it in chunks
 
-def hash_file(file_path):
-    file_hash = None
+    Args:
+        file_path (str): Path of the file to hash
+        cached (bool): If True, reuse the digest this process computed for the
+                       file earlier, as long as its size, modification time,
+                       and inode are unchanged.
+
+    Returns:
+        (str): The hex digest of the file's contents
+    """
+    if cached:
+        stat_result = os.stat(file_path)
+        key = (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino)
+        path = os.path.abspath(file_path)
+        cached_key, digest = _file_digests.get(path, (None, None))
+        if cached_key == key:
+            return digest
+
+    file_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        bytes = f.read()
-        file_hash = hashlib.sha256(bytes).hexdigest()
-    return file_hash
+        for chunk in iter(lambda: f.read(_file_chunk_size), b""):
+            file_hash.update(chunk)
+    digest = file_hash.hexdigest()
+
+    if cached:
+        _file_digests[path] = (key, digest)
+    return digest
 
 
 def hash_string(string):
@@ -24,9 +59,10 @@ def hash_string(string):
 
 
 def hash_json(in_json):
-    _json_dump_args = {"indent": 2, "separators": (",", ": "), "sort_keys": True}
+    """Compute the sha256 digest of the canonical JSON encoding of some data
 
+    The encoding is compact and has sorted keys, so equal data always have the
+    same digest.
+    """
     data = sjson._strify(in_json)
-    json_data = json.dumps(data, **_json_dump_args)
-
-    return hashlib.sha256(json_data.encode("UTF-8")).hexdigest()
+    return hash_string(json.dumps(data, **_json_hash_args))
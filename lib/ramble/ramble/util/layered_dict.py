@@ -0,0 +1,99 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+"""A copy-on-write dictionary layered over a shared base dictionary"""
+
+import collections.abc
+
+
+class LayeredDict(collections.abc.MutableMapping):
+    """Dictionary view of a shared base layer plus a private delta layer
+
+    Lookups check the delta before the base. All modifications are recorded
+    in the delta (removals of base keys are recorded as well), so the base
+    is never modified and can be shared by any number of layered dicts.
+    Copies share the base, and only copy the delta.
+
+    Iteration follows the order a dict copied from the base and then
+    modified in the same way would have. Base keys which are removed and
+    set again stay marked as removed, so they are iterated over (like new
+    keys) in the order they were set in the delta.
+    """
+
+    __slots__ = ("_base", "_delta", "_removed")
+
+    def __init__(self, base, delta=None, _removed=None):
+        """Constructor for a LayeredDict
+
+        Args:
+            base (dict): Shared base definitions. They are never modified
+                         through this object.
+            delta (dict): Definitions which take precedence over the base.
+                          The dict is owned by this object after construction.
+        """
+        self._base = base
+        self._delta = {} if delta is None else delta
+        self._removed = set() if _removed is None else _removed
+
+    @property
+    def base(self):
+        return self._base
+
+    @property
+    def delta(self):
+        return self._delta
+
+    def __getitem__(self, key):
+        try:
+            return self._delta[key]
+        except KeyError:
+            if key in self._removed:
+                raise
+            return self._base[key]
+
+    def get(self, key, default=None):
+        if key in self._delta:
+            return self._delta[key]
+        if key in self._removed:
+            return default
+        return self._base.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._delta or (key not in self._removed and key in self._base)
+
+    def __setitem__(self, key, value):
+        self._delta[key] = value
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._delta.pop(key, None)
+        if key in self._base:
+            self._removed.add(key)
+
+    def __iter__(self):
+        for key in self._base:
+            if key not in self._removed:
+                yield key
+        for key in self._delta:
+            if key not in self._base or key in self._removed:
+                yield key
+
+    def __len__(self):
+        length = len(self._base) - len(self._removed)
+        for key in self._delta:
+            if key not in self._base or key in self._removed:
+                length += 1
+        return length
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def copy(self):
+        """Copy this dict, sharing its base layer"""
+        return LayeredDict(self._base, self._delta.copy(), self._removed.copy())
@@ -0,0 +1,137 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+"""Utilities to match many regular expressions against the lines of a file"""
+
+import re
+
+# Characters with a special meaning in regular expressions
+_regex_special_chars = frozenset(".^$*+?{}[]()|\\")
+
+# Quantifiers which make the preceding character optional
+_optional_quantifiers = frozenset("*?{")
+
+# Flags which change how the literal characters of a pattern match
+_unsupported_flags = re.IGNORECASE | re.VERBOSE
+
+
+def literal_prefix(pattern):
+    """Extract the literal prefix of a regular expression
+
+    Any string matched (using re.match) by the pattern has to start with the
+    returned prefix. The extraction is conservative, and returns an empty
+    string whenever the pattern is not understood.
+
+    Args:
+        pattern (str): Regular expression to extract the prefix of
+
+    Returns:
+        (str): Literal prefix of pattern
+    """
+    if _has_unescaped(pattern, "|"):
+        return ""
+
+    prefix = []
+    i = 0
+    if pattern.startswith("^"):
+        i = 1
+
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                break
+            c = pattern[i + 1]
+            i += 2
+        elif c in _regex_special_chars:
+            break
+        else:
+            i += 1
+
+        if i < len(pattern) and pattern[i] in _optional_quantifiers:
+            break
+
+        prefix.append(c)
+
+        if i < len(pattern) and pattern[i] == "+":
+            break
+
+    return "".join(prefix)
+
+
+def _has_unescaped(pattern, char):
+    """Check if pattern contains char, outside of escape sequences"""
+    escaped = False
+    for c in pattern:
+        if escaped:
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif c == char:
+            return True
+    return False
+
+
+class LineMatcher:
+    """Select the patterns which can match the start of a line
+
+    A matcher holds an ordered list of (compiled regex, payload) entries, and
+    indexes them by the first character of their literal prefix. For each
+    line, candidates() returns only the entries which can match it, in their
+    original order, after a single dictionary lookup. Lines which cannot
+    match any pattern are rejected without running any regular expression.
+    """
+
+    def __init__(self, entries):
+        """Build a matcher from an ordered list of entries
+
+        Args:
+            entries (list): List of (compiled regex, payload) tuples. Regexes
+                            are expected to be used with re.match
+        """
+        always = []
+        by_first_char = {}
+
+        for idx, (regex, payload) in enumerate(entries):
+            prefix = ""
+            if not regex.flags & _unsupported_flags:
+                prefix = literal_prefix(regex.pattern)
+            entry = (regex, prefix, payload)
+            if prefix:
+                by_first_char.setdefault(prefix[0], []).append((idx, entry))
+            else:
+                always.append((idx, entry))
+
+        self._always_entries = tuple(entry for _, entry in always)
+        self._dispatch = {}
+        for first_char, char_entries in by_first_char.items():
+            merged = sorted(char_entries + always, key=lambda item: item[0])
+            self._dispatch[first_char] = tuple(entry for _, entry in merged)
+
+    def candidates(self, line):
+        """Return the entries which may match line, in their original order
+
+        Args:
+            line (str): Line to find candidate entries for
+
+        Returns:
+            (tuple): Tuple of (compiled regex, literal prefix, payload) entries
+        """
+        return self._dispatch.get(line[:1], self._always_entries)
+
+    def matches(self, line):
+        """Yield (match object, payload) for all entries matching line
+
+        Args:
+            line (str): Line to match entries against
+        """
+        for regex, prefix, payload in self.candidates(line):
+            if line.startswith(prefix):
+                match = regex.match(line)
+                if match:
+                    yield match, payload
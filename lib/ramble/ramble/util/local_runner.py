@@ -0,0 +1,140 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+"""Run commands on the local machine, packed against its available cores"""
+
+import multiprocessing.pool
+import queue
+import subprocess
+import threading
+
+
+class LocalTask:
+    """A command to run locally, and the number of cores it occupies"""
+
+    __slots__ = ("name", "command", "cwd", "log_path", "cores", "returncode")
+
+    def __init__(self, name, command, cwd, log_path, cores=1):
+        """Constructor for a LocalTask
+
+        Args:
+            name (str): Name of the task
+            command (list): Command to run, and its arguments
+            cwd (str): Directory to run the command in
+            log_path (str): File to write the output of the command to
+            cores (int): Number of cores the command occupies
+        """
+        self.name = name
+        self.command = command
+        self.cwd = cwd
+        self.log_path = log_path
+        self.cores = cores
+        self.returncode = None
+
+
+class _Processes:
+    """Processes started by run_tasks, which are killed if it is interrupted"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._processes = set()
+        self._stopped = False
+
+    def run(self, task):
+        with open(task.log_path, "w+") as log:
+            try:
+                with self._lock:
+                    if self._stopped:
+                        task.returncode = -1
+                        return task
+                    process = subprocess.Popen(
+                        task.command, cwd=task.cwd, stdout=log, stderr=subprocess.STDOUT
+                    )
+                    self._processes.add(process)
+            except OSError as e:
+                log.write(f"Failed to run {task.command}: {e}\n")
+                task.returncode = 127
+                return task
+
+            task.returncode = process.wait()
+            with self._lock:
+                self._processes.discard(process)
+        return task
+
+    def kill(self):
+        with self._lock:
+            self._stopped = True
+            for process in self._processes:
+                process.kill()
+            for process in self._processes:
+                process.wait()
+            self._processes.clear()
+
+
+def run_tasks(tasks, total_cores, on_start=None, on_complete=None):
+    """Run tasks concurrently, without using more than total_cores at a time
+
+    Tasks are started in order. When a task does not fit in the free cores,
+    later tasks which fit are started first, so small tasks fill the cores
+    left over by larger ones. Tasks needing more than total_cores are run
+    once all other running tasks are complete. If this is interrupted (or a
+    callback raises), processes which are still running are killed.
+
+    Args:
+        tasks (list(LocalTask)): Tasks to run
+        total_cores (int): Number of cores available to tasks
+        on_start (func): Called with each task, before it starts
+        on_complete (func): Called with each task, once it is complete
+
+    Returns:
+        (list(LocalTask)): The tasks, with their return codes
+    """
+    pending = list(tasks)
+    if not pending:
+        return tasks
+
+    completed = queue.Queue()
+    processes = _Processes()
+    free_cores = total_cores
+    num_running = 0
+
+    tp = multiprocessing.pool.ThreadPool(processes=min(total_cores, len(pending)))
+    try:
+        while pending or num_running:
+            idx = 0
+            while idx < len(pending):
+                task = pending[idx]
+                cores = min(task.cores, total_cores)
+                if cores <= free_cores:
+                    del pending[idx]
+                    free_cores -= cores
+                    num_running += 1
+                    if on_start:
+                        on_start(task)
+                    tp.apply_async(
+                        processes.run,
+                        (task,),
+                        callback=completed.put,
+                        error_callback=completed.put,
+                    )
+                else:
+                    idx += 1
+
+            task = completed.get()
+            if isinstance(task, BaseException):
+                raise task
+            free_cores += min(task.cores, total_cores)
+            num_running -= 1
+            if on_complete:
+                on_complete(task)
+    finally:
+        processes.kill()
+        tp.terminate()
+        tp.join()
+
+    return tasks
@@ -6,6 +6,8 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
+import threading
+
 import llnl.util.tty as tty
 import llnl.util.tty.log
 import llnl.util.tty.color
@@ -31,9 +33,42 @@ class Logger:
         If the enabled flag is set to False, the logger will only print to
         screen instead of to underlying files.
         """
-        self.log_stack = []
+        self._log_stack = []
+        self._thread_state = threading.local()
         self.enabled = True
 
+    @property
+    def log_stack(self):
+        """The log stack of the calling thread
+
+        Threads which entered thread_logs have their own stack, all other
+        threads share the main stack.
+        """
+        return getattr(self._thread_state, "log_stack", self._log_stack)
+
+    @contextmanager
+    def thread_logs(self, parent_stack=None):
+        """Give the calling thread its own log stack
+
+        The new stack starts with the logs of parent_stack (typically the log
+        stack of the thread which spawned this one), so messages printed to
+        all logs still reach them. Logs inherited this way remain owned by the
+        parent, and are never closed by this thread.
+
+        Args:
+            parent_stack: Log stack to inherit logs from
+        """
+        inherited = list(parent_stack) if parent_stack is not None else []
+        self._thread_state.log_stack = inherited
+        self._thread_state.inherited_depth = len(inherited)
+        try:
+            yield
+        finally:
+            while len(self.log_stack) > self._thread_state.inherited_depth:
+                self.remove_log()
+            del self._thread_state.log_stack
+            del self._thread_state.inherited_depth
+
     def add_log(self, path):
         """Add a log to the current log stack
 
@@ -220,7 +255,8 @@ class Logger:
             with self.configure_colors(**st_kwargs):
                 tty.error(*args, **st_kwargs)
 
-        while self.log_stack:
+        inherited_depth = getattr(self._thread_state, "inherited_depth", 0)
+        while len(self.log_stack) > inherited_depth:
             self.remove_log()
 
         tty.die(*args, **kwargs)
@@ -0,0 +1,259 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+"""Writers which stream workspace results into files
+
+Each writer serializes the results of one experiment at a time, so writing
+results never requires a serialized copy of all of a workspace's results in
+memory.
+"""
+
+import csv
+import json
+
+import spack.util.spack_yaml as syaml
+
+from ramble.util.logger import logger
+
+_json_dump_args = {"indent": 2, "separators": (",", ": ")}
+
+
+class ResultsWriter:
+    """Base class for writers of workspace results
+
+    A writer is given the results dictionary of a workspace in begin() and
+    end(), and the results of each experiment, in order, in
+    write_experiment().
+    """
+
+    #: Name of the output format, as given to ``ramble workspace analyze -f``
+    name = None
+
+    #: Extension of files written by this writer
+    extension = None
+
+    def __init__(self, stream, always_print_foms=False):
+        self.stream = stream
+        self.always_print_foms = always_print_foms
+
+    def begin(self, results):
+        """Write anything preceding the first experiment"""
+        pass
+
+    def write_experiment(self, exp):
+        """Write the results of a single experiment"""
+        raise NotImplementedError
+
+    def end(self, results):
+        """Write anything following the last experiment"""
+        pass
+
+
+class TextResultsWriter(ResultsWriter):
+    """Human readable summary of results"""
+
+    name = "text"
+    extension = ".txt"
+
+    def begin(self, results):
+        self.stream.write(
+            f"From Workspace: {results['workspace_name']} (hash: {results['workspace_hash']})\n"
+        )
+        if "experiments" not in results:
+            logger.msg("No results to write")
+
+    def write_experiment(self, exp):
+        f = self.stream
+        f.write("Experiment %s figures of merit:\n" % exp["name"])
+        f.write("  Status = %s\n" % exp["RAMBLE_STATUS"])
+        if "TAGS" in exp:
+            f.write(f'  Tags = {exp["TAGS"]}\n')
+
+        if exp["RAMBLE_STATUS"] == "SUCCESS" or self.always_print_foms:
+            if exp["N_REPEATS"] > 0:  # this is a base exp with summary of repeats
+                for context in exp["CONTEXTS"]:
+                    f.write(f'  {context["display_name"]} figures of merit:\n')
+
+                    fom_summary = {}
+                    for fom in context["foms"]:
+                        name = fom["name"]
+                        if name not in fom_summary.keys():
+                            fom_summary[name] = []
+                        stat_name = fom["origin_type"]
+                        value = fom["value"]
+                        units = fom["units"]
+
+                        output = f"{stat_name} = {value} {units}\n"
+                        fom_summary[name].append(output)
+
+                    for fom_name, fom_val_list in fom_summary.items():
+                        f.write(f"    {fom_name}:\n")
+                        for fom_val in fom_val_list:
+                            f.write(f"      {fom_val.strip()}\n")
+            else:
+                for context in exp["CONTEXTS"]:
+                    f.write(f'  {context["display_name"]} figures of merit:\n')
+                    for fom in context["foms"]:
+                        name = fom["name"]
+                        if fom["origin_type"] == "modifier":
+                            delim = "::"
+                            mod = fom["origin"]
+                            name = f"{fom['origin_type']}{delim}{mod}{delim}{name}"
+
+                        output = "{} = {} {}".format(name, fom["value"], fom["units"])
+                        f.write("    %s\n" % (output.strip()))
+
+
+class JsonResultsWriter(ResultsWriter):
+    """Results as a single JSON document
+
+    The output is identical to dumping the whole results dictionary with
+    spack_json, but only one experiment is serialized at a time.
+    """
+
+    name = "json"
+    extension = ".json"
+
+    def begin(self, results):
+        self.stream.write("{")
+        self._first_key = True
+        for key, value in results.items():
+            if key == "experiments":
+                self._write_key(key)
+                self.stream.write("[")
+                self._first_experiment = True
+                # Keys following experiments are written in end()
+                return
+            self._write_item(key, value)
+
+    def write_experiment(self, exp):
+        if not self._first_experiment:
+            self.stream.write(",")
+        self._first_experiment = False
+        self.stream.write("\n    ")
+        self.stream.write(_indent(json.dumps(exp, **_json_dump_args), "    "))
+
+    def end(self, results):
+        if "experiments" in results:
+            if not self._first_experiment:
+                self.stream.write("\n  ")
+            self.stream.write("]")
+
+            keys = list(results.keys())
+            for key in keys[keys.index("experiments") + 1 :]:
+                self._write_item(key, results[key])
+
+        self.stream.write("\n}" if not self._first_key else "}")
+
+    def _write_key(self, key):
+        if not self._first_key:
+            self.stream.write(",")
+        self._first_key = False
+        self.stream.write(f"\n  {json.dumps(key)}: ")
+
+    def _write_item(self, key, value):
+        self._write_key(key)
+        self.stream.write(_indent(json.dumps(value, **_json_dump_args), "  "))
+
+
+class YamlResultsWriter(ResultsWriter):
+    """Results as a single YAML document
+
+    The output is identical to dumping the whole results dictionary with
+    spack_yaml, but only one experiment is serialized at a time.
+    """
+
+    name = "yaml"
+    extension = ".yaml"
+
+    def begin(self, results):
+        for key, value in results.items():
+            if key == "experiments":
+                if not value:
+                    syaml.dump({key: value}, stream=self.stream)
+                else:
+                    self.stream.write(f"{key}:\n")
+                # Keys following experiments are written in end()
+                return
+            syaml.dump({key: value}, stream=self.stream)
+
+    def write_experiment(self, exp):
+        syaml.dump([exp], stream=self.stream)
+
+    def end(self, results):
+        if "experiments" in results:
+            keys = list(results.keys())
+            for key in keys[keys.index("experiments") + 1 :]:
+                syaml.dump({key: results[key]}, stream=self.stream)
+
+
+class JsonLinesResultsWriter(ResultsWriter):
+    """Results as JSON Lines, with one experiment per line"""
+
+    name = "jsonl"
+    extension = ".jsonl"
+
+    def write_experiment(self, exp):
+        self.stream.write(json.dumps(exp))
+        self.stream.write("\n")
+
+
+class CsvResultsWriter(ResultsWriter):
+    """Results as a flat table, with one row per figure of merit"""
+
+    name = "csv"
+    extension = ".csv"
+
+    columns = [
+        "experiment_name",
+        "status",
+        "context",
+        "fom_name",
+        "value",
+        "units",
+        "origin",
+        "origin_type",
+    ]
+
+    def begin(self, results):
+        self._writer = csv.writer(self.stream, lineterminator="\n")
+        self._writer.writerow(self.columns)
+
+    def write_experiment(self, exp):
+        for context in exp.get("CONTEXTS", []):
+            for fom in context["foms"]:
+                self._writer.writerow(
+                    [
+                        exp["name"],
+                        exp["RAMBLE_STATUS"],
+                        context["name"],
+                        fom["name"],
+                        fom["value"],
+                        fom["units"],
+                        fom["origin"],
+                        fom["origin_type"],
+                    ]
+                )
+
+
+#: All results writers, in the order their files are written
+writers = [
+    TextResultsWriter,
+    JsonResultsWriter,
+    YamlResultsWriter,
+    JsonLinesResultsWriter,
+    CsvResultsWriter,
+]
+
+#: Names of all supported output formats
+output_formats = [writer.name for writer in writers]
+
+
+def _indent(text, prefix):
+    """Indent all lines of text, except the first one, by prefix"""
+    return text.replace("\n", "\n" + prefix)
@@ -6,7 +6,12 @@
 # option. This file may not be copied, modified, or distributed
 # except according to those terms.
 
-import statistics
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 def decimal_places(value):
@@ -22,55 +27,189 @@ def decimal_places(value):
 def max_decimal_places(list):
     """Returns the max decimal places of a list of values"""
 
-    max = 0
-    for val in list:
-        if decimal_places(val) > max:
-            max = decimal_places(val)
-    return max
+    return max((decimal_places(val) for val in list), default=0)
+
+
+# Two-sided 95% critical values of Student's t distribution, indexed by
+# degrees of freedom
+_t_critical_95 = [
+    None,
+    12.706,
+    4.303,
+    3.182,
+    2.776,
+    2.571,
+    2.447,
+    2.365,
+    2.306,
+    2.262,
+    2.228,
+    2.201,
+    2.179,
+    2.160,
+    2.145,
+    2.131,
+    2.120,
+    2.110,
+    2.101,
+    2.093,
+    2.086,
+    2.080,
+    2.074,
+    2.069,
+    2.064,
+    2.060,
+    2.056,
+    2.052,
+    2.048,
+    2.045,
+    2.042,
+]
+
+_z_critical_95 = 1.959964
+
+
+def t_critical_95(dof):
+    """Returns the two-sided 95% critical value of Student's t distribution
+
+    Values up to 30 degrees of freedom are tabulated. Larger degrees of
+    freedom use the Cornish-Fisher expansion around the normal distribution.
+    """
+    if dof < len(_t_critical_95):
+        return _t_critical_95[dof]
+
+    z = _z_critical_95
+    return z + (z**3 + z) / (4 * dof) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2)
+
+
+class RepeatSummary:
+    """Summary of a list of values, shared by all statistics
+
+    The values are sorted, averaged, and inspected for decimal places once,
+    and every statistic is derived from the summary.
+    """
+
+    def __init__(self, values, sorted_values, mean, variance):
+        self.values = values
+        self.count = len(values)
+        self.sorted_values = sorted_values
+        self.mean = mean
+        self.variance = variance
+        self.decimals = max_decimal_places(values)
+
+    def median(self):
+        """Returns the median of the values"""
+        mid = self.count // 2
+        if self.count % 2:
+            return self.sorted_values[mid]
+        return (self.sorted_values[mid - 1] + self.sorted_values[mid]) / 2
+
+    def percentile(self, percent):
+        """Returns a percentile of the values, interpolating linearly"""
+        position = (self.count - 1) * percent / 100
+        lower = math.floor(position)
+        upper = min(lower + 1, self.count - 1)
+        fraction = position - lower
+        lower_val = self.sorted_values[lower]
+        return lower_val + (self.sorted_values[upper] - lower_val) * fraction
+
+
+def summarize(values):
+    """Summarize a list of values"""
+    count = len(values)
+    mean = None
+    variance = None
+    if count:
+        mean = math.fsum(values) / count
+    if count > 1:
+        variance = math.fsum((val - mean) ** 2 for val in values) / (count - 1)
+    return RepeatSummary(values, sorted(values), mean, variance)
+
+
+def summarize_all(value_lists):
+    """Summarize many lists of values at once
+
+    When numpy is available, lists with the same number of values are
+    summarized together as the rows of a single array.
+
+    Args:
+        value_lists (list): List of lists of values to summarize
+
+    Returns:
+        (list): A RepeatSummary for each list of values
+    """
+    if np is None:
+        return [summarize(values) for values in value_lists]
+
+    lists_by_count = {}
+    for idx, values in enumerate(value_lists):
+        lists_by_count.setdefault(len(values), []).append(idx)
+
+    summaries = [None] * len(value_lists)
+    for count, indices in lists_by_count.items():
+        if count < 2:
+            for idx in indices:
+                summaries[idx] = summarize(value_lists[idx])
+            continue
+
+        data = np.array([value_lists[idx] for idx in indices], dtype=float)
+        sorted_data = np.sort(data, axis=1).tolist()
+        means = data.mean(axis=1).tolist()
+        variances = data.var(axis=1, ddof=1).tolist()
+
+        for row, idx in enumerate(indices):
+            summaries[idx] = RepeatSummary(
+                value_lists[idx], sorted_data[row], means[row], variances[row]
+            )
+
+    return summaries
 
 
 class StatsBase:
     min_count = 1
 
-    def compute(self, values):
+    def compute(self, summary):
         pass
 
     def get_unit(self, unit):
         return unit
 
     def report(self, values, unit):
+        return self.report_summary(summarize(values), unit)
+
+    def report_summary(self, summary, unit):
         label = f"summary::{self.name}"
-        if len(values) < self.min_count:
+        if summary.count < self.min_count:
             return ("NA", "", label)
-        return (self.compute(values), self.get_unit(unit), label)
+        return (self.compute(summary), self.get_unit(unit), label)
 
 
 class StatsMin(StatsBase):
     name = "min"
 
-    def compute(self, values):
-        return min(values)
+    def compute(self, summary):
+        return summary.sorted_values[0]
 
 
 class StatsMax(StatsBase):
     name = "max"
 
-    def compute(self, values):
-        return max(values)
+    def compute(self, summary):
+        return summary.sorted_values[-1]
 
 
 class StatsMean(StatsBase):
     name = "mean"
 
-    def compute(self, values):
-        return round(statistics.mean(values), max_decimal_places(values))
+    def compute(self, summary):
+        return round(summary.mean, summary.decimals)
 
 
 class StatsMedian(StatsBase):
     name = "median"
 
-    def compute(self, values):
-        return round(statistics.median(values), max_decimal_places(values))
+    def compute(self, summary):
+        return round(summary.median(), summary.decimals)
 
 
 class StatsVar(StatsBase):
@@ -80,32 +219,29 @@ class StatsVar(StatsBase):
     def get_unit(self, unit):
         return f"{unit}^2"
 
-    def compute(self, values):
-        return round(statistics.variance(values), max_decimal_places(values))
+    def compute(self, summary):
+        return round(summary.variance, summary.decimals)
 
 
 class StatsStdev(StatsBase):
     name = "stdev"
     min_count = 2
 
-    def compute(self, values):
-        return round(statistics.stdev(values), max_decimal_places(values))
+    def compute(self, summary):
+        return round(math.sqrt(summary.variance), summary.decimals)
 
 
 class StatsCoefficientOfVariation(StatsBase):
     name = "cv"
     min_count = 2
 
-    def compute(self, values):
-        mean = statistics.mean(values)
+    def compute(self, summary):
         # Only guard against zero mean.
         # While CV isn't particularly meaningful when negative values are present,
         # calculate anyway and leave the interpretation to individual experiments.
-        if not mean:
+        if not summary.mean:
             return "NA"
-        return round(
-            statistics.stdev(values) / statistics.mean(values), max_decimal_places(values)
-        )
+        return round(math.sqrt(summary.variance) / summary.mean, summary.decimals)
 
     def get_unit(self, unit):
         # `unit` unused
@@ -116,13 +252,38 @@ class StatsCoefficientOfVariation(StatsBase):
 class StatsCountValues(StatsBase):
     name = "n_successful_repeats"
 
-    def compute(self, values):
-        return len(values)
+    def compute(self, summary):
+        return summary.count
 
     def get_unit(self, unit):
         return "repeats"
 
 
+class StatsPercentile(StatsBase):
+    def __init__(self, percent):
+        self.percent = percent
+        self.name = f"p{percent}"
+
+    def compute(self, summary):
+        return round(summary.percentile(self.percent), summary.decimals)
+
+
+class StatsConfidenceInterval(StatsBase):
+    """Bound of the 95% confidence interval of the mean"""
+
+    min_count = 2
+
+    def __init__(self, upper):
+        self.upper = upper
+        self.name = "ci95_upper" if upper else "ci95_lower"
+
+    def compute(self, summary):
+        half_width = t_critical_95(summary.count - 1) * math.sqrt(summary.variance / summary.count)
+        if self.upper:
+            return round(summary.mean + half_width, summary.decimals)
+        return round(summary.mean - half_width, summary.decimals)
+
+
 all_stats = [
     StatsMin(),
     StatsMax(),
@@ -132,4 +293,27 @@ all_stats = [
     StatsStdev(),
     StatsCoefficientOfVariation(),
     StatsCountValues(),
+    StatsPercentile(5),
+    StatsPercentile(25),
+    StatsPercentile(75),
+    StatsPercentile(95),
+    StatsConfidenceInterval(upper=False),
+    StatsConfidenceInterval(upper=True),
 ]
+
+
+def report_all(value_lists, units):
+    """Report all statistics for many lists of values
+
+    Args:
+        value_lists (list): List of lists of values
+        units (list): Units of each list of values
+
+    Returns:
+        (list): For each list of values, a list of (value, unit, label)
+                tuples, one per statistic in all_stats
+    """
+    reports = []
+    for summary, unit in zip(summarize_all(value_lists), units):
+        reports.append([statistic.report_summary(summary, unit) for statistic in all_stats])
+    return reports
@@ -0,0 +1,198 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+"""Helpers for submitting experiments to schedulers in bulk
+
+Experiments whose executors only differ by the experiment's script, and
+whose scripts request the same resources through scheduler directives, are
+grouped into a single submission. A group is either submitted as a
+manifest, which one job walks through running every script in order, or
+as an array job, where each array task runs one script of the manifest.
+"""
+
+import os
+import re
+import stat
+import threading
+import time
+
+#: Modes of bulk submission
+bulk_modes = ("manifest", "array")
+
+#: Default pattern extracting the job ID from the output of a submission
+#: (e.g. "Submitted batch job 1234", "1234.server", "Job <1234> is submitted")
+default_job_id_regex = r"(\d+)"
+
+#: Placeholders substituted into executors to group experiments
+script_placeholder = "__RAMBLE_BULK_SCRIPT__"
+array_size_placeholder = "__RAMBLE_ARRAY_SIZE__"
+array_max_index_placeholder = "__RAMBLE_ARRAY_MAX_INDEX__"
+
+#: Environment variables array tasks read their (0-based) index from, in order
+array_index_vars = ("RAMBLE_ARRAY_INDEX", "SLURM_ARRAY_TASK_ID", "PBS_ARRAY_INDEX")
+
+#: Prefixes of scheduler directive lines in the header of a script
+directive_prefixes = ("#SBATCH", "#PBS", "#BSUB", "#COBALT", "#FLUX:", "#PJM", "#MSUB", "#$")
+
+_manifest_driver = """#!/bin/sh
+{directives}# Run every experiment script listed in the manifest, in order
+while IFS= read -r script; do
+    "$script"
+done < "{manifest}"
+"""
+
+_array_driver = """#!/bin/sh
+{directives}# Run the experiment script at this array task's (0-based) index in the manifest
+index="{index}"
+script=$(sed -n "$((index + 1))p" "{manifest}")
+exec "$script"
+"""
+
+
+def script_directives(path):
+    """Read the scheduler directives from the header of a script
+
+    Schedulers only read directives from the comment block at the top of a
+    script, so reading stops at the first line which is not a comment.
+
+    Args:
+        path (str): Path to the script
+
+    Returns:
+        (tuple(str)): Directive lines of the script, in order
+    """
+    directives = []
+    if not os.path.isfile(path):
+        return tuple(directives)
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith("#"):
+                break
+            if line.startswith(directive_prefixes):
+                directives.append(line)
+    return tuple(directives)
+
+
+class RateLimiter:
+    """Limit the rate of actions performed by any number of threads"""
+
+    def __init__(self, rate=0):
+        """Constructor for a RateLimiter
+
+        Args:
+            rate (float): Maximum number of actions per second. Unlimited if 0.
+        """
+        self._interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self):
+        """Block until the next action is allowed"""
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self._interval
+
+        if start > now:
+            time.sleep(start - now)
+
+
+class SubmissionGroup:
+    """Experiments submitted together, with a single submission command"""
+
+    def __init__(self, command_template, directives=()):
+        """Constructor for a SubmissionGroup
+
+        Args:
+            command_template (str): Expanded executor, with the experiment's
+                                    script (and array size) replaced by
+                                    placeholders
+            directives (tuple(str)): Scheduler directives shared by the
+                                     scripts of the group
+        """
+        self.command_template = command_template
+        self.directives = directives
+        self.experiments = []
+        self.scripts = []
+        self.commands = []
+
+    def add(self, exp, script, command):
+        """Add an experiment to this group
+
+        Args:
+            exp (str): Namespace of the experiment
+            script (str): Path to the experiment's execute_experiment script
+            command (str): Command submitting the experiment on its own
+        """
+        self.experiments.append(exp)
+        self.scripts.append(script)
+        self.commands.append(command)
+
+    def write(self, path, mode):
+        """Write the manifest and driver script of this group
+
+        The driver carries the scheduler directives of the group's scripts,
+        so the submission requests the same resources as each script would.
+
+        Args:
+            path (str): Path prefix of the manifest and driver files
+            mode (str): One of bulk_modes
+
+        Returns:
+            (str): The submission command of this group
+        """
+        manifest = f"{path}.manifest"
+        driver = f"{path}.sh"
+
+        with open(manifest, "w+") as f:
+            for script in self.scripts:
+                f.write(f"{script}\n")
+
+        directives = "".join(f"{directive}\n" for directive in self.directives)
+        if mode == "array":
+            index = "0"
+            for var in reversed(array_index_vars):
+                index = f"${{{var}:-{index}}}"
+            driver_contents = _array_driver.format(
+                directives=directives, index=index, manifest=manifest
+            )
+        else:
+            driver_contents = _manifest_driver.format(directives=directives, manifest=manifest)
+
+        with open(driver, "w+") as f:
+            f.write(driver_contents)
+        os.chmod(driver, stat.S_IRWXU | stat.S_IRWXG | stat.S_IROTH | stat.S_IXOTH)
+
+        return (
+            self.command_template.replace(script_placeholder, driver)
+            .replace(array_size_placeholder, str(len(self.scripts)))
+            .replace(array_max_index_placeholder, str(len(self.scripts) - 1))
+        )
+
+
+def parse_job_id(output, job_id_regex=default_job_id_regex):
+    """Extract the job ID from the output of a submission
+
+    Args:
+        output (str): Output of the submission command
+        job_id_regex (str): Pattern whose first group (or whole match) is the job ID
+
+    Returns:
+        (str): The job ID, or None if the output does not contain one
+    """
+    match = re.search(job_id_regex, output or "")
+    if match is None:
+        return None
+    return match.group(1) if match.groups() else match.group(0)
@@ -0,0 +1,157 @@
+# Copyright 2022-2024 The Ramble Authors
+#
+# Licensed under the Apache License, Version 2.0 <LICENSE-APACHE or
+# https://www.apache.org/licenses/LICENSE-2.0> or the MIT license
+# <LICENSE-MIT or https://opensource.org/licenses/MIT>, at your
+# option. This file may not be copied, modified, or distributed
+# except according to those terms.
+
+"""Single file database of the state of all experiments in a workspace"""
+
+import json
+import sqlite3
+import threading
+
+from ramble.util.logger import logger
+
+#: Version of the database layout. Databases with a different version are
+#: recreated, as they only hold state which can be recomputed.
+schema_version = 2
+
+#: Columns of the experiments table, which hold JSON encoded values
+_state_columns = ("status", "inventory", "analysis", "phase_times", "job")
+
+#: Columns which are only read for an experiment when they are requested, as
+#: they can be large (e.g. the analysis cache holds an experiment's results)
+_lazy_columns = ("analysis",)
+
+
+class StateDatabase:
+    """SQLite database holding the state of all experiments in a workspace
+
+    The state of each experiment (its status, hash inventory, analysis cache,
+    phase timings and submitted job) is stored in a single row, keyed by the experiment
+    namespace. This replaces opening one small file per experiment (in its
+    run directory) with a single query when experiments are read, which is
+    much cheaper on parallel filesystems.
+
+    All rows are read at once, the first time any state is requested,
+    except for large columns (the analysis cache), which are read for each
+    experiment when requested. Updates are applied to the in-memory copy
+    immediately, and written to the database in a single transaction when
+    flush() is called.
+    """
+
+    def __init__(self, path):
+        """Constructor for a StateDatabase
+
+        Args:
+            path (str): Path to the database file. It is created if needed.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._connection = None
+        self._state = None
+        self._pending = {}
+
+    def _connect(self):
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=60, check_same_thread=False)
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            with connection:
+                if version != schema_version:
+                    logger.debug(f"Creating experiment state database {self.path}")
+                    connection.execute("DROP TABLE IF EXISTS experiments")
+                    connection.execute(
+                        "CREATE TABLE experiments ("
+                        "namespace TEXT PRIMARY KEY, "
+                        + ", ".join(f"{column} TEXT" for column in _state_columns)
+                        + ")"
+                    )
+                    connection.execute(f"PRAGMA user_version = {schema_version}")
+            self._connection = connection
+        return self._connection
+
+    def _all_state(self):
+        if self._state is None:
+            state = {}
+            eager_columns = [column for column in _state_columns if column not in _lazy_columns]
+            columns = ", ".join(eager_columns)
+            for row in self._connect().execute(f"SELECT namespace, {columns} FROM experiments"):
+                state[row[0]] = {
+                    column: json.loads(value)
+                    for column, value in zip(eager_columns, row[1:])
+                    if value is not None
+                }
+            self._state = state
+        return self._state
+
+    def _experiment_state(self, namespace, key):
+        """State of an experiment, with the lazy column key read if needed"""
+        exp_state = self._all_state().setdefault(namespace, {})
+        if key in _lazy_columns and key not in exp_state:
+            row = (
+                self._connect()
+                .execute(f"SELECT {key} FROM experiments WHERE namespace = ?", (namespace,))
+                .fetchone()
+            )
+            exp_state[key] = json.loads(row[0]) if row and row[0] is not None else None
+        return exp_state
+
+    def get(self, namespace, key):
+        """Get a piece of an experiment's state
+
+        Args:
+            namespace (str): Namespace of the experiment
+            key (str): One of status, inventory, analysis, phase_times, or job
+
+        Returns:
+            The stored value, or None if it was never stored
+        """
+        with self._lock:
+            return self._experiment_state(namespace, key).get(key)
+
+    def set(self, namespace, key, value):
+        """Set a piece of an experiment's state
+
+        The value is written to the database on the next call to flush().
+
+        Args:
+            namespace (str): Namespace of the experiment
+            key (str): One of status, inventory, analysis, phase_times, or job
+            value: JSON serializable value to store
+        """
+        with self._lock:
+            self._all_state().setdefault(namespace, {})[key] = value
+            self._pending.setdefault(namespace, {})[key] = json.dumps(value, separators=(",", ":"))
+
+    def flush(self):
+        """Write all pending updates to the database, in one transaction"""
+        with self._lock:
+            if not self._pending:
+                return
+
+            # INSERT OR IGNORE followed by UPDATE, rather than an upsert,
+            # which needs SQLite 3.24 or newer.
+            connection = self._connect()
+            with connection:
+                for namespace, values in self._pending.items():
+                    columns = list(values.keys())
+                    updates = ", ".join(f"{column} = ?" for column in columns)
+                    connection.execute(
+                        "INSERT OR IGNORE INTO experiments (namespace) VALUES (?)", (namespace,)
+                    )
+                    connection.execute(
+                        f"UPDATE experiments SET {updates} WHERE namespace = ?",
+                        [values[column] for column in columns] + [namespace],
+                    )
+            self._pending = {}
+
+    def close(self):
+        """Flush pending updates, and close the database connection"""
+        with self._lock:
+            self.flush()
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            self._state = None
@@ -13,6 +13,7 @@ import re
 import shutil
 import datetime
 import fnmatch
+import threading
 from collections import defaultdict
 
 import llnl.util.filesystem as fs
@@ -47,6 +48,8 @@ import ramble.util.lock as lk
 from ramble.util.path import substitute_path_variables
 from ramble.util.spec_utils import specs_equiv
 import ramble.util.hashing
+import ramble.util.results_writers
+import ramble.workspace.state_database
 from ramble.namespace import namespace
 import ramble.util.matrices
 import ramble.util.env
@@ -86,6 +89,9 @@ workspace_shared_license_path = "licenses"
 #: Name of the subdirectory where deployments are stored
 workspace_deployments_path = "deployments"
 
+#: Name of the subdirectory where parsed and validated config files are cached
+workspace_config_cache_path = ".config_cache"
+
 #: regex for validating workspace names
 valid_workspace_name_re = r"^\w[\w-]*$"
 
@@ -462,6 +468,7 @@ class Workspace:
 
     inventory_file_name = "ramble_inventory.json"
     hash_file_name = "workspace_hash.sha256"
+    state_database_file_name = "ramble_state.db"
 
     def __init__(self, root, dry_run=False, read_default_template=True):
         logger.debug(f"In workspace init. Root = {root}")
@@ -469,11 +476,16 @@ class Workspace:
         self.txlock = lk.Lock(self._transaction_lock_path)
         self.dry_run = dry_run
         self.always_print_foms = False
+        self.analysis_cache = True
         self.repeat_success_strict = True
         self.force_concretize = False
 
         self.read_default_template = read_default_template
-        self.configs = ramble.config.ConfigScope("workspace", self.config_dir)
+        self.config_cache = ramble.config.ConfigCache(self.config_cache_dir)
+        self._state_database = None
+        self.configs = ramble.config.ConfigScope(
+            "workspace", self.config_dir, cache=self.config_cache
+        )
         self._templates = {}
         self._auxiliary_software_files = {}
         self.software_mirror_path = None
@@ -504,13 +516,22 @@ class Workspace:
 
         self.install_cache = ramble.util.install_cache.SetCache()
 
-        # A per-package_manager dict mapping package spec to its install prefix.
-        # This can be re-used by all experiments of the workspace.
+        # Serializes access to resources shared between experiments (software
+        # environments, inputs, caches) when experiments are processed concurrently
+        self.shared_resource_lock = threading.RLock()
+        self._thread_state = threading.local()
+        # Serializes updates of the results, which concurrently analyzed
+        # experiments add to
+        self._results_lock = threading.RLock()
+
+        # A per-package_manager dict caching the install prefixes of packages.
+        # This can be re-used by all experiments of the workspace. Package
+        # managers define their own layout (spack keys it by environment path).
         self.pkg_path_cache = defaultdict(dict)
 
         self.results = self.default_results()
 
-        self.success_list = ramble.success_criteria.ScopedCriteriaList()
+        self._success_list = ramble.success_criteria.ScopedCriteriaList()
 
         # Key for each application config should be it's filepath
         # Format for an application config should be:
@@ -653,10 +674,10 @@ class Workspace:
 
     def _read_yaml(self, config, f, raw_yaml=None):
         if raw_yaml:
-            _, config["yaml"] = _read_yaml(f, config["schema"])
-            config["raw_yaml"], _ = _read_yaml(raw_yaml, config["schema"])
+            _, config["yaml"] = _read_yaml(f, config["schema"], self.config_cache)
+            config["raw_yaml"], _ = _read_yaml(raw_yaml, config["schema"], self.config_cache)
         else:
-            config["raw_yaml"], config["yaml"] = _read_yaml(f, config["schema"])
+            config["raw_yaml"], config["yaml"] = _read_yaml(f, config["schema"], self.config_cache)
 
     def _read_template(self, name, f):
         """Read a template file"""
@@ -722,6 +743,43 @@ class Workspace:
         self._previous_active = None  # previously active environment
         self.specs = []
 
+    @property
+    def state_database(self):
+        """The experiment state database of this workspace
+
+        Returns:
+            (StateDatabase): The database, or None if config:state_database
+                             is disabled
+        """
+        if self._state_database is None and ramble.config.get("config:state_database", False):
+            self._state_database = ramble.workspace.state_database.StateDatabase(
+                os.path.join(self.root, self.state_database_file_name)
+            )
+        return self._state_database
+
+    def flush_state(self):
+        """Write pending experiment state to the state database, if enabled"""
+        if self._state_database is not None:
+            self._state_database.flush()
+
+    @property
+    def success_list(self):
+        """The success criteria list visible to the calling thread"""
+        return getattr(self._thread_state, "success_list", self._success_list)
+
+    @contextlib.contextmanager
+    def private_success_list(self):
+        """Give the calling thread a private copy of the success criteria list
+
+        Experiment phases re-populate and mark criteria in the success list,
+        so concurrently processed experiments each need their own copy.
+        """
+        self._thread_state.success_list = copy.deepcopy(self._success_list)
+        try:
+            yield
+        finally:
+            del self._thread_state.success_list
+
     def extract_success_criteria(self, scope, contents):
         """Extract success citeria, and inject it into the scoped list
 
@@ -1002,32 +1060,73 @@ class Workspace:
 
         return res
 
+    @property
+    def results(self):
+        """Analysis results of this workspace
+
+        Results added with insert_result are merged into the list of
+        experiment results the first time results are read afterwards.
+        """
+        with self._results_lock:
+            if self._results_before:
+                self._merge_inserted_results()
+            return self._results
+
+    @results.setter
+    def results(self, results):
+        self._results = results
+        # Names of all stored experiment results
+        self._result_names = set()
+        # Results waiting to be inserted, keyed on the result they precede
+        self._results_before = {}
+
+        if results:
+            for result in results["experiments"]:
+                self._result_names.add(result["name"])
+
     def append_result(self, result):
-        if not self.results:
-            self.results = self.default_results()
+        with self._results_lock:
+            if not self._results:
+                self.results = self.default_results()
 
-        self.results["experiments"].append(result)
+            self._results["experiments"].append(result)
+            self._result_names.add(result["name"])
 
     def insert_result(self, result, insert_before_exp):
         """Insert a result before a specified experiment"""
 
-        def search_exp_index(results_list, exp_to_search):
-            for i, exp in enumerate(results_list):
-                if exp["name"] == exp_to_search:
-                    return i
-            return None
+        with self._results_lock:
+            if not self._results:
+                self.results = self.default_results()
 
-        if not self.results:
-            self.results = self.default_results()
+            tty.debug(f"Attempting to insert result before experiment {insert_before_exp}")
+            if insert_before_exp in self._result_names:
+                self._results_before.setdefault(insert_before_exp, []).append(result)
+                self._result_names.add(result["name"])
+            else:
+                tty.debug(f"Could not find {insert_before_exp}, appending result to end instead.")
+                self.append_result(result)
 
-        insert_index = search_exp_index(self.results["experiments"], insert_before_exp)
+    def _merge_inserted_results(self):
+        """Merge pending inserted results into the list of experiment results
 
-        tty.debug(f"Attempting to insert result before experiment {insert_before_exp}")
-        if insert_index is not None:
-            self.results["experiments"].insert(insert_index, result)
-        else:
-            tty.debug(f"Could not find {insert_before_exp}, appending result to end instead.")
-            self.results["experiments"].append(result)
+        The list is rebuilt in a single pass. Each result is preceded by the
+        results inserted before it, in the order they were inserted.
+        """
+        results_before = self._results_before
+        self._results_before = {}
+
+        merged = []
+
+        def _add_result(result):
+            for inserted in results_before.pop(result["name"], []):
+                _add_result(inserted)
+            merged.append(result)
+
+        for result in self._results["experiments"]:
+            _add_result(result)
+
+        self._results["experiments"] = merged
 
     def simlink_result(self, filename_base, latest_base, file_extension):
         """
@@ -1062,77 +1161,32 @@ class Workspace:
         filename_base = "results" + inner_delim + dt
         latest_base = "results" + inner_delim + "latest"
 
-        if "text" in output_formats:
-
-            file_extension = ".txt"
-            out_file = os.path.join(self.root, filename_base + file_extension)
-
-            results_written.append(out_file)
-
-            with open(out_file, "w+") as f:
-                f.write(f"From Workspace: {self.name} (hash: {self.results['workspace_hash']})\n")
-                if "experiments" in self.results:
-                    for exp in self.results["experiments"]:
-                        f.write("Experiment %s figures of merit:\n" % exp["name"])
-                        f.write("  Status = %s\n" % exp["RAMBLE_STATUS"])
-                        if "TAGS" in exp:
-                            f.write(f'  Tags = {exp["TAGS"]}\n')
-
-                        if exp["RAMBLE_STATUS"] == "SUCCESS" or self.always_print_foms:
-                            if exp["N_REPEATS"] > 0:  # this is a base exp with summary of repeats
-                                for context in exp["CONTEXTS"]:
-                                    f.write(f'  {context["display_name"]} figures of merit:\n')
-
-                                    fom_summary = {}
-                                    for fom in context["foms"]:
-                                        name = fom["name"]
-                                        if name not in fom_summary.keys():
-                                            fom_summary[name] = []
-                                        stat_name = fom["origin_type"]
-                                        value = fom["value"]
-                                        units = fom["units"]
-
-                                        output = f"{stat_name} = {value} {units}\n"
-                                        fom_summary[name].append(output)
-
-                                    for fom_name, fom_val_list in fom_summary.items():
-                                        f.write(f"    {fom_name}:\n")
-                                        for fom_val in fom_val_list:
-                                            f.write(f"      {fom_val.strip()}\n")
-                            else:
-                                for context in exp["CONTEXTS"]:
-                                    f.write(f'  {context["display_name"]} figures of merit:\n')
-                                    for fom in context["foms"]:
-                                        name = fom["name"]
-                                        if fom["origin_type"] == "modifier":
-                                            delim = "::"
-                                            mod = fom["origin"]
-                                            name = f"{fom['origin_type']}{delim}{mod}{delim}{name}"
-
-                                        output = "{} = {} {}".format(
-                                            name, fom["value"], fom["units"]
-                                        )
-                                        f.write("    %s\n" % (output.strip()))
-                else:
-                    logger.msg("No results to write")
-
-            self.simlink_result(filename_base, latest_base, file_extension)
-
-        if "json" in output_formats:
-            file_extension = ".json"
-            out_file = os.path.join(self.root, filename_base + file_extension)
-            results_written.append(out_file)
-            with open(out_file, "w+") as f:
-                sjson.dump(self.results, f)
-            self.simlink_result(filename_base, latest_base, file_extension)
-
-        if "yaml" in output_formats:
-            file_extension = ".yaml"
-            out_file = os.path.join(self.root, filename_base + file_extension)
-            results_written.append(out_file)
-            with open(out_file, "w+") as f:
-                syaml.dump(self.results, stream=f)
-            self.simlink_result(filename_base, latest_base, file_extension)
+        writers = [
+            writer_cls
+            for writer_cls in ramble.util.results_writers.writers
+            if writer_cls.name in output_formats
+        ]
+
+        # Stream each experiment's results into all requested formats at once
+        results = self.results
+        with contextlib.ExitStack() as stack:
+            active_writers = []
+            for writer_cls in writers:
+                out_file = os.path.join(self.root, filename_base + writer_cls.extension)
+                results_written.append(out_file)
+                f = stack.enter_context(open(out_file, "w+", newline=""))
+                active_writers.append(writer_cls(f, always_print_foms=self.always_print_foms))
+
+            for writer in active_writers:
+                writer.begin(results)
+            for exp in results.get("experiments", []):
+                for writer in active_writers:
+                    writer.write_experiment(exp)
+            for writer in active_writers:
+                writer.end(results)
+
+        for writer_cls in writers:
+            self.simlink_result(filename_base, latest_base, writer_cls.extension)
 
         if not results_written:
             logger.die("Results were not written.")
@@ -1313,6 +1367,11 @@ class Workspace:
         """Path to the configuration file directory"""
         return os.path.join(self.root, workspace_config_path)
 
+    @property
+    def config_cache_dir(self):
+        """Path to the cache of parsed and validated configuration files"""
+        return os.path.join(self.root, workspace_config_cache_path)
+
     @property
     def auxiliary_software_dir(self):
         """Path to the auxiliary software files directory"""
@@ -1389,12 +1448,17 @@ class Workspace:
             if os.path.isdir(config_path):
                 # directories are treated as regular ConfigScopes
                 config_name = f"workspace:{self.name}:{os.path.basename(config_path)}"
-                scope = ramble.config.ConfigScope(config_name, config_path)
+                scope = ramble.config.ConfigScope(
+                    config_name, config_path, cache=self.config_cache
+                )
             elif os.path.exists(config_path):
                 # files are assumed to be SingleFileScopes
                 config_name = f"workspace:{self.name}:{config_path}"
                 scope = ramble.config.SingleFileScope(
-                    config_name, config_path, ramble.schema.merged.schema
+                    config_name,
+                    config_path,
+                    ramble.schema.merged.schema,
+                    cache=self.config_cache,
                 )
             else:
                 missing.append(config_path)
@@ -1423,6 +1487,7 @@ class Workspace:
             section["path"],
             ramble.schema.workspace.schema,
             [ramble.config.first_existing(section["raw_yaml"], ramble.schema.workspace.keys)],
+            cache=self.config_cache,
         )
 
     def config_scopes(self):
@@ -1583,10 +1648,19 @@ def _equiv_dict(first, second):
     return same_values and same_keys_with_same_overrides
 
 
-def _read_yaml(str_or_file, schema):
-    """Read YAML from a file for round-trip parsing."""
-    data = syaml.load_config(str_or_file)
+def _read_yaml(str_or_file, schema, cache=None):
+    """Read YAML from a file for round-trip parsing.
+
+    Files are read through the ConfigCache, if one is provided.
+    """
     filename = getattr(str_or_file, "name", None)
+    if cache is not None and filename:
+        data, default_data = cache.read(filename, schema)
+        # Empty files are not validated by the cache, so they are read below
+        if data:
+            return (data, default_data)
+
+    data = syaml.load_config(str_or_file)
     default_data = ramble.config.validate(data, schema, filename)
     return (data, default_data)
 
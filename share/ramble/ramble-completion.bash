@@ -383,7 +383,7 @@ _ramble_debug() {
     then
         RAMBLE_COMPREPLY="-h --help"
     else
-        RAMBLE_COMPREPLY="report"
+        RAMBLE_COMPREPLY="report startup-profile"
     fi
 }
 
@@ -391,6 +391,15 @@ _ramble_debug_report() {
     RAMBLE_COMPREPLY="-h --help"
 }
 
+_ramble_debug_startup_profile() {
+    if $list_options
+    then
+        RAMBLE_COMPREPLY="-h --help -n --num-modules"
+    else
+        RAMBLE_COMREPLY=""
+    fi
+}
+
 _ramble_deployment() {
     if $list_options
     then
@@ -532,7 +541,7 @@ _ramble_mods() {
 }
 
 _ramble_on() {
-    RAMBLE_COMPREPLY="-h --help --executor --enable-per-experiment-prints --suppress-run-header --where --exclude-where --filter-tags"
+    RAMBLE_COMPREPLY="-h --help --executor --enable-per-experiment-prints --suppress-run-header --bulk --submit-jobs --submit-rate --job-id-regex --local --local-cores --where --exclude-where --filter-tags"
 }
 
 _ramble_python() {
@@ -652,7 +661,7 @@ _ramble_workspace_activate() {
 }
 
 _ramble_workspace_archive() {
-    RAMBLE_COMPREPLY="-h --help --tar-archive -t --prefix -p --upload-url -u --include-secrets --phases --include-phase-dependencies --where --exclude-where"
+    RAMBLE_COMPREPLY="-h --help --tar-archive -t --prefix -p --upload-url -u --include-secrets --phases --include-phase-dependencies --where --exclude-where -j --jobs"
 }
 
 _ramble_workspace_deactivate() {
@@ -673,11 +682,11 @@ _ramble_workspace_concretize() {
 }
 
 _ramble_workspace_setup() {
-    RAMBLE_COMPREPLY="-h --help --dry-run --phases --include-phase-dependencies --where --exclude-where --filter-tags"
+    RAMBLE_COMPREPLY="-h --help --dry-run --phases --include-phase-dependencies --where --exclude-where --filter-tags -j --jobs"
 }
 
 _ramble_workspace_analyze() {
-    RAMBLE_COMPREPLY="-h --help -f --formats -u --upload --always-print-foms --dry-run -p --print-results --phases --include-phase-dependencies --where --exclude-where --filter-tags"
+    RAMBLE_COMPREPLY="-h --help -f --formats -u --upload --always-print-foms --no-cache --dry-run -p --print-results --phases --include-phase-dependencies --where --exclude-where --filter-tags -j --jobs"
 }
 
 _ramble_workspace_push_to_cache() {
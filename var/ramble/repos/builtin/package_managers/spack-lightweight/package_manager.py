@@ -40,6 +40,18 @@ class SpackLightweight(PackageManagerBase):
 
     _spec_prefix = "spack"
 
+    environment_phases = frozenset(
+        [
+            "software_create_env",
+            "software_install_requested_compilers",
+            "software_configure",
+        ]
+    )
+
+    # Compilers are installed into the workspace's shared configuration, so
+    # only concretizing environments can overlap.
+    parallel_environment_phases = frozenset(["software_configure"])
+
     def __init__(self, file_path):
         super().__init__(file_path)
 
@@ -527,6 +539,11 @@ class SpackRunner(object):
 
     compiler_find_args = ["compiler", "find"]
 
+    _package_name_regex = re.compile(r"[a-zA-Z0-9_][a-zA-Z0-9\-_]*")
+    _spec_name_regex = re.compile(
+        r"(?P<name>[a-zA-Z0-9_][a-zA-Z0-9\-_]*)(?:$|[@%+~^])"
+    )
+
     _allowed_config_files = [
         "compilers.yaml",
         "concretizer.yaml",
@@ -1126,9 +1143,72 @@ class SpackRunner(object):
         else:
             self._dry_run_print(self.installer, args)
 
+    def get_package_paths(self, package_specs):
+        """Return the names and installation directories of several packages
+
+        All packages installed in the active environment are listed with a
+        single spack command, and matched to the specs by package name. Specs
+        which cannot be matched to exactly one installed package are resolved
+        with get_package_path instead.
+
+        Args:
+            package_specs (list): Package specs to resolve
+
+        Returns:
+            (dict): Mapping of each spec to a (name, location) tuple
+        """
+        find_args = ["find", "--format", "{name} {prefix}"]
+
+        if self.dry_run:
+            self._dry_run_print(self.spack, find_args)
+            return {
+                spec: self._dry_run_package_path(spec)
+                for spec in package_specs
+            }
+
+        output = self._run_command(self.spack, find_args, return_output=True)
+
+        installed = {}
+        for line in output.splitlines():
+            name, _, prefix = line.strip().partition(" ")
+            if self._package_name_regex.fullmatch(name) and os.path.isabs(
+                prefix
+            ):
+                installed.setdefault(name, []).append(prefix)
+
+        package_paths = {}
+        for spec in package_specs:
+            spec_name = self._spec_package_name(spec)
+            if spec_name and len(installed.get(spec_name, [])) == 1:
+                package_paths[spec] = (spec_name, installed[spec_name][0])
+            else:
+                package_paths[spec] = self.get_package_path(spec)
+        return package_paths
+
+    def _spec_package_name(self, package_spec):
+        """Return the package name of a spec, or None if it has none"""
+        spec_parts = shlex.split(package_spec)
+        if not spec_parts:
+            return None
+        name_match = self._spec_name_regex.match(spec_parts[0])
+        if name_match:
+            return name_match.group("name")
+        return None
+
+    def _dry_run_package_path(self, package_spec):
+        """Return a placeholder name and location for a package in dry-runs"""
+        name_regex = re.compile(r"(?P<name>[a-zA-Z0-9\-_]+).*")
+        name = shlex.split(package_spec)[0]
+        name_match = name_regex.match(name)
+        if name_match:
+            name = name_match.group("name")
+        location = os.path.join(
+            "dry-run", "path", "to", shlex.split(package_spec)[0]
+        )
+        return (name, location)
+
     def get_package_path(self, package_spec):
         """Return the installation directory for a package"""
-        name_regex = re.compile(r"(?P<name>[a-zA-Z0-9\-_]+).*")
         loc_args = ["location", "-i"]
         loc_args.extend(shlex.split(package_spec))
 
@@ -1147,14 +1227,7 @@ class SpackRunner(object):
             self._dry_run_print(self.spack, name_args)
             self._dry_run_print(self.spack, loc_args)
 
-            name = shlex.split(package_spec)[0]
-            name_match = name_regex.match(name)
-            if name_match:
-                name = name_match.group("name")
-            location = os.path.join(
-                "dry-run", "path", "to", shlex.split(package_spec)[0]
-            )
-            return (name, location)
+            return self._dry_run_package_path(package_spec)
 
     def mirror_environment(self, mirror_path):
         """Create a spack mirror from the activated environment"""
@@ -577,3 +577,41 @@ def test_multiword_args(tmpdir, capsys):
             assert "package_path=-multiword -args" in captured.out
     except RunnerError as e:
         pytest.skip("%s" % e)
+
+
+def test_get_package_paths(tmpdir, monkeypatch):
+    try:
+        sr = SpackRunner()
+    except RunnerError as e:
+        pytest.skip("%s" % e)
+
+    commands = []
+    find_output = "\n".join(
+        [
+            "zlib /opt/spack/zlib-abc",
+            "hdf5 /opt/spack/hdf5-abc",
+            "hdf5 /opt/spack/hdf5-def",
+            "==> 3 installed packages",
+        ]
+    )
+
+    def _run_command(executable, args, return_output=False):
+        commands.append(args)
+        if args[0] == "find" and args[1] == "--format":
+            return find_output
+        return "hdf5\n" if args[0] == "find" else "/opt/spack/hdf5-def\n"
+
+    monkeypatch.setattr(sr, "_run_command", _run_command)
+
+    package_paths = sr.get_package_paths(["zlib@1.2 +pic", "hdf5@1.14"])
+
+    assert package_paths == {
+        "zlib@1.2 +pic": ("zlib", "/opt/spack/zlib-abc"),
+        "hdf5@1.14": ("hdf5", "/opt/spack/hdf5-def"),
+    }
+    # Only the ambiguous hdf5 spec is resolved on its own
+    assert commands == [
+        ["find", "--format", "{name} {prefix}"],
+        ["find", "--format={name}", "hdf5@1.14"],
+        ["location", "-i", "hdf5@1.14"],
+    ]
@@ -25,6 +25,14 @@ class Spack(SpackLightweight):
 
     name = "spack"
 
+    environment_phases = SpackLightweight.environment_phases | {
+        "software_install"
+    }
+
+    parallel_environment_phases = (
+        SpackLightweight.parallel_environment_phases | {"software_install"}
+    )
+
     archive_pattern("{env_path}/spack.yaml")
     archive_pattern("{env_path}/spack.lock")
 
@@ -87,7 +95,8 @@ class Spack(SpackLightweight):
 
         logger.msg("Defining Spack variables")
 
-        cache = workspace.pkg_path_cache[self.name]
+        env_path = self.app_inst.expander.env_path
+        cache = workspace.pkg_path_cache[self.name].setdefault(env_path, {})
         app_context = self.app_inst.expander.expand_var_name(
             self.keywords.env_name
         )
@@ -97,59 +106,47 @@ class Spack(SpackLightweight):
             app_context, self.app_inst.expander, self, require=require_env
         )
         if software_environment is not None:
-            # Try to resolve using local cache first
-            unresolved_specs = []
-            for (
-                pkg_spec
-            ) in software_environments.package_specs_for_environment(
-                software_environment
-            ):
-                if pkg_spec in cache:
-                    spack_pkg_name, pkg_path = cache.get(pkg_spec)
-                    if spack_pkg_name not in self.app_inst.variables:
-                        self.app_inst.define_variable(spack_pkg_name, pkg_path)
-                        self.app_inst.define_variable(
-                            f"{spack_pkg_name}_path", pkg_path
-                        )
-                    else:
-                        logger.msg(
-                            f"Variable {spack_pkg_name} defined. "
-                            + "Skipping extraction from spack"
-                        )
+            pkg_specs = list(
+                software_environments.package_specs_for_environment(
+                    software_environment
+                )
+            )
+
+            # Resolve all specs the local cache of this environment is
+            # missing with a single query
+            unresolved_specs = [
+                pkg_spec for pkg_spec in pkg_specs if pkg_spec not in cache
+            ]
+            if unresolved_specs:
+                try:
+                    logger.debug("Resolving package paths using Spack")
+                    self.runner.set_dry_run(workspace.dry_run)
+                    self.runner.set_env(env_path)
+
+                    self.runner.activate()
+
+                    cache.update(
+                        self.runner.get_package_paths(unresolved_specs)
+                    )
+                except RunnerError as e:
+                    logger.die(e)
+
+            for pkg_spec in pkg_specs:
+                spack_pkg_name, pkg_path = cache[pkg_spec]
+                if f"{spack_pkg_name}_path" not in self.app_inst.variables:
+                    self.app_inst.define_variable(spack_pkg_name, pkg_path)
+                    self.app_inst.define_variable(
+                        f"{spack_pkg_name}_path", pkg_path
+                    )
                 else:
-                    unresolved_specs.append(pkg_spec)
-            if not unresolved_specs:
-                return
-
-            try:
-                logger.debug("Resolving package paths using Spack")
-                self.runner.set_dry_run(workspace.dry_run)
-                self.runner.set_env(self.app_inst.expander.env_path)
-
-                self.runner.activate()
-
-                for pkg_spec in unresolved_specs:
-                    spack_pkg_name, pkg_path = self.runner.get_package_path(
-                        pkg_spec
+                    logger.msg(
+                        f"Variable {spack_pkg_name} defined. "
+                        + "Skipping extraction from spack"
+                    )
+                    logger.msg(
+                        f"Variable {spack_pkg_name}_path defined. "
+                        + "Skipping extraction from spack"
                     )
-                    if f"{spack_pkg_name}_path" not in self.app_inst.variables:
-                        self.app_inst.define_variable(spack_pkg_name, pkg_path)
-                        self.app_inst.define_variable(
-                            f"{spack_pkg_name}_path", pkg_path
-                        )
-                        cache[pkg_spec] = (spack_pkg_name, pkg_path)
-                    else:
-                        logger.msg(
-                            f"Variable {spack_pkg_name} defined. "
-                            + "Skipping extraction from spack"
-                        )
-                        logger.msg(
-                            f"Variable {spack_pkg_name}_path defined. "
-                            + "Skipping extraction from spack"
-                        )
-
-            except RunnerError as e:
-                logger.die(e)
 
     @deprecation.deprecated(
         deprecated_in="0.5.0",
@@ -170,7 +167,9 @@ class Spack(SpackLightweight):
     )
 
     def _warn_deprecated_variables(self, workspace, app_inst=None):
-        cache = workspace.pkg_path_cache[self.name]
+        cache = workspace.pkg_path_cache[self.name].get(
+            self.app_inst.expander.env_path, {}
+        )
 
         app_context = self.app_inst.expander.expand_var_name(
             self.keywords.env_name